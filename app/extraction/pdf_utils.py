@@ -1,19 +1,102 @@
 import os
-from pydantic import BaseModel
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+# Below this page count a process pool costs more than it saves
+PARALLEL_MIN_PAGES = 8
+
+def _pypdf_pages(filepath: str, start: int, stop: int) -> List[str]:
+    import pypdf
+    reader = pypdf.PdfReader(filepath)
+    return [reader.pages[i].extract_text() for i in range(start, stop)]
+
+def _pypdfium2_pages(filepath: str, start: int, stop: int) -> List[str]:
+    import pypdfium2
+    pdf = pypdfium2.PdfDocument(filepath)
+    try:
+        texts = []
+        for i in range(start, stop):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            texts.append(textpage.get_text_range().replace("\r\n", "\n"))
+            textpage.close()
+            page.close()
+        return texts
+    finally:
+        pdf.close()
+
+_BACKENDS = {
+    "pypdf": _pypdf_pages,
+    "pypdfium2": _pypdfium2_pages,
+}
 
 class PdfUtils:
     @staticmethod
-    def extract_text(filepath: str) -> str:
+    def available_backends() -> List[str]:
+        """Installed extraction backends, fastest first."""
+        backends = []
+        for name in ("pypdfium2", "pypdf"):
+            try:
+                __import__(name)
+                backends.append(name)
+            except ImportError:
+                pass
+        return backends
+
+    @staticmethod
+    def resolve_backend(backend: str) -> Optional[str]:
         """
-        Extracts text from a PDF file using pypdf.
+        The backend extract_text would use: "auto" picks the fastest one
+        installed (None if there is none). Unknown names raise ValueError.
         """
+        if backend == "auto":
+            available = PdfUtils.available_backends()
+            return available[0] if available else None
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unknown PDF backend: {backend} (choose from auto, {', '.join(_BACKENDS)})")
+        return backend
+
+    @staticmethod
+    def page_count(filepath: str, backend: str) -> int:
+        if backend == "pypdfium2":
+            import pypdfium2
+            pdf = pypdfium2.PdfDocument(filepath)
+            try:
+                return len(pdf)
+            finally:
+                pdf.close()
         import pypdf
-        text = ""
+        return len(pypdf.PdfReader(filepath).pages)
+
+    @staticmethod
+    def extract_text(filepath: str, backend: str = "auto", workers: Optional[int] = None) -> str:
+        """
+        Extracts text from a PDF file.
+
+        backend: "pypdfium2" (fast, optional), "pypdf", or "auto" for the
+        fastest one installed. Documents with PARALLEL_MIN_PAGES or more pages
+        are split into page ranges extracted in parallel processes.
+        """
+        backend = PdfUtils.resolve_backend(backend)
+        if backend is None:
+            print("No PDF backend installed (pip install pypdf)")
+            return ""
+        extract_pages = _BACKENDS[backend]
+
         try:
-            reader = pypdf.PdfReader(filepath)
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
+            n_pages = PdfUtils.page_count(filepath, backend)
+            workers = workers or os.cpu_count() or 1
+            if n_pages < PARALLEL_MIN_PAGES or workers < 2:
+                pages = extract_pages(filepath, 0, n_pages)
+            else:
+                # Each worker opens the file itself and handles a contiguous range
+                step = -(-n_pages // workers)
+                ranges = [(start, min(start + step, n_pages)) for start in range(0, n_pages, step)]
+                with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+                    chunks = pool.map(extract_pages, [filepath] * len(ranges),
+                                      [r[0] for r in ranges], [r[1] for r in ranges])
+                    pages = [text for chunk in chunks for text in chunk]
         except Exception as e:
             print(f"Error reading PDF {filepath}: {e}")
             return ""
-        return text
+        return "".join(text + "\n" for text in pages)
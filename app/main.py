@@ -1,11 +1,155 @@
 import sys
+import argparse
 from rich.console import Console
+from app import metrics
+from app.pipeline.config import RunConfig, load_config_file, parse_limit
+from app.pipeline import runner
 
 console = Console()
 
-def main():
+def _add_search_args(p: argparse.ArgumentParser):
+    p.add_argument("--query", help="Search keywords (default 'Software')")
+    p.add_argument("--location", help="Search location (default 'United States')")
+    p.add_argument("--time", dest="time_filter", help="Time filter: 1h, 12h, 24h, week, month (default 24h)")
+    p.add_argument("--level", dest="experience", action="append",
+                   help="Experience level, repeatable: internship, entry, associate, mid_senior, director")
+    p.add_argument("--limit", type=parse_limit, help="Number of jobs to scrape, or 'all' (default 10)")
+    p.add_argument("--concurrency", type=int, help="Detail pages fetched in parallel (default 1)")
+    p.add_argument("--rps", dest="requests_per_second", type=float,
+                   help="Max detail requests per second per host (default 0.5)")
+    p.add_argument("--source", dest="sources", action="append",
+                   help="Job board to search, repeatable: linkedin, jobright, simplify (default linkedin)")
+    p.add_argument("--fixed-rate", dest="adaptive_rate", action="store_const", const=False,
+                   help="Keep --rps fixed instead of adapting it to throttling")
+    p.add_argument("--http", dest="fetch_mode", action="store_const", const="http",
+                   help="Fetch public pages over plain HTTP; the browser is only used for auth walls")
+    p.add_argument("--skip-duplicates", dest="skip_duplicates", action="store_const", const=True,
+                   help="Drop re-listings of earlier postings instead of exporting them as reposts")
+    p.add_argument("--no-dedupe", dest="detect_duplicates", action="store_const", const=False,
+                   help="Disable near-duplicate (re-listing) detection")
+    p.add_argument("--headed", dest="headless", action="store_false", default=None,
+                   help="Show the browser window")
+    p.add_argument("--no-block", dest="block_resources", action="store_false", default=None,
+                   help="Load images, fonts, media, stylesheets and trackers too")
+    p.add_argument("--page-max-uses", type=int, help="Navigations before a pooled page is recycled (default 25)")
+    p.add_argument("--text-extractor", dest="text_extractor",
+                   help="Description HTML to text: lxml (default, keeps headings and bullets) or html2text")
+
+def _add_cache_args(p: argparse.ArgumentParser):
+    p.add_argument("--cache", dest="cache_path", help="SQLite cache path (default job_cache.db)")
+    p.add_argument("--no-cache", action="store_true", help="Disable the job and result cache")
+    p.add_argument("--cache-ttl", dest="cache_ttl_hours", type=float,
+                   help="Hours before a cached job is re-scraped (default 168)")
+
+def _add_resume_args(p: argparse.ArgumentParser):
+    p.add_argument("--resume", dest="resume_path", help="Resume file (PDF or text)")
+    p.add_argument("--years", dest="years_of_experience", type=float, help="Override years of experience")
+    p.add_argument("--visa", dest="visa_status", help="'Visa Required' or 'US Citizen'")
+    p.add_argument("--skills", type=lambda v: [s for s in v.split(",") if s.strip()],
+                   help="Comma separated skills, used when no resume file is given")
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.main", description="OA Trigger Engine")
+    parser.add_argument("--config", help="JSON or TOML file with RunConfig fields; flags override it")
+    parser.add_argument("--profile", action="store_true", help="Print and dump per-stage timing")
+    parser.add_argument("--profile-out", default="profile.json", help="Where --profile writes JSON (default profile.json)")
+    parser.add_argument("--metrics-out", dest="metrics_out",
+                        help="Write counters, timings and trace events to this file; .prom for Prometheus text "
+                             "(run writes <output>_metrics.json by default)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("scrape", help="Search and scrape job details to JSONL")
+    _add_search_args(p)
+    _add_cache_args(p)
+    p.add_argument("--out", default="jobs.jsonl", help="Output JSONL of jobs (default jobs.jsonl)")
+
+    p = sub.add_parser("normalize", help="Normalize scraped jobs")
+    _add_cache_args(p)
+    p.add_argument("--jobs", default="jobs.jsonl", help="Input JSONL of jobs (default jobs.jsonl)")
+    p.add_argument("--out", default="normalized.jsonl", help="Output JSONL (default normalized.jsonl)")
+    p.add_argument("--workers", dest="parse_workers", type=int,
+                   help="Parser processes for large batches (default one per CPU)")
+
+    p = sub.add_parser("score", help="Score normalized jobs against a resume")
+    _add_cache_args(p)
+    _add_resume_args(p)
+    p.add_argument("--normalized", default="normalized.jsonl", help="Input JSONL (default normalized.jsonl)")
+    p.add_argument("--out", default="scores.jsonl", help="Output JSONL (default scores.jsonl)")
+
+    p = sub.add_parser("export", help="Export jobs, normalization and scores to xlsx/csv")
+    p.add_argument("--jobs", default="jobs.jsonl", help="Input JSONL of jobs (default jobs.jsonl)")
+    p.add_argument("--normalized", default="normalized.jsonl", help="Input JSONL (default normalized.jsonl)")
+    p.add_argument("--scores", help="Input JSONL of scores (optional)")
+    p.add_argument("--output", default="jobs_export",
+                   help="Output file; .xlsx or .csv picks one format, a bare name writes both")
+
+    p = sub.add_parser("rank", help="Best stored jobs for a resume")
+    _add_resume_args(p)
+    p.add_argument("--store", dest="store_root", help="Parquet store directory (default job_store)")
+    p.add_argument("--top", type=int, default=50, help="Number of jobs to list (default 50)")
+    p.add_argument("--days", type=float, help="Only jobs posted in the last N days")
+
+    p = sub.add_parser("run", help="Search, scrape, normalize, score and export in one go")
+    _add_search_args(p)
+    _add_cache_args(p)
+    _add_resume_args(p)
+    p.add_argument("--scrape-only", dest="analyze", action="store_false", default=None,
+                   help="Skip OTPM scoring")
+    p.add_argument("--output", help="Base name for the xlsx/csv export (default jobs_<query>)")
+    p.add_argument("--store", dest="store_root", help="Parquet store directory (default job_store)")
+    p.add_argument("--no-store", action="store_true", help="Do not append results to the Parquet store")
+    p.add_argument("--journal", dest="journal_out",
+                   help="Checkpoint journal of the run (default <output>.journal.jsonl)")
+    p.add_argument("--resume-run", dest="resume_run", action="store_const", const=True,
+                   help="Continue the interrupted run in the journal, skipping jobs it finished")
+    return parser
+
+def build_config(args: argparse.Namespace) -> RunConfig:
+    """Config file values first, then any flag that was given explicitly."""
+    data = load_config_file(args.config) if args.config else {}
+    for field in RunConfig.model_fields:
+        value = getattr(args, field, None)
+        if value is not None:
+            data[field] = value
+    if getattr(args, "no_cache", False): data["cache_path"] = None
+    if getattr(args, "no_store", False): data["store_root"] = None
+    return RunConfig(**data)
+
+def main(argv=None):
     console.print("[bold green]OA Trigger Engine Initialized[/bold green]")
-    # TODO: Add argument parsing and subcommands here
+    args = build_parser().parse_args(argv)
+    config = build_config(args)
+    profiler = runner.Profiler()
+    metrics.reset()
+
+    try:
+        if args.command == "scrape":
+            runner.scrape(config, args.out, profiler)
+        elif args.command == "normalize":
+            runner.normalize(config, args.jobs, args.out, profiler)
+        elif args.command == "score":
+            runner.score(config, args.normalized, args.out, profiler=profiler)
+        elif args.command == "export":
+            runner.export(args.jobs, args.normalized, args.output, args.scores, profiler)
+        elif args.command == "rank":
+            runner.rank(config, args.top, args.days, profiler=profiler)
+        elif args.command == "run":
+            runner.run_pipeline(config, profiler=profiler)
+    finally:
+        # Also when the command fails: the metrics show how far it got
+        metrics_path = config.metrics_path() if args.command == "run" else config.metrics_out
+        if metrics_path:
+            metrics.dump(metrics_path)
+            console.print(f"Metrics written to {metrics_path}")
+
+    if args.profile:
+        report = profiler.report()
+        console.print(f"[bold]Profile[/bold] (total {report['total_seconds']:.2f}s)")
+        for name, seconds in report["stages"].items():
+            console.print(f"  {name:<16} {seconds:>8.3f}s")
+        profiler.dump(args.profile_out)
+        console.print(f"Profile written to {args.profile_out}")
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
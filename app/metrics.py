@@ -0,0 +1,249 @@
+"""
+Process-wide metrics and tracing: counters, gauges, histograms and timed spans.
+
+    from app import metrics
+
+    metrics.inc("jobs_scraped", source="linkedin")
+    with metrics.span("page.goto"):
+        page.goto(url)
+
+    @metrics.timed("parse")
+    def parse(...): ...
+
+span() records its duration in a histogram of the same name and, up to
+TRACE_LIMIT events, as a Chrome trace event (nested spans keep their parent,
+also across asyncio tasks). timed() is the cheap variant for hot functions:
+histogram only, no trace event. dump() writes a JSON summary whose
+traceEvents open in chrome://tracing or Perfetto, or Prometheus text for
+paths ending in .prom.
+"""
+import bisect
+import contextvars
+import functools
+import json
+import math
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+# Histogram upper bounds in seconds (Prometheus defaults, plus minutes for slow pages)
+BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+           1.0, 2.5, 5.0, 10.0, 30.0, 60.0, math.inf)
+TRACE_LIMIT = 20000
+
+Labels = Tuple[Tuple[str, str], ...]
+
+_parent: contextvars.ContextVar = contextvars.ContextVar("metrics_span", default=None)
+
+class Histogram:
+    """Count, sum, min/max and per-bucket counts (cumulated for Prometheus) of observations."""
+
+    __slots__ = ("count", "sum", "min", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.buckets = [0] * len(BUCKETS)
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        if value < self.min: self.min = value
+        if value > self.max: self.max = value
+        self.buckets[bisect.bisect_left(BUCKETS, value)] += 1
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "mean": round(self.sum / self.count, 9) if self.count else 0.0,
+            "min": round(self.min, 9) if self.count else 0.0,
+            "max": round(self.max, 9),
+        }
+
+class MetricsRegistry:
+    """
+    Thread-safe store behind the module-level helpers. One per process
+    (shared()); reset() at the start of a run.
+    """
+
+    _shared: Optional["MetricsRegistry"] = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    @classmethod
+    def shared(cls) -> "MetricsRegistry":
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def reset(self):
+        with self._lock:
+            self.counters: Dict[Tuple[str, Labels], float] = {}
+            self.gauges: Dict[Tuple[str, Labels], float] = {}
+            self.histograms: Dict[Tuple[str, Labels], Histogram] = {}
+            self.trace: List[dict] = []
+            self.trace_dropped = 0
+            self.started = time.time()
+            self._origin = time.perf_counter()
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def gauge(self, name: str, value: float, **labels):
+        """Sets a value that goes up and down (last write wins)."""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.gauges[key] = value
+
+    def observe(self, name: str, value: float, **labels):
+        self._observe((name, tuple(sorted(labels.items()))), value)
+
+    def _observe(self, key: Tuple[str, Labels], value: float):
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    @contextmanager
+    def span(self, name: str, **labels):
+        parent = _parent.get()
+        token = _parent.set(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            _parent.reset(token)
+            self.observe(name, seconds, **labels)
+            with self._lock:
+                if len(self.trace) < TRACE_LIMIT:
+                    args = dict(labels)
+                    if parent:
+                        args["parent"] = parent
+                    self.trace.append({
+                        "name": name, "ph": "X", "pid": 1,
+                        "tid": threading.current_thread().name,
+                        "ts": round((start - self._origin) * 1e6, 1),
+                        "dur": round(seconds * 1e6, 1),
+                        "args": args,
+                    })
+                else:
+                    self.trace_dropped += 1
+
+    def timed(self, name: str):
+        """Decorator recording each call's duration in histogram `name`."""
+        key = (name, ())
+        clock = time.perf_counter
+
+        def decorate(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                start = clock()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self._observe(key, clock() - start)
+            return wrapper
+        return decorate
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                "started": self.started,
+                "wall_seconds": round(time.perf_counter() - self._origin, 3),
+                "counters": {_key(name, labels): value for (name, labels), value in sorted(self.counters.items())},
+                "gauges": {_key(name, labels): value for (name, labels), value in sorted(self.gauges.items())},
+                "histograms": {
+                    _key(name, labels): h.summary() for (name, labels), h in sorted(self.histograms.items())
+                },
+                "trace_dropped": self.trace_dropped,
+                "traceEvents": list(self.trace),
+            }
+
+    def to_prometheus(self, prefix: str = "oa_") -> str:
+        lines = []
+        with self._lock:
+            typed = set()
+            for (name, labels), value in sorted(self.counters.items()):
+                metric = _metric_name(prefix + name) + "_total"
+                if metric not in typed:
+                    typed.add(metric)
+                    lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric}{_labels(labels)} {value:g}")
+            for (name, labels), value in sorted(self.gauges.items()):
+                metric = _metric_name(prefix + name)
+                if metric not in typed:
+                    typed.add(metric)
+                    lines.append(f"# TYPE {metric} gauge")
+                lines.append(f"{metric}{_labels(labels)} {value:g}")
+            for (name, labels), h in sorted(self.histograms.items()):
+                metric = _metric_name(prefix + name) + "_seconds"
+                if metric not in typed:
+                    typed.add(metric)
+                    lines.append(f"# TYPE {metric} histogram")
+                cumulative = 0
+                for bound, count in zip(BUCKETS, h.buckets):
+                    cumulative += count
+                    le = "+Inf" if bound == math.inf else f"{bound:g}"
+                    lines.append(f"{metric}_bucket{_labels(labels + (('le', le),))} {cumulative}")
+                lines.append(f"{metric}_sum{_labels(labels)} {h.sum:.6f}")
+                lines.append(f"{metric}_count{_labels(labels)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: str):
+        """Prometheus text for *.prom paths, JSON (with trace events) otherwise."""
+        with open(path, "w", encoding="utf-8") as f:
+            if path.endswith(".prom"):
+                f.write(self.to_prometheus())
+            else:
+                json.dump(self.summary(), f, indent=2)
+
+def _key(name: str, labels: Labels) -> str:
+    if not labels:
+        return name
+    return name + "{" + ",".join(f"{k}={v}" for k, v in labels) + "}"
+
+def _metric_name(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+def _labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in labels)
+    return "{" + ",".join(f'{_metric_name(k)}="{v}"' for (k, _), v in zip(labels, escaped)) + "}"
+
+# Module-level helpers over the shared registry
+
+def registry() -> MetricsRegistry:
+    return MetricsRegistry.shared()
+
+def inc(name: str, value: float = 1, **labels):
+    MetricsRegistry.shared().inc(name, value, **labels)
+
+def gauge(name: str, value: float, **labels):
+    MetricsRegistry.shared().gauge(name, value, **labels)
+
+def observe(name: str, value: float, **labels):
+    MetricsRegistry.shared().observe(name, value, **labels)
+
+def span(name: str, **labels):
+    return MetricsRegistry.shared().span(name, **labels)
+
+def timed(name: str):
+    return MetricsRegistry.shared().timed(name)
+
+def reset():
+    MetricsRegistry.shared().reset()
+
+def dump(path: str):
+    MetricsRegistry.shared().dump(path)
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl
 
 class Job(BaseModel):
     """
@@ -16,7 +16,7 @@ class Job(BaseModel):
     posted_date: Optional[datetime] = None
     
     # Raw platform-specific data for debugging/extension
-    raw_data: Dict[str, Any] = {}
+    raw_data: Dict[str, Any] = Field(default_factory=dict)
 
     model_config = {
         "extra": "ignore"
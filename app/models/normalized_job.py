@@ -1,5 +1,6 @@
 from typing import List, Optional
 from pydantic import BaseModel
+from app.normalization.skill_vocabulary import SkillVocabulary
 
 class NormalizedJob(BaseModel):
     """
@@ -14,3 +15,8 @@ class NormalizedJob(BaseModel):
     model_config = {
         "extra": "ignore"
     }
+
+    @property
+    def skill_mask(self) -> int:
+        """required_skills as a bitset over the shared SkillVocabulary."""
+        return SkillVocabulary.shared().mask(self.required_skills)
@@ -0,0 +1,99 @@
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+from app.models.job import Job
+from app.models.normalized_job import NormalizedJob
+from app.normalization.skill_vocabulary import SkillVocabulary
+
+@dataclass(slots=True)
+class JobRecord:
+    """
+    Compact, unvalidated counterpart of Job for bulk paths that hold many
+    jobs at once. Build it from a validated Job or from rows this tool wrote
+    itself (the JSONL intermediates); Job stays the model at the I/O boundary.
+    """
+    id: str
+    title: str
+    company: str
+    location: str
+    description: str
+    url: str
+    source: str
+    posted_date: Optional[datetime] = None
+    raw_data: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_model(cls, job: Job) -> "JobRecord":
+        return cls(job.id, job.title, job.company, job.location, job.description, job.url,
+                   sys.intern(job.source), job.posted_date, job.raw_data)
+
+    @classmethod
+    def from_dict(cls, row: dict) -> "JobRecord":
+        """From a Job.model_dump() (or its JSON) row."""
+        posted_date = row.get("posted_date")
+        if isinstance(posted_date, str):
+            posted_date = datetime.fromisoformat(posted_date)
+        return cls(row["id"], row["title"], row["company"], row["location"], row["description"],
+                   row["url"], sys.intern(row["source"]), posted_date, row.get("raw_data") or {})
+
+    def to_model(self) -> Job:
+        return Job.model_construct(
+            id=self.id, title=self.title, company=self.company, location=self.location,
+            description=self.description, url=self.url, source=self.source,
+            posted_date=self.posted_date, raw_data=self.raw_data
+        )
+
+@dataclass(slots=True)
+class NormalizedJobRecord:
+    """
+    Compact counterpart of NormalizedJob used between parsing, scoring and
+    export. Skills are stored once, as a bitset over the shared
+    SkillVocabulary; required_skills and keywords decode it on demand.
+    """
+    job_id: str
+    skill_mask: int = 0
+    experience_years: float = 0.0
+    visa_sponsorship: str = "UNCLEAR"
+
+    @classmethod
+    def from_skills(cls, job_id: str, skills: Iterable[str], experience_years: float = 0.0,
+                    visa_sponsorship: str = "UNCLEAR") -> "NormalizedJobRecord":
+        return cls(job_id, SkillVocabulary.shared().mask(skills), experience_years, visa_sponsorship)
+
+    @property
+    def required_skills(self) -> List[str]:
+        return SkillVocabulary.shared().names(self.skill_mask)
+
+    @property
+    def keywords(self) -> List[str]:
+        # Basic keyword set matches skills for now
+        return self.required_skills
+
+    @classmethod
+    def from_model(cls, n_job: NormalizedJob) -> "NormalizedJobRecord":
+        return cls.from_dict(n_job.model_dump())
+
+    @classmethod
+    def from_dict(cls, row: dict) -> "NormalizedJobRecord":
+        """From a NormalizedJob.model_dump() (or its JSON) row."""
+        return cls.from_skills(
+            row["job_id"],
+            row.get("required_skills") or (),
+            float(row.get("experience_years") or 0.0),
+            sys.intern(row.get("visa_sponsorship") or "UNCLEAR")
+        )
+
+    def to_dict(self) -> dict:
+        """Same shape as NormalizedJob.model_dump()."""
+        skills = self.required_skills
+        return {
+            "job_id": self.job_id,
+            "required_skills": skills,
+            "experience_years": self.experience_years,
+            "visa_sponsorship": self.visa_sponsorship,
+            "keywords": list(skills),
+        }
+
+    def to_model(self) -> NormalizedJob:
+        return NormalizedJob(**self.to_dict())
@@ -1,5 +1,6 @@
 from typing import List, Optional
 from pydantic import BaseModel
+from app.normalization.skill_vocabulary import SkillVocabulary
 
 class NormalizedResume(BaseModel):
     """
@@ -15,3 +16,8 @@ class NormalizedResume(BaseModel):
     model_config = {
         "extra": "ignore"
     }
+
+    @property
+    def skill_mask(self) -> int:
+        """skills as a bitset over the shared SkillVocabulary."""
+        return SkillVocabulary.shared().mask(self.skills)
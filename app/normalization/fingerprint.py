@@ -0,0 +1,52 @@
+import re
+from typing import FrozenSet, Optional
+
+_PUNCT = re.compile(r"[^\w\s]")
+_SPACES = re.compile(r"\s+")
+
+# Legal suffixes that vary between boards for the same employer
+_COMPANY_SUFFIXES = {"inc", "incorporated", "llc", "ltd", "limited", "corp", "corporation", "co", "company", "plc", "gmbh"}
+
+_TITLE_WORDS = {"sr": "senior", "jr": "junior", "snr": "senior", "eng": "engineer", "engr": "engineer", "swe": "software engineer"}
+
+# Country names that add nothing when every board is searched in the US
+_LOCATION_NOISE = {"united states", "united states of america", "usa", "us"}
+
+def _clean(value: str) -> str:
+    value = _PUNCT.sub(" ", (value or "").lower())
+    return _SPACES.sub(" ", value).strip()
+
+def normalize_company(company: str) -> str:
+    words = _clean(company).split()
+    while len(words) > 1 and words[-1] in _COMPANY_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+def normalize_title(title: str) -> str:
+    # Requisition ids and team tags in parentheses differ across boards
+    title = re.sub(r"\([^)]*\)", " ", title or "")
+    return " ".join(_TITLE_WORDS.get(w, w) for w in _clean(title).split())
+
+def normalize_location(location: str) -> Optional[str]:
+    """Normalized city/state, or None when the location says nothing specific."""
+    parts = [_clean(part) for part in (location or "").split(",")]
+    parts = [part for part in parts if part and part not in _LOCATION_NOISE]
+    if not parts or parts[0] in {"unknown location", "unknown"}:
+        return None
+    return " ".join(parts)
+
+def normalize_locations(location: str) -> Optional[FrozenSet[str]]:
+    """
+    Every specific place in a location listing several separated by ";"
+    (as structured boards join them), or None when none is specific.
+    """
+    places = frozenset(filter(None, (normalize_location(part) for part in (location or "").split(";"))))
+    return places or None
+
+def company_title_key(company: str, title: str) -> str:
+    return f"{normalize_company(company)}|{normalize_title(title)}"
+
+def job_fingerprint(company: str, title: str, location: str) -> str:
+    """Board-independent identity of a posting: company + title + location."""
+    places = normalize_locations(location)
+    return f"{company_title_key(company, title)}|{'; '.join(sorted(places)) if places else ''}"
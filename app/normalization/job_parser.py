@@ -1,12 +1,31 @@
-import re
-from typing import List, Set
+import hashlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+from app import metrics
 from app.models.job import Job
 from app.models.normalized_job import NormalizedJob
+from app.models.records import NormalizedJobRecord
+from app.normalization.signal_extractor import SignalExtractor
+from app.normalization.skill_matcher import SkillMatcher
+from app.normalization.skill_vocabulary import SkillVocabulary
+
+# Below this many jobs, starting worker processes costs more than it saves
+PARALLEL_MIN_JOBS = 2000
+# Upper bound on descriptions per task; smaller chunks balance load better
+MAX_CHUNK_SIZE = 1000
+
+# (required_skills, experience_years, visa_sponsorship)
+ParsedFields = Tuple[List[str], float, str]
 
 class JobParser:
     """
     Parses raw Job objects into NormalizedJob objects using rule-based extraction.
     """
+
+    # Bump whenever extraction logic changes so cached results are recomputed
+    VERSION = "2"
     
     # Common tech skills to check for (extensible list)
     COMMON_SKILLS = {
@@ -18,6 +37,17 @@ class JobParser:
         "ansible", "bash", "shell", "scripting", "sre", "ci/cd", "circleci",
         "prometheus", "grafana", "elasticsearch", "kafka"
     }
+
+    # Alternate spellings reported under their canonical skill name
+    SKILL_ALIASES = {
+        "k8s": "kubernetes",
+        "postgres": "postgresql",
+        "nodejs": "node.js",
+        "reactjs": "react",
+        "react.js": "react",
+        "amazon web services": "aws",
+        "google cloud": "gcp",
+    }
     
     VISA_KEYWORDS_POSITIVE = {
         "visa sponsorship", "sponsor", "h1b"
@@ -27,12 +57,29 @@ class JobParser:
         "us citizen", "green card", "permanent resident", "no sponsorship", "not sponsor"
     }
 
+    def __init__(self):
+        # Compiled once per vocabulary and shared by every parser instance
+        self.skill_matcher = SkillMatcher.for_vocabulary(self.COMMON_SKILLS, self.SKILL_ALIASES)
+        # Registered in sorted order, so these skills get the same ids every run
+        SkillVocabulary.shared().add_all(sorted(set(self.skill_matcher.terms.values())))
+        self.signals = SignalExtractor.for_keywords(self.VISA_KEYWORDS_POSITIVE, self.VISA_KEYWORDS_NEGATIVE)
+
+    def fingerprint(self) -> str:
+        """
+        Hash of everything that determines parse() output besides the job itself:
+        the parser version, skill vocabulary, aliases and visa keywords.
+        """
+        parts = [
+            self.VERSION,
+            ",".join(sorted(self.COMMON_SKILLS)),
+            ",".join(f"{k}={v}" for k, v in sorted(self.SKILL_ALIASES.items())),
+            ",".join(sorted(self.VISA_KEYWORDS_POSITIVE)),
+            ",".join(sorted(self.VISA_KEYWORDS_NEGATIVE)),
+        ]
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
     def parse(self, job: Job) -> NormalizedJob:
-        description_lower = job.description.lower()
-        
-        required_skills = self._extract_skills(description_lower)
-        experience_years = self._extract_experience(description_lower)
-        visa_sponsorship = self._extract_visa_status(description_lower)
+        required_skills, experience_years, visa_sponsorship = self.parse_fields(job.description)
         
         return NormalizedJob(
             job_id=job.id,
@@ -42,58 +89,65 @@ class JobParser:
             keywords=list(required_skills) # Basic keyword set matches skills for now
         )
 
+    @metrics.timed("parse")
+    def parse_fields(self, description: str) -> ParsedFields:
+        """Everything parse() extracts from a description, as plain values."""
+        description_lower = description.lower()
+        signals = self.signals.extract(description_lower)
+        return self._extract_skills(description_lower), signals.experience_years, signals.visa_sponsorship
+
+    def parse_record(self, job: Job) -> NormalizedJobRecord:
+        """parse() into the compact record used on the pipeline's hot path."""
+        required_skills, experience_years, visa_sponsorship = self.parse_fields(job.description)
+        return NormalizedJobRecord.from_skills(job.id, required_skills, experience_years, visa_sponsorship)
+
+    def parse_many(self, jobs: Sequence[Job], workers: Optional[int] = None,
+                   chunk_size: Optional[int] = None) -> List[NormalizedJobRecord]:
+        """
+        parse_record() over many jobs (or JobRecords), in input order.
+
+        With `workers` > 1 (default: one per CPU) and at least PARALLEL_MIN_JOBS
+        jobs, descriptions are parsed in a process pool. Only description
+        strings go out and plain tuples come back, so neither side pickles
+        models; each worker builds its parser (and compiled matchers) once.
+        """
+        workers = workers or os.cpu_count() or 1
+        metrics.inc("jobs_parsed", len(jobs))
+        if workers < 2 or len(jobs) < PARALLEL_MIN_JOBS:
+            with metrics.span("parse_many", workers=1):
+                return [self.parse_record(job) for job in jobs]
+
+        chunk_size = chunk_size or max(1, min(MAX_CHUNK_SIZE, -(-len(jobs) // (workers * 4))))
+        descriptions = [job.description for job in jobs]
+        chunks = [descriptions[i:i + chunk_size] for i in range(0, len(descriptions), chunk_size)]
+        with metrics.span("parse_many", workers=workers), \
+                ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(type(self),)) as pool:
+            fields = [item for chunk in pool.map(_parse_chunk, chunks) for item in chunk]
+
+        # Unpickled strings are fresh copies; interning shares them across records again
+        return [
+            NormalizedJobRecord.from_skills(job.id, skills, years, sys.intern(visa))
+            for job, (skills, years, visa) in zip(jobs, fields)
+        ]
+
     def _extract_skills(self, text: str) -> List[str]:
-        found_skills = []
-        for skill in self.COMMON_SKILLS:
-            # Special handling for skills with punctuation
-            if skill in {'c++', 'node.js', 'c#', '.net', 'ci/cd'}:
-                 # Simple substring check often safer for these chars, 
-                 # but let's try to be smart about boundaries if possible.
-                 # For now, literal check is robust enough for these specific terms.
-                 if skill in text:
-                     found_skills.append(skill)
-            else:
-                # Standard word boundary regex for "clean" words
-                # \bpython\b
-                pattern = re.compile(r'\b' + re.escape(skill) + r'\b')
-                if pattern.search(text):
-                    found_skills.append(skill)
-        return sorted(found_skills)
+        # Single scan over the text, regardless of vocabulary size
+        return self.skill_matcher.find(text)
 
     def _extract_experience(self, text: str) -> float:
-        # Patterns: "5+ years", "3-5 years", "2 to 3 years"
-        patterns = [
-            r'(\d+)\s*\+\s*years',
-            r'(\d+)\s*-\s*\d+\s*years',
-            r'(\d+)\s*to\s*\d+\s*years',
-            r'(\d+)\s*years'
-        ]
-        
-        for p in patterns:
-            matches = re.findall(p, text)
-            if matches:
-                 # Heuristic: The first mentioned year count is often the requirement.
-                 # e.g. "Requirements: 3+ years experience"
-                 for m in matches:
-                    try:
-                        y = float(m)
-                        # Filter out unlikely numbers (e.g. "2024 years")
-                        if 0 < y < 20: 
-                            return y
-                    except:
-                        pass
-                        
-        return 0.0
+        # "5+ years", "minimum of two years", "3–5 years", "4 years of experience"
+        return self.signals.extract(text).experience_years
 
     def _extract_visa_status(self, text: str) -> str:
-        # Check negative signals first (US Citizen only)
-        for keyword in self.VISA_KEYWORDS_NEGATIVE:
-            if keyword in text:
-                return "UNLIKELY"
-                
-        # Check positive signals
-        for keyword in self.VISA_KEYWORDS_POSITIVE:
-            if keyword in text:
-                return "LIKELY"
-                
-        return "UNCLEAR"
+        return self.signals.extract(text).visa_sponsorship
+
+# --- Process pool workers ---
+
+_worker_parser: Optional[JobParser] = None
+
+def _init_worker(parser_cls):
+    global _worker_parser
+    _worker_parser = parser_cls()
+
+def _parse_chunk(descriptions: List[str]) -> List[ParsedFields]:
+    return [_worker_parser.parse_fields(description) for description in descriptions]
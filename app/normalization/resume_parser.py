@@ -1,37 +1,80 @@
 import re
 import os
+import json
+import hashlib
+from typing import Optional
 from app.models.resume import NormalizedResume
 from app.normalization.job_parser import JobParser
 from app.extraction.pdf_utils import PdfUtils
+from app.storage.resume_cache import ResumeCache
 
 class ResumeParser:
     """
     Parses raw Resume text/PDF into NormalizedResume objects.
     """
-    def __init__(self):
+    def __init__(self, cache: Optional[ResumeCache] = None, pdf_backend: str = "auto"):
         self._parser_tool = JobParser()
+        self._skill_matcher = self._parser_tool.skill_matcher
+        self.cache = cache
+        self.pdf_backend = pdf_backend
 
     def parse_file(self, filepath: str, user_inputs: dict = None) -> NormalizedResume:
         """
         Parses a file (PDF or Text).
+        With a cache, extracted text and parse results are reused for files
+        whose content hash has been seen before.
         """
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"Resume file not found: {filepath}")
             
         text = ""
         if filepath.lower().endswith(".pdf"):
-            text = PdfUtils.extract_text(filepath)
+            text = self._extract_pdf_text(filepath)
         else:
             with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
                 text = f.read()
                 
         return self.parse_text(text, user_inputs)
 
+    def _extract_pdf_text(self, filepath: str) -> str:
+        if not self.cache:
+            return PdfUtils.extract_text(filepath, backend=self.pdf_backend)
+
+        # Keyed on the backend that actually runs, so "auto" text is not
+        # served after the installed backends change
+        backend = PdfUtils.resolve_backend(self.pdf_backend)
+        if backend is None:
+            return PdfUtils.extract_text(filepath, backend=self.pdf_backend)
+
+        with open(filepath, "rb") as f:
+            file_hash = hashlib.sha256(f.read()).hexdigest()
+        text = self.cache.get_text(file_hash, backend)
+        if text is None:
+            text = PdfUtils.extract_text(filepath, backend=backend)
+            if text:
+                self.cache.put_text(file_hash, backend, text)
+        return text
+
     def parse_text(self, text: str, user_inputs: dict = None) -> NormalizedResume:
+        if not self.cache:
+            return self._parse_text(text, user_inputs)
+
+        resume_key = hashlib.sha256("\0".join([
+            self._parser_tool.fingerprint(),
+            json.dumps(user_inputs or {}, sort_keys=True, default=str),
+            text
+        ]).encode("utf-8")).hexdigest()
+        resume = self.cache.get_resume(resume_key)
+        if resume is None:
+            resume = self._parse_text(text, user_inputs)
+            self.cache.put_resume(resume_key, resume)
+        return resume
+
+    def _parse_text(self, text: str, user_inputs: dict = None) -> NormalizedResume:
         description_lower = text.lower()
         
         # 1. Extract Skills (Global search)
-        skills = self._parser_tool._extract_skills(description_lower)
+        skills = self._skill_matcher.find(description_lower)
         
         # 2. Extract Experience Years (Global search)
         experience_years = self._parser_tool._extract_experience(description_lower)
@@ -0,0 +1,107 @@
+import re
+from typing import Dict, Iterable, NamedTuple, Tuple
+
+NUMBER_WORDS = {
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7,
+    "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12, "fifteen": 15,
+}
+
+# Experience forms, strongest first. A description that states a floor
+# ("5+ years", "minimum of two years") is answered by it even if a range or
+# a bare "N years" appears earlier in the text.
+_MINIMUM, _RANGE, _CONTEXT, _BARE = range(4)
+_PRIORITY = {"floor": _MINIMUM, "plus": _MINIMUM, "range": _RANGE, "context": _CONTEXT, "n": _BARE}
+
+class Signals(NamedTuple):
+    experience_years: float
+    visa_sponsorship: str
+
+class SignalExtractor:
+    """
+    Experience and visa signals from one scan of a lowercased description.
+
+    A single compiled alternation covers every experience form and visa
+    keyword; each match reports which branch fired through its named group.
+    Experience forms keep the legacy priority (stated minimum, then range,
+    then a bare "N years"), with "N years of experience" context ranked
+    above a bare count so "founded 15 years ago" loses to the requirement.
+    The first in-range value of the strongest form wins. Every form and
+    keyword must start a word ("thus citizens" is not "us citizen"), which
+    lets the engine skip mid-word positions. Any negative visa keyword beats
+    any positive one, and the scan stops early once neither answer can change.
+    """
+
+    _cache: Dict[Tuple[frozenset, frozenset], "SignalExtractor"] = {}
+
+    def __init__(self, positive: Iterable[str], negative: Iterable[str]):
+        self._pattern = self._compile(positive, negative)
+
+    @classmethod
+    def for_keywords(cls, positive: Iterable[str], negative: Iterable[str]) -> "SignalExtractor":
+        """Returns a shared extractor for the given visa keywords, compiling it on first use."""
+        key = (frozenset(positive), frozenset(negative))
+        extractor = cls._cache.get(key)
+        if extractor is None:
+            extractor = cls(*key)
+            cls._cache[key] = extractor
+        return extractor
+
+    def extract(self, text: str) -> Signals:
+        best: list = [None] * 4
+        negative = positive = False
+        for match in self._pattern.finditer(text):
+            kind = match.lastgroup
+            if kind == "negative":
+                negative = True
+            elif kind == "positive":
+                positive = True
+            else:
+                priority = _PRIORITY[kind]
+                if best[priority] is None:
+                    years = self._years(match.group("floor" if kind == "floor" else "n"))
+                    # A range starting at zero is an explicit entry-level answer
+                    if 0 < years < 20 or (years == 0 and priority == _RANGE):
+                        best[priority] = years
+            if negative and best[_MINIMUM] is not None:
+                break
+
+        experience = next((years for years in best if years is not None), 0.0)
+        visa = "UNLIKELY" if negative else "LIKELY" if positive else "UNCLEAR"
+        return Signals(experience, visa)
+
+    @staticmethod
+    def _years(value: str) -> float:
+        words = NUMBER_WORDS.get(value)
+        return float(words if words is not None else value)
+
+    # --- Compilation ---
+
+    @staticmethod
+    def _compile(positive: Iterable[str], negative: Iterable[str]) -> "re.Pattern":
+        words = "|".join(sorted(NUMBER_WORDS, key=len, reverse=True))
+        # "two (2)" spells the number out and repeats it in digits
+        count = rf"(?:\d{{1,2}}(?:\.\d+)?|{words})"
+        echo = r"(?:\s*\(\d{1,2}\+?\))?"
+        years = r"\s*(?:years?|yrs?)\b"
+        dash = r"\s*(?:-|–|—|to)\s*"
+        # The stated count is group "n"; the group that closes last names the
+        # form (a bare count closes nothing after "n").
+        branches = [
+            rf"(?:at\s+least|minimum(?:\s+of)?|no\s+less\s+than)\s+(?P<floor>{count}){echo}\s*\+?{years}",
+            rf"(?P<n>{count}){echo}(?:"
+            rf"(?P<plus>\s*\+|\s+or\s+more){years}"
+            rf"|(?P<range>{dash}{count}){echo}\s*\+?{years}"
+            rf"|{years}(?P<context>['’]?\s+(?:of\s+)?(?:[a-z/-]+\s+){{0,2}}?experience)?)",
+        ]
+
+        def keywords(terms: Iterable[str]) -> str:
+            # Longest first, so "no sponsorship" is not read as "sponsor"
+            return "|".join(re.escape(t) for t in sorted(set(terms), key=len, reverse=True))
+
+        if negative:
+            branches.append(f"(?P<negative>{keywords(negative)})")
+        if positive:
+            branches.append(f"(?P<positive>{keywords(positive)})")
+        # Every branch starts at the start of a word, so the guard lets the
+        # engine skip all other positions cheaply, as in SkillMatcher.
+        return re.compile(r"(?<!\w)(?=\w)(?:" + "|".join(branches) + ")")
@@ -0,0 +1,103 @@
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+class SkillMatcher:
+    """
+    Single-pass skill matcher compiled once per vocabulary.
+
+    All terms (canonical skills and their aliases) are folded into one
+    trie-shaped regex, so a description is scanned once no matter how large
+    the vocabulary grows. Matches are reported under their canonical name.
+
+    Word boundaries follow the legacy per-skill behaviour: a term edge that is
+    a word character (the "p" in "python", the "c" in "c++") must not touch
+    another word character, while a punctuation edge ("c++", ".net") needs no
+    boundary. Matching is leftmost-longest, so "golang" wins over "go".
+    """
+
+    _cache: Dict[Tuple[frozenset, frozenset], "SkillMatcher"] = {}
+
+    def __init__(self, skills: Iterable[str], aliases: Optional[Dict[str, str]] = None):
+        # term -> canonical skill
+        self.terms: Dict[str, str] = {}
+        for skill in skills:
+            skill = skill.strip().lower()
+            if skill:
+                self.terms[skill] = skill
+        for alias, canonical in (aliases or {}).items():
+            alias = alias.strip().lower()
+            if alias:
+                self.terms[alias] = canonical.strip().lower()
+
+        self._pattern = self._compile(self.terms) if self.terms else None
+
+    @classmethod
+    def for_vocabulary(cls, skills: Iterable[str], aliases: Optional[Dict[str, str]] = None) -> "SkillMatcher":
+        """
+        Returns a shared matcher for the given vocabulary, compiling it on first use.
+        """
+        key = (frozenset(skills), frozenset((aliases or {}).items()))
+        matcher = cls._cache.get(key)
+        if matcher is None:
+            matcher = cls(key[0], dict(key[1]))
+            cls._cache[key] = matcher
+        return matcher
+
+    def find(self, text: str) -> List[str]:
+        """
+        Returns the sorted, de-duplicated canonical skills found in `text`.
+        Expects lowercased text, like the rest of the normalization layer.
+        """
+        if self._pattern is None:
+            return []
+        terms = self.terms
+        return sorted({terms[m] for m in self._pattern.findall(text)})
+
+    # --- Compilation ---
+
+    @classmethod
+    def _compile(cls, terms: Iterable[str]) -> "re.Pattern":
+        trie: dict = {}
+        for term in terms:
+            node = trie
+            for ch in term:
+                node = node.setdefault(ch, {})
+            node[""] = True
+
+        branches = []
+        for ch, child in sorted(trie.items()):
+            left = r"(?<!\w)" if cls._is_word_char(ch) else ""
+            branches.append(left + re.escape(ch) + cls._node_regex(child, cls._is_word_char(ch)))
+        # Every term starts either at the start of a word or on punctuation, so
+        # the cheap guard in front lets the engine skip all other positions.
+        # A single capture group keeps findall() returning the matched term.
+        guard = r"(?:(?<!\w)(?=\w)|(?=[^\w\s]))"
+        return re.compile(guard + "(" + "|".join(branches) + ")")
+
+    @staticmethod
+    def _is_word_char(ch: str) -> bool:
+        return ch.isalnum() or ch == "_"
+
+    @classmethod
+    def _node_regex(cls, node: dict, word_edge: bool) -> str:
+        """
+        Regex for everything below a trie node. `word_edge` tells whether the
+        character leading into this node is a word character, in which case a
+        term ending here needs a trailing word boundary.
+        """
+        branches = [re.escape(ch) + cls._node_regex(child, cls._is_word_char(ch))
+                    for ch, child in sorted(node.items()) if ch]
+        if "" in node:
+            # The end-of-term alternative goes last so longer terms are tried
+            # first; the engine backtracks to it if they fail.
+            if not branches:
+                return r"(?!\w)" if word_edge else ""
+            if word_edge:
+                branches.append(r"(?!\w)")
+            else:
+                body = branches[0] if len(branches) == 1 else "|".join(branches)
+                return f"(?:{body})?"
+
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
@@ -0,0 +1,94 @@
+import sys
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence
+import numpy as np
+
+class SkillVocabulary:
+    """
+    Interned skill names with integer ids, so a set of skills is one int
+    bitset (bit i set = skill i present).
+
+    Overlap and coverage are `&` plus int.bit_count(); many sets at once
+    become a (n, words) uint64 array for numpy popcounts and column sums.
+    Ids are assigned in registration order and never change within a
+    process: JobParser registers its sorted vocabulary first, so those ids
+    are the same in every run, and skills seen later (resume skills, stored
+    results from an older vocabulary) are appended. Bitsets are an
+    in-memory representation only; anything persisted keeps skill names.
+    """
+
+    _shared: Optional["SkillVocabulary"] = None
+
+    def __init__(self, skills: Iterable[str] = ()):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._lock = threading.Lock()
+        self.add_all(skills)
+
+    @classmethod
+    def shared(cls) -> "SkillVocabulary":
+        """The process-wide vocabulary used by the models, parser and engine."""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def id(self, skill: str) -> int:
+        """The skill's id, registering it if it is new."""
+        skill_id = self._ids.get(skill)
+        if skill_id is None:
+            with self._lock:
+                skill_id = self._ids.get(skill)
+                if skill_id is None:
+                    skill_id = len(self._names)
+                    self._names.append(sys.intern(skill))
+                    self._ids[self._names[-1]] = skill_id
+        return skill_id
+
+    def add_all(self, skills: Iterable[str]):
+        for skill in skills:
+            self.id(skill)
+
+    def name(self, skill_id: int) -> str:
+        return self._names[skill_id]
+
+    def mask(self, skills: Iterable[str]) -> int:
+        ids = self._ids
+        mask = 0
+        for skill in skills:
+            skill_id = ids.get(skill)
+            mask |= 1 << (self.id(skill) if skill_id is None else skill_id)
+        return mask
+
+    def names(self, mask: int) -> List[str]:
+        """The skills in a bitset, sorted by name like SkillMatcher.find()."""
+        return sorted(self._names[i] for i in self.bit_ids(mask))
+
+    @staticmethod
+    def bit_ids(mask: int) -> List[int]:
+        ids = []
+        while mask:
+            low = mask & -mask
+            ids.append(low.bit_length() - 1)
+            mask ^= low
+        return ids
+
+    def words(self) -> int:
+        """uint64 words per bitset in to_array() for the current vocabulary."""
+        return max(1, -(-len(self._names) // 64))
+
+    def to_array(self, masks: Sequence[int], words: Optional[int] = None) -> np.ndarray:
+        """Bitsets as a (len(masks), words) little-endian uint64 array."""
+        words = words or self.words()
+        raw = b"".join(mask.to_bytes(words * 8, "little") for mask in masks)
+        return np.frombuffer(raw, dtype="<u8").reshape(len(masks), words)
+
+    def counts(self, masks: Sequence[int]) -> np.ndarray:
+        """How many bitsets contain each skill, indexed by skill id."""
+        words = self.words()
+        if not masks:
+            return np.zeros(words * 64, dtype=np.int64)
+        bits = np.unpackbits(self.to_array(masks, words).view(np.uint8), axis=1, bitorder="little")
+        return bits.sum(axis=0, dtype=np.int64)
@@ -1,62 +1,166 @@
+from typing import Dict, Sequence, Tuple
+import numpy as np
+from app import metrics
 from app.models.normalized_job import NormalizedJob
 from app.models.resume import NormalizedResume
+from app.normalization.skill_vocabulary import SkillVocabulary
 
 class OTPMEngine:
     """
     OA Trigger Probability Metric (OTPM) Engine.
     Calculates P(OA | Resume, Job).
     """
+
+    # Bump whenever scoring rules change so cached scores are recomputed
+    VERSION = "1"
+
+    def __init__(self):
+        # A run scores many jobs against the same few resumes
+        self._resume_masks: Dict[Tuple[str, ...], int] = {}
+
+    def _resume_mask(self, resume: NormalizedResume) -> int:
+        key = tuple(resume.skills)
+        mask = self._resume_masks.get(key)
+        if mask is None:
+            if len(self._resume_masks) > 1024:
+                self._resume_masks.clear()
+            mask = self._resume_masks[key] = resume.skill_mask
+        return mask
     
+    # Skill coverage adjustments, best first: >= 80%, >= 50%, 20-50%, < 20% of the job's skills
+    SKILL_TIERS = (0.3, 0.1, 0.0, -0.2)
+
+    # Not timed per call: the wrapper would cost more than the scoring itself.
+    # Bulk scoring goes through score_batch, which has a span.
     def calculate_probability(self, job: NormalizedJob, resume: NormalizedResume) -> float:
         """
         Returns a probability between 0.0 and 1.0.
         """
-        score = 0.5  # Base probability (neutral)
-
-        # 1. Experience Check (Critical)
-        experience_gap = resume.years_of_experience - job.experience_years
-        if experience_gap >= 0:
-            score += 0.2  # Meets or exceeds
-        elif experience_gap >= -1:
-            score -= 0.1  # Slightly under (within 1 year)
-        else:
-            score -= 0.3  # Significantly under
-
-        # 2. Skill Match (Keyword Density)
-        # Calculate overlap
-        job_skills = set(job.required_skills)
-        resume_skills = set(resume.skills)
+        # Skill Match (Keyword Density)
+        # Calculate overlap as popcounts over the shared skill bitsets
+        job_skills = job.skill_mask
         
         if not job_skills:
             # If job has no parsed skills, assume neutral or slight positive if title matches
             overlap_ratio = 1.0 
         else:
-            intersection = job_skills.intersection(resume_skills)
-            overlap_ratio = len(intersection) / len(job_skills)
+            intersection = job_skills & self._resume_mask(resume)
+            overlap_ratio = intersection.bit_count() / job_skills.bit_count()
         
         # Add score based on coverage
         if overlap_ratio >= 0.8:
-            score += 0.3
+            skill_score = self.SKILL_TIERS[0]
         elif overlap_ratio >= 0.5:
-            score += 0.1
+            skill_score = self.SKILL_TIERS[1]
         elif overlap_ratio < 0.2:
-            score -= 0.2
+            skill_score = self.SKILL_TIERS[3]
+        else:
+            skill_score = self.SKILL_TIERS[2]
+
+        return self._score(job.experience_years, job.visa_sponsorship, resume, skill_score)
+
+    def _score(self, experience_years: float, visa_sponsorship: str,
+               resume: NormalizedResume, skill_score: float) -> float:
+        """
+        The OTPM arithmetic once skill coverage is reduced to its SKILL_TIERS
+        adjustment. Components are added in a fixed order so score_batch and
+        tier_scores reproduce these floats exactly.
+        """
+        score = 0.5  # Base probability (neutral)
+
+        # 1. Experience Check (Critical)
+        experience_gap = resume.years_of_experience - experience_years
+        if experience_gap >= 0:
+            score += 0.2  # Meets or exceeds
+        elif experience_gap >= -1:
+            score -= 0.1  # Slightly under (within 1 year)
+        else:
+            score -= 0.3  # Significantly under
+
+        # 2. Skill Match
+        score += skill_score
 
         # 3. Visa "Kill Switch"
         # If Job says "US Citizen Only" (UNLIKELY sponsorship) and Resume says "Visa Required"
-        if job.visa_sponsorship == "UNLIKELY" and resume.visa_status == "Visa Required":
+        if visa_sponsorship == "UNLIKELY" and resume.visa_status == "Visa Required":
             score -= 0.5
-        elif job.visa_sponsorship == "LIKELY" and resume.visa_status == "Visa Required":
+        elif visa_sponsorship == "LIKELY" and resume.visa_status == "Visa Required":
             score += 0.1
             
         # 4. Entry Level Friendly
         # If job asks for 0 experience, boost score for anyone
-        if job.experience_years == 0:
+        if experience_years == 0:
              score += 0.1
 
         # Clamp score 0..1
         return max(0.0, min(1.0, score))
 
+    def score_batch(self, jobs: Sequence[NormalizedJob], resumes: Sequence[NormalizedResume]) -> np.ndarray:
+        """
+        Vectorized calculate_probability over every (job, resume) pair.
+        Returns a float64 array of shape (len(jobs), len(resumes)) whose values
+        are identical to the scalar path: the same components are added in the
+        same order, with 0.0 standing in for the branches that do not fire.
+        """
+        n_jobs, n_resumes = len(jobs), len(resumes)
+        if not n_jobs or not n_resumes:
+            return np.zeros((n_jobs, n_resumes))
+        with metrics.span("score_batch"):
+            return self._score_batch(jobs, resumes, n_jobs, n_resumes)
+
+    def _score_batch(self, jobs, resumes, n_jobs: int, n_resumes: int) -> np.ndarray:
+
+        # Skill sets as uint64 bitset rows; overlap is a popcount of the AND
+        vocabulary = SkillVocabulary.shared()
+        job_masks = [job.skill_mask for job in jobs]
+        resume_masks = [self._resume_mask(resume) for resume in resumes]
+        words = vocabulary.words()
+        job_bits = vocabulary.to_array(job_masks, words)
+        resume_bits = vocabulary.to_array(resume_masks, words)
+
+        overlap = np.empty((n_jobs, n_resumes), dtype=np.float64)
+        for r in range(n_resumes):
+            overlap[:, r] = np.bitwise_count(job_bits & resume_bits[r]).sum(axis=1)
+        job_skill_counts = np.bitwise_count(job_bits).sum(axis=1).astype(np.float64)[:, None]
+
+        job_years = np.array([job.experience_years for job in jobs], dtype=np.float64)[:, None]
+        resume_years = np.array([resume.years_of_experience for resume in resumes], dtype=np.float64)[None, :]
+        job_visa = np.array([job.visa_sponsorship for job in jobs], dtype=object)[:, None]
+        needs_visa = np.array([resume.visa_status == "Visa Required" for resume in resumes])[None, :]
+
+        score = np.full((n_jobs, n_resumes), 0.5)
+
+        # 1. Experience Check
+        gap = resume_years - job_years
+        score += np.where(gap >= 0, 0.2, np.where(gap >= -1, -0.1, -0.3))
+
+        # 2. Skill Match
+        with np.errstate(divide="ignore", invalid="ignore"):
+            overlap_ratio = np.where(job_skill_counts == 0, 1.0, overlap / job_skill_counts)
+        score += np.where(overlap_ratio >= 0.8, 0.3,
+                 np.where(overlap_ratio >= 0.5, 0.1,
+                 np.where(overlap_ratio < 0.2, -0.2, 0.0)))
+
+        # 3. Visa "Kill Switch"
+        score += np.where((job_visa == "UNLIKELY") & needs_visa, -0.5,
+                 np.where((job_visa == "LIKELY") & needs_visa, 0.1, 0.0))
+
+        # 4. Entry Level Friendly
+        score += np.where(job_years == 0, 0.1, 0.0)
+
+        return np.clip(score, 0.0, 1.0)
+
+    def tier_scores(self, experience_years: float, visa_sponsorship: str,
+                    resume: NormalizedResume) -> Tuple[float, ...]:
+        """
+        calculate_probability for a job with these signals at each of the
+        SKILL_TIERS. Skill coverage is the only component left once
+        experience and visa are fixed, so these are the only scores such a
+        job can get.
+        """
+        return tuple(self._score(experience_years, visa_sponsorship, resume, skill_score)
+                     for skill_score in self.SKILL_TIERS)
+
     def get_recommendation(self, probability: float) -> str:
         if probability >= 0.8:
             return "STRONG APPLY"
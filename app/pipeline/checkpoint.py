@@ -0,0 +1,186 @@
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set, Tuple
+from app.models.job import Job
+from app.models.records import JobRecord, NormalizedJobRecord
+from app.models.resume import NormalizedResume
+from app.pipeline.config import RunConfig
+
+# Config fields that decide which jobs a run covers; a journal only resumes a run that agrees on them
+FINGERPRINT_FIELDS = ("query", "location", "time_filter", "experience", "limit", "sources", "analyze")
+
+class RunJournal:
+    """
+    Append-only JSONL checkpoint of a batch run, one event per line:
+
+        {"type": "run", "fingerprint": ..., "config": ..., "resume": ...}
+        {"type": "search", "source": "linkedin", "jobs": [...]}   one source's cards, in order
+        {"type": "job", "job": ..., "normalized": ..., "score": ..., "recommendation": ...}
+        {"type": "stored", "urls": [...]}              jobs the Parquet store has written
+        {"type": "done"}
+
+    Each line is flushed as it is written, so a crash or Ctrl-C loses at most
+    the job in flight; a torn last line is ignored on load. A resumed run
+    reuses the search results, replays the finished jobs into the exports,
+    re-appends finished jobs that never reached the store, and only scrapes
+    the rest. A live run only remembers which URLs are done, so memory stays
+    flat however many jobs it exports. Safe to write from several threads.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.header: Optional[dict] = None
+        self.cards: Dict[str, List[Job]] = {}  # source -> search cards
+        self.done: Set[str] = set()
+        # Full entries of jobs loaded from the journal, still to be re-exported
+        self.pending: Dict[str, Tuple[Job, NormalizedJobRecord, float, str]] = {}
+        self.stored: Set[str] = set()
+        self.finished = False
+        self._file = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str) -> "RunJournal":
+        journal = cls(path)
+        if not os.path.exists(path):
+            return journal
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # interrupted mid-write
+                kind = event.get("type")
+                if kind == "run":
+                    journal.header = event
+                elif kind == "search":
+                    journal.cards[event.get("source", "linkedin")] = [
+                        JobRecord.from_dict(row).to_model() for row in event["jobs"]
+                    ]
+                elif kind == "job":
+                    job = JobRecord.from_dict(event["job"]).to_model()
+                    journal.done.add(job.url)
+                    journal.pending[job.url] = (
+                        job, NormalizedJobRecord.from_dict(event["normalized"]),
+                        event["score"], event["recommendation"]
+                    )
+                elif kind == "stored":
+                    journal.stored.update(event["urls"])
+                elif kind == "done":
+                    journal.finished = True
+        return journal
+
+    @staticmethod
+    def fingerprint(config: RunConfig) -> dict:
+        return {name: getattr(config, name) for name in FINGERPRINT_FIELDS}
+
+    def start(self, config: RunConfig, resume: Optional[NormalizedResume] = None):
+        """Truncates the journal and records a new run."""
+        self.header = {
+            "type": "run",
+            "started": datetime.now(timezone.utc).isoformat(),
+            "fingerprint": self.fingerprint(config),
+            "config": config.model_dump(mode="json"),
+            "resume": resume.model_dump(mode="json") if resume else None,
+        }
+        self.cards = {}
+        self.done = set()
+        self.pending = {}
+        self.stored = set()
+        self.finished = False
+        self.close()
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._append(self.header)
+
+    def resume(self, config: RunConfig, resume: Optional[NormalizedResume] = None):
+        """
+        Continues an unfinished run, which must have searched for the same
+        jobs and scored them against the same resume profile.
+        """
+        if self.header is None:
+            raise ValueError(f"No run recorded in journal {self.path}")
+        if self.header["fingerprint"] != json.loads(json.dumps(self.fingerprint(config))):
+            raise ValueError(f"Journal {self.path} belongs to a different run "
+                             f"({self.header['fingerprint']}); remove it or pass matching options")
+        profile = resume.model_dump(mode="json") if resume else None
+        if self.header.get("resume") != json.loads(json.dumps(profile)):
+            raise ValueError(f"Journal {self.path} was scored against a different resume profile "
+                             f"({self.header.get('resume')}); remove it or pass the same resume options")
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def saved_config(self) -> Optional[RunConfig]:
+        return RunConfig(**self.header["config"]) if self.header else None
+
+    def saved_resume(self) -> Optional[NormalizedResume]:
+        if not (self.header and self.header.get("resume")):
+            return None
+        return NormalizedResume(**self.header["resume"])
+
+    def is_done(self, url: str) -> bool:
+        return url in self.done
+
+    def pending_exports(self) -> List[Tuple[Job, NormalizedJobRecord, float, str]]:
+        """Jobs the interrupted run finished, to replay into this run's fresh exports."""
+        return list(self.pending.values())
+
+    def unstored(self) -> List[Tuple[Job, NormalizedJobRecord, float, str]]:
+        """Finished jobs whose store rows were still buffered when the run stopped."""
+        return [entry for url, entry in self.pending.items() if url not in self.stored]
+
+    def saved_search(self, source: str) -> Optional[List[Job]]:
+        return self.cards.get(source)
+
+    def record_search(self, cards: List[Job], source: str = "linkedin"):
+        self.cards[source] = list(cards)
+        self._append({"type": "search", "source": source,
+                      "jobs": [json.loads(card.model_dump_json()) for card in cards]})
+
+    def record_job(self, job: Job, n_job: NormalizedJobRecord, score: float, recommendation: str):
+        self.done.add(job.url)
+        self._append({
+            "type": "job",
+            "job": json.loads(job.model_dump_json()),
+            "normalized": n_job.to_dict(),
+            "score": score,
+            "recommendation": recommendation,
+        })
+
+    def record_stored(self, urls: List[str]):
+        self.stored.update(urls)
+        self._append({"type": "stored", "urls": list(urls)})
+
+    def finish(self):
+        self._append({"type": "done"})
+        self.finished = True
+        self.close()
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def _append(self, event: dict):
+        line = json.dumps(event) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+def open_journal(config: RunConfig, resume: Optional[NormalizedResume] = None) -> RunJournal:
+    """
+    Starts the run's journal, or with config.resume_run picks up an
+    unfinished one at the same path.
+    """
+    path = config.journal_path()
+    if config.resume_run:
+        journal = RunJournal.load(path)
+        if journal.header and not journal.finished:
+            journal.resume(config, resume)
+            print(f"Resuming run from {path}: {len(journal.done)} jobs already done")
+            return journal
+        print(f"No unfinished run in {path}; starting a new one")
+    journal = RunJournal(path)
+    journal.start(config, resume)
+    return journal
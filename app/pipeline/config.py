@@ -0,0 +1,92 @@
+import json
+import os
+from typing import Dict, List, Optional
+from pydantic import BaseModel
+
+# "all" jobs is capped at a practical limit
+ALL_JOBS_LIMIT = 1000
+
+class RunConfig(BaseModel):
+    """
+    Every parameter of a batch run, so runs can be driven from flags or a
+    config file (JSON or TOML) instead of interactive prompts.
+    """
+    # Search
+    query: str = "Software"
+    location: str = "United States"
+    time_filter: str = "24h"  # 1h, 12h, 24h, week, month
+    experience: List[str] = ["entry"]  # internship, entry, associate, mid_senior, director
+    limit: int = 10
+
+    # Analysis
+    analyze: bool = True
+    resume_path: Optional[str] = None
+    years_of_experience: Optional[float] = None
+    visa_status: Optional[str] = None
+    skills: List[str] = []  # used when no resume file is given
+    parse_workers: Optional[int] = None  # processes for large normalize batches; None for one per CPU
+
+    # Scraping
+    sources: List[str] = ["linkedin"]  # linkedin, jobright, simplify; several run in parallel, deduplicated
+    source_rps: Dict[str, float] = {}  # per-source override of requests_per_second
+    fetch_mode: str = "browser"  # browser, or http (plain HTTP with browser fallback on auth walls)
+    headless: bool = True
+    concurrency: int = 1
+    requests_per_second: float = 0.5
+    adaptive_rate: bool = True  # speed up on healthy responses, back off on throttling
+    block_resources: bool = True  # abort images, fonts, media, CSS and trackers
+    page_max_uses: int = 25  # navigations before a pooled page is recycled
+    text_extractor: str = "lxml"  # description HTML to text: lxml (keeps headings and bullets) or html2text
+
+    # Near-duplicate (re-listing) detection over descriptions, stored with the cache
+    detect_duplicates: bool = True
+    skip_duplicates: bool = False  # drop re-listings instead of scoring them as "Repost"
+
+    # Storage
+    cache_path: Optional[str] = "job_cache.db"
+    cache_ttl_hours: float = 168
+    store_root: Optional[str] = "job_store"
+    output: Optional[str] = None  # base name for the xlsx/csv export
+    metrics_out: Optional[str] = None  # metrics summary, JSON or *.prom; run defaults to <output>_metrics.json
+    journal_out: Optional[str] = None  # checkpoint journal of a run; defaults to <output>.journal.jsonl
+    resume_run: bool = False  # continue the unfinished run recorded in the journal
+
+    model_config = {
+        "extra": "ignore"
+    }
+
+    def filters(self) -> dict:
+        filters = {}
+        if self.time_filter: filters["time"] = self.time_filter
+        if self.experience: filters["experience"] = list(self.experience)
+        return filters
+
+    def output_base(self) -> str:
+        return self.output or f"jobs_{self.query.replace(' ', '_')}"
+
+    def metrics_path(self) -> str:
+        return self.metrics_out or f"{self.output_base()}_metrics.json"
+
+    def journal_path(self) -> str:
+        return self.journal_out or f"{self.output_base()}.journal.jsonl"
+
+def parse_limit(value) -> int:
+    """Accepts a number or 'all'."""
+    if isinstance(value, str) and value.strip().lower() == "all":
+        return ALL_JOBS_LIMIT
+    return int(value)
+
+def load_config_file(path: str) -> dict:
+    """Reads a JSON or TOML config file into a dict of RunConfig fields."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Config file not found: {path}")
+    if path.lower().endswith(".toml"):
+        import tomllib
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    if "limit" in data:
+        data["limit"] = parse_limit(data["limit"])
+    return data
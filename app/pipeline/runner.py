@@ -0,0 +1,557 @@
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from contextlib import ExitStack, contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+from app import metrics
+from app.models.job import Job
+from app.models.records import JobRecord, NormalizedJobRecord
+from app.models.resume import NormalizedResume
+from app.normalization.job_parser import JobParser
+from app.otpm.engine import OTPMEngine
+from app.pipeline.checkpoint import RunJournal, open_journal
+from app.pipeline.config import RunConfig
+from app.pipeline.incremental import IncrementalEvaluator
+from app.pipeline.staged import Stage, StagedPipeline
+from app.scraping import html_text
+from app.scraping.orchestrator import ScrapeOrchestrator, merge_search_result
+from app.storage.job_cache import JobCache
+from app.storage.near_duplicate_index import NearDuplicateIndex
+from app.storage.result_store import ResultStore
+from app.storage.streaming_exporter import StreamingCsvExporter, StreamingExcelExporter
+
+# Jobs per normalize/score call in a streaming run; a batch is also cut
+# after Stage.max_wait, so a slow scrape is not held back
+PIPELINE_BATCH = 32
+
+class Profiler:
+    """
+    Wall-clock timing per named stage of a run, dumped with --profile.
+    """
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+        self.details: Dict[str, dict] = {}
+        self._started = time.monotonic()
+
+    @contextmanager
+    def stage(self, name: str):
+        t0 = time.monotonic()
+        try:
+            with metrics.span(f"stage.{name}"):
+                yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.monotonic() - t0
+
+    def report(self) -> dict:
+        return {
+            "total_seconds": round(time.monotonic() - self._started, 3),
+            "stages": {name: round(seconds, 3) for name, seconds in self.timings.items()},
+            "details": self.details,
+        }
+
+    def dump(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+
+# --- Shared helpers ---
+
+def build_resume(config: RunConfig) -> Optional[NormalizedResume]:
+    """Builds the resume profile from a file plus overrides, or from flags alone."""
+    if not config.analyze:
+        return None
+
+    user_inputs = {}
+    if config.years_of_experience is not None: user_inputs["years_of_experience"] = config.years_of_experience
+    if config.visa_status: user_inputs["visa_status"] = config.visa_status
+
+    if config.resume_path:
+        from app.normalization.resume_parser import ResumeParser
+        from app.storage.resume_cache import ResumeCache
+        cache = ResumeCache(config.cache_path) if config.cache_path else None
+        try:
+            return ResumeParser(cache=cache).parse_file(config.resume_path, user_inputs)
+        finally:
+            if cache: cache.close()
+
+    return NormalizedResume(
+        years_of_experience=config.years_of_experience or 0.0,
+        visa_status=config.visa_status or "Visa Required",
+        skills=[s.strip().lower() for s in config.skills if s.strip()]
+    )
+
+def open_cache(config: RunConfig) -> Optional[JobCache]:
+    if not config.cache_path:
+        return None
+    print(f"Using job cache at {config.cache_path} (TTL {config.cache_ttl_hours}h)")
+    return JobCache(config.cache_path, ttl_seconds=config.cache_ttl_hours * 3600)
+
+@contextmanager
+def open_scraper(config: RunConfig, cache: Optional[JobCache] = None):
+    """Yields a started LinkedIn scraper: plain HTTP or inside a Playwright session."""
+    scraper_args = dict(
+        headless=config.headless,
+        cache=cache,
+        block_resources=config.block_resources,
+        page_max_uses=config.page_max_uses,
+        requests_per_second=config.requests_per_second,
+        adaptive_rate=config.adaptive_rate
+    )
+    if config.fetch_mode == "http":
+        from app.scraping.linkedin_http import LinkedInHttpScraper
+        scraper = LinkedInHttpScraper(**scraper_args)
+        scraper.start_browser()
+        try:
+            yield scraper
+        finally:
+            if scraper.fallbacks:
+                print(f"{scraper.fallbacks} pages needed the browser fallback")
+            scraper.stop_browser()
+        return
+
+    from playwright.sync_api import sync_playwright
+    from app.scraping.linkedin import LinkedInScraper
+
+    with sync_playwright() as p:
+        scraper = LinkedInScraper(p, **scraper_args)
+        scraper.start_browser()
+        try:
+            yield scraper
+        finally:
+            scraper.stop_browser()
+
+@contextmanager
+def open_structured_scraper(scraper_cls, config: RunConfig, cache: Optional[JobCache] = None):
+    """Yields a started scraper for a board that needs no browser (Jobright, Simplify)."""
+    scraper = scraper_cls(headless=config.headless, cache=cache, adaptive_rate=config.adaptive_rate)
+    scraper.start_browser()
+    try:
+        yield scraper
+    finally:
+        scraper.stop_browser()
+
+def scraper_factories(config: RunConfig, cache: Optional[JobCache] = None) -> dict:
+    """Source name -> factory of a scraper context manager, for config.sources."""
+    from app.scraping.jobright import JobrightScraper
+    from app.scraping.simplify import SimplifyScraper
+
+    available = {
+        "linkedin": lambda: open_scraper(config, cache),
+        "jobright": lambda: open_structured_scraper(JobrightScraper, config, cache),
+        "simplify": lambda: open_structured_scraper(SimplifyScraper, config, cache),
+    }
+    unknown = [name for name in config.sources if name not in available]
+    if unknown:
+        raise ValueError(f"Unknown source(s): {', '.join(unknown)} (choose from {', '.join(available)})")
+    return {name: available[name] for name in config.sources}
+
+def open_duplicate_index(config: RunConfig) -> Optional[NearDuplicateIndex]:
+    if not (config.detect_duplicates and config.cache_path):
+        return None
+    return NearDuplicateIndex(config.cache_path)
+
+def flag_duplicates(jobs: Iterator[Job], index: NearDuplicateIndex, skip: bool) -> Iterator[Job]:
+    """Marks re-listings of earlier postings (raw_data["duplicate_of"]); drops them if `skip`."""
+    for job in jobs:
+        original = index.check(job)
+        if original:
+            print(f"   Re-listing of {original} ({job.raw_data['duplicate_similarity']:.0%} similar)")
+            if skip:
+                continue
+        yield job
+
+@contextmanager
+def open_job_stream(config: RunConfig, cache: Optional[JobCache], profiler: Profiler,
+                    journal: Optional[RunJournal] = None):
+    """
+    Yields an iterator of detailed jobs from the configured sources, or None
+    when the search found nothing. LinkedIn alone runs on this thread; several
+    sources run in parallel through the ScrapeOrchestrator, deduplicated.
+    Re-listings are flagged against the near-duplicate index as they arrive.
+    With a journal, LinkedIn search results are recorded (or reused when
+    resuming) and jobs the journal already finished are not scraped again.
+    """
+    html_text.set_extractor(config.text_extractor)
+    dup_index = open_duplicate_index(config)
+    skip_duplicates = dup_index and config.skip_duplicates
+
+    def skip_card(card: Job) -> bool:
+        if journal and journal.is_done(card.url):
+            return True
+        # A URL flagged as a re-listing in an earlier run needs no detail scrape
+        original = dup_index.known_duplicate(card.id) if skip_duplicates else None
+        if original:
+            print(f"Skipping known re-listing {card.url} (of {original})")
+        return bool(original)
+
+    skip = skip_card if skip_duplicates or (journal and journal.done) else None
+
+    def flagged(jobs: Iterator[Job]) -> Iterator[Job]:
+        return flag_duplicates(jobs, dup_index, config.skip_duplicates) if dup_index else jobs
+
+    try:
+        if config.sources == ["linkedin"]:
+            with open_scraper(config, cache) as scraper:
+                if journal and journal.saved_search("linkedin") is not None:
+                    jobs_list = journal.saved_search("linkedin")
+                    print(f"Reusing {len(jobs_list)} search results from {journal.path}")
+                else:
+                    with profiler.stage("search"):
+                        jobs_list, _ = search_jobs(scraper, config)
+                    if journal:
+                        journal.record_search(jobs_list)
+                if skip:
+                    jobs_list = [job for job in jobs_list if not skip(job)]
+                if not jobs_list and not (journal and journal.done):
+                    yield None
+                else:
+                    print(f"Found {len(jobs_list)} jobs (Top {config.limit}). Queueing for details...")
+                    yield flagged(iter_job_details(scraper, jobs_list, config, cache))
+            print_page_metrics(scraper, profiler)
+            return
+
+        print(f"\nSearching {', '.join(config.sources)} for '{config.query}' in '{config.location}' "
+              f"(limit {config.limit} per source)...")
+        orchestrator = ScrapeOrchestrator(
+            scraper_factories(config, cache),
+            requests_per_second=config.requests_per_second,
+            rate_limits=config.source_rps,
+            concurrency=config.concurrency,
+            skip_card=skip,
+            saved_search=journal.saved_search if journal else None,
+            on_search=journal.record_search if journal else None
+        )
+        jobs = orchestrator.run(config.query, config.location, config.filters(), config.limit)
+        try:
+            yield flagged(jobs)
+        finally:
+            jobs.close()
+            report = orchestrator.report()
+            profiler.details["sources"] = report
+            for name, stats in report.items():
+                print(f"[{name}] {stats['results']} results, {stats['duplicates']} cross-source duplicates, "
+                      f"{stats['scraped']} scraped, {stats['failed']} failed")
+    finally:
+        if dup_index:
+            stats = dup_index.stats()
+            profiler.details["duplicates"] = stats
+            print(f"Near-duplicate index: {stats['duplicates']} re-listings among {stats['checked']} "
+                  f"checked ({stats['indexed']} postings indexed)")
+            dup_index.close()
+
+def search_jobs(scraper, config: RunConfig) -> Tuple[List[Job], str]:
+    print(f"\nSearching for '{config.query}' in '{config.location}' (limit {config.limit})...")
+    jobs_list, total_count_str = scraper.search_jobs(
+        config.query, config.location, filters=config.filters(), limit=config.limit
+    )
+    print(f"\n=== MATCH FOUND: {total_count_str} Total Jobs Available ===")
+    return jobs_list, total_count_str
+
+def iter_job_details(scraper, jobs_list: List[Job], config: RunConfig, cache: Optional[JobCache] = None) -> Iterator[Job]:
+    """Yields detail scrapes as they complete."""
+    if config.concurrency > 1:
+        print(f"Concurrent mode: {config.concurrency} pages, {config.requests_per_second} req/s per host")
+        search_map = {j.url: j for j in jobs_list}
+        results = scraper.scrape_jobs_concurrently(
+            list(search_map), concurrency=config.concurrency, requests_per_second=config.requests_per_second
+        )
+        for i, (url, full_job) in enumerate(results):
+            search_result = search_map[url]
+            print(f"[{i+1}/{len(jobs_list)}] Scraped: {search_result.title} @ {search_result.company}")
+            if full_job:
+                yield merge_search_result(full_job, search_result)
+            else:
+                print("   Failed to scrape details.")
+    else:
+        # Shared politeness budget instead of a flat sleep after every job,
+        # adapting to throttling the scraper reports
+        limiter = scraper.limiter_for(config.requests_per_second)
+        for i, search_result in enumerate(jobs_list):
+            print(f"[{i+1}/{len(jobs_list)}] Scraping: {search_result.title} @ {search_result.company}")
+
+            # Cached jobs skip the browser, so they need no politeness wait
+            if not (cache and cache.has_job(search_result.url)):
+                limiter.acquire(search_result.url)
+            full_job = scraper.scrape_job(search_result.url)
+            if full_job:
+                yield merge_search_result(full_job, search_result)
+            else:
+                print("   Failed to scrape details.")
+
+def make_evaluator(config: RunConfig) -> Tuple[IncrementalEvaluator, Optional[ResultStore]]:
+    # Only postings (or resume tweaks) not seen before are re-parsed and re-scored
+    store = ResultStore(config.cache_path) if config.cache_path else None
+    return IncrementalEvaluator(JobParser(), OTPMEngine(), store, workers=config.parse_workers), store
+
+def print_cache_stats(cache: Optional[JobCache]):
+    if cache:
+        stats = cache.stats()
+        print(f"\nCache: {stats['job_hits']} hits / {stats['job_misses']} misses, "
+              f"~{stats['browser_seconds_saved']:.0f}s of browser time saved")
+
+def print_page_metrics(scraper, profiler: Profiler):
+    stats = scraper.metrics.summary()
+    stats["rates"] = scraper.rate_limiter.rates()
+    profiler.details["pages"] = stats
+    if stats["pages_loaded"]:
+        print(f"Pages: {stats['pages_loaded']} loaded, avg {stats['avg_load_seconds']:.2f}s "
+              f"(p95 {stats['p95_load_seconds']:.2f}s), ~{stats['avg_bytes_per_page'] // 1024} KiB/page, "
+              f"{stats['requests_blocked']} requests blocked")
+    if stats["rates"]:
+        print("Rate limits now: " + ", ".join(f"{host} {rate:.2f} req/s" for host, rate in stats["rates"].items()))
+
+# --- JSONL intermediates for the step-by-step subcommands ---
+
+def write_jsonl(path: str, rows: Iterator[dict]) -> int:
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row) + "\n")
+            f.flush()
+            count += 1
+    return count
+
+def read_jsonl(path: str) -> Iterator[dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+# --- Commands ---
+
+def scrape(config: RunConfig, out_path: str, profiler: Optional[Profiler] = None) -> int:
+    """Searches and scrapes job details, writing one Job per line to `out_path`."""
+    profiler = profiler or Profiler()
+    cache = open_cache(config)
+    with open_job_stream(config, cache, profiler) as jobs:
+        with profiler.stage("scrape_details"):
+            count = write_jsonl(out_path, (
+                json.loads(job.model_dump_json())
+                for job in jobs or []
+            ))
+    print_cache_stats(cache)
+    print(f"Wrote {count} jobs to {out_path}")
+    return count
+
+def normalize(config: RunConfig, jobs_path: str, out_path: str, profiler: Optional[Profiler] = None) -> int:
+    """Normalizes a Job JSONL file into NormalizedJob lines tagged with their content key."""
+    profiler = profiler or Profiler()
+    evaluator, store = make_evaluator(config)
+    with profiler.stage("load"):
+        # Our own intermediates: compact records, no per-row validation
+        jobs = [JobRecord.from_dict(row) for row in read_jsonl(jobs_path)]
+    with profiler.stage("normalize"):
+        normalized, keys = evaluator.normalize(jobs)
+    with profiler.stage("write"):
+        count = write_jsonl(out_path, (
+            {"job_key": key, **n_job.to_dict()} for n_job, key in zip(normalized, keys)
+        ))
+    if store: store.close()
+    profiler.details["normalize"] = evaluator.stats()
+    print(f"Wrote {count} normalized jobs to {out_path}")
+    return count
+
+def score(config: RunConfig, normalized_path: str, out_path: str,
+          resume: Optional[NormalizedResume] = None, profiler: Optional[Profiler] = None) -> int:
+    """Scores a NormalizedJob JSONL file against the configured resume."""
+    profiler = profiler or Profiler()
+    evaluator, store = make_evaluator(config)
+    with profiler.stage("load"):
+        resume = resume or build_resume(config.model_copy(update={"analyze": True}))
+        rows = list(read_jsonl(normalized_path))
+        normalized = [NormalizedJobRecord.from_dict(row) for row in rows]
+        # Lines written by normalize() carry their content key; others are keyed on content
+        keys = [row.get("job_key") or evaluator.normalized_key(n) for row, n in zip(rows, normalized)]
+    with profiler.stage("score"):
+        scores = evaluator.score(normalized, keys, resume)
+    with profiler.stage("write"):
+        count = write_jsonl(out_path, (
+            {"job_id": n.job_id, "score": s, "recommendation": evaluator.engine.get_recommendation(s)}
+            for n, s in zip(normalized, scores)
+        ))
+    if store: store.close()
+    profiler.details["score"] = evaluator.stats()
+    print(f"Wrote {count} scores to {out_path}")
+    return count
+
+def export(jobs_path: str, normalized_path: str, output: str,
+           scores_path: Optional[str] = None, profiler: Optional[Profiler] = None) -> int:
+    """
+    Joins jobs, normalized jobs and (optional) scores into an export.
+    `output` ending in .xlsx or .csv picks one format; a bare name writes both.
+    """
+    profiler = profiler or Profiler()
+    with profiler.stage("load"):
+        jobs = {row["id"]: JobRecord.from_dict(row) for row in read_jsonl(jobs_path)}
+        scores = {row["job_id"]: row for row in read_jsonl(scores_path)} if scores_path else {}
+
+    with profiler.stage("export"), ExitStack() as outputs:
+        writers = []
+        if not output.endswith(".csv"):
+            writers.append(outputs.enter_context(StreamingExcelExporter(output if output.endswith(".xlsx") else f"{output}.xlsx")))
+        if not output.endswith(".xlsx"):
+            writers.append(outputs.enter_context(StreamingCsvExporter(output if output.endswith(".csv") else f"{output}.csv")))
+
+        count = 0
+        for row in read_jsonl(normalized_path):
+            n_job = NormalizedJobRecord.from_dict(row)
+            job = jobs.get(n_job.job_id)
+            if not job: continue
+            scored = scores.get(n_job.job_id, {})
+            for writer in writers:
+                writer.write(job, n_job, scored.get("score", 0.0), scored.get("recommendation", "N/A"))
+            count += 1
+    return count
+
+def rank(config: RunConfig, top: int = 50, days: Optional[float] = None,
+         resume: Optional[NormalizedResume] = None, profiler: Optional[Profiler] = None) -> list:
+    """
+    Prints the `top` best stored jobs for the configured resume, optionally
+    only those posted in the last `days` days. Returns (job, score) pairs.
+    """
+    from app.recommendation.ranking import RankingIndex
+    from app.storage.parquet_store import ParquetJobStore
+
+    profiler = profiler or Profiler()
+    store = ParquetJobStore(config.store_root or "job_store")
+    since = datetime.now(timezone.utc) - timedelta(days=days) if days else None
+    with profiler.stage("load"):
+        resume = resume or build_resume(config.model_copy(update={"analyze": True}))
+        index = RankingIndex.from_store(store, since)
+    with profiler.stage("rank"):
+        ranked = index.top_k(resume, top, since)
+
+    details = {}
+    if ranked:
+        table = store.read([("job_id", "in", [n_job.job_id for n_job, _ in ranked])],
+                           columns=["job_id", "title", "company"])
+        details = {row["job_id"]: row for row in table.to_pylist()}
+    print(f"Top {len(ranked)} of {len(index)} stored jobs")
+    for n_job, p_oa in ranked:
+        row = details.get(n_job.job_id, {})
+        print(f"  {p_oa:.2f} [{index.engine.get_recommendation(p_oa)}] "
+              f"{row.get('company', '')}: {row.get('title', '')} {n_job.job_id}")
+    return ranked
+
+def _item_job(item) -> Job:
+    """The job a pipeline item is about: stages after scraping pass tuples led by it."""
+    return item if isinstance(item, Job) else item[0]
+
+def run_pipeline(config: RunConfig, resume: Optional[NormalizedResume] = None,
+                 profiler: Optional[Profiler] = None) -> int:
+    """
+    Full run: search, then scrape -> normalize -> score -> export as overlapping stages.
+    Returns the number of jobs exported.
+    """
+    from app.storage.parquet_store import ParquetAppender, ParquetJobStore
+
+    profiler = profiler or Profiler()
+    if config.analyze and resume is None:
+        with profiler.stage("resume"):
+            resume = build_resume(config)
+    analyze = config.analyze and resume is not None
+
+    # Closed however the run ends: the early return, an exception or Ctrl-C
+    with ExitStack() as resources:
+        cache = open_cache(config)
+        if cache:
+            resources.callback(cache.close)
+        evaluator, store = make_evaluator(config)
+        if store:
+            resources.callback(store.close)
+        engine = evaluator.engine
+        exported = 0
+
+        journal = open_journal(config, resume)
+        try:
+            with open_job_stream(config, cache, profiler, journal) as jobs:
+                if jobs is None:
+                    print("No jobs found. Exiting.")
+                    journal.finish()
+                    return 0
+
+                # Each job is written out as soon as it is scored, so a crash mid-run
+                # keeps everything before it (the CSV is flushed row by row), and is
+                # journaled so --resume-run can carry on from the next one.
+                print("\nScraping, analyzing and exporting jobs as they complete...")
+                base_name = config.output_base()
+                with profiler.stage("pipeline"), ExitStack() as outputs:
+                    xlsx_out = outputs.enter_context(StreamingExcelExporter(f"{base_name}.xlsx"))
+                    csv_out = outputs.enter_context(StreamingCsvExporter(f"{base_name}.csv"))
+                    appender = None
+                    if config.store_root:
+                        # Journaled jobs only count as stored once their batch is on disk
+                        appender = outputs.enter_context(ParquetAppender(
+                            ParquetJobStore(config.store_root), on_flush=journal.record_stored
+                        ))
+
+                    # Jobs finished before an interruption go back into the fresh exports,
+                    # and into the store if their rows were still buffered when it stopped
+                    for job, n_job, p_oa, rec in journal.pending_exports():
+                        xlsx_out.write(job, n_job, p_oa, rec)
+                        csv_out.write(job, n_job, p_oa, rec)
+                        exported += 1
+                    if appender:
+                        for job, n_job, p_oa, rec in journal.unstored():
+                            appender.write(job, n_job, p_oa if analyze else None, rec if analyze else None)
+
+                    # Micro-batches: one parse_many, one score_batch and one store commit per batch
+                    def normalize_stage(batch):
+                        normalized, keys = evaluator.normalize(batch)
+                        return list(zip(batch, normalized, keys))
+
+                    def score_stage(batch):
+                        if not analyze:
+                            return [(job, n_job, 0.0, "N/A") for job, n_job, _ in batch]
+                        scores = evaluator.score([n_job for _, n_job, _ in batch], [key for _, _, key in batch], resume)
+                        results = []
+                        for (job, n_job, _), p_oa in zip(batch, scores):
+                            rec = engine.get_recommendation(p_oa)
+                            print(f"   -> {job.company}: P(OA)={p_oa:.2f} [{rec}]")
+                            results.append((job, n_job, p_oa, rec))
+                        return results
+
+                    def export_stage(item):
+                        nonlocal exported
+                        job, n_job, p_oa, rec = item
+                        xlsx_out.write(job, n_job, p_oa, rec)
+                        csv_out.write(job, n_job, p_oa, rec)
+                        if appender:
+                            # Scrape-only runs leave the OTPM columns empty in the history
+                            appender.write(job, n_job, p_oa if analyze else None, rec if analyze else None)
+                        # Journaled last: a job whose export raised is not done and is retried on resume
+                        journal.record_job(job, n_job, p_oa, rec)
+                        exported += 1
+
+                    pipeline = StagedPipeline([
+                        Stage("normalize", normalize_stage, batch_size=PIPELINE_BATCH),
+                        Stage("score", score_stage, batch_size=PIPELINE_BATCH),
+                        Stage("export", export_stage),
+                    ], source_name="scrape")
+                    pipeline.run(jobs)
+            if not pipeline.failures:
+                journal.finish()
+        finally:
+            # Left without a "done" line when interrupted or when jobs failed, for --resume-run
+            journal.close()
+
+        print("\nPipeline stages:")
+        print(pipeline.format_report())
+        profiler.details["pipeline"] = pipeline.report()
+        if pipeline.failures:
+            failed = [{"stage": stage, "url": _item_job(item).url, "error": error}
+                      for stage, item, error in pipeline.failures]
+            profiler.details["failed_jobs"] = failed
+            print(f"\n{len(failed)} jobs failed and were not exported:")
+            for row in failed:
+                print(f"   [{row['stage']}] {row['url']}: {row['error']}")
+
+        stats = evaluator.stats()
+        profiler.details["incremental"] = stats
+        print(f"Normalized {stats['normalized_computed']} new / {stats['normalized_reused']} reused, "
+              f"scored {stats['scores_computed']} new / {stats['scores_reused']} reused")
+
+        print_cache_stats(cache)
+        if cache:
+            profiler.details["cache"] = cache.stats()
+    return exported
@@ -0,0 +1,216 @@
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from app import metrics
+
+_END = object()
+
+class Stage:
+    """
+    One step of a StagedPipeline. `fn` takes an item and returns the item for
+    the next stage, or None to drop it. With workers > 1 items may leave the
+    stage out of order. An item whose `fn` raises goes no further; it is kept
+    in StagedPipeline.failures and counted in the "pipeline_failures" metric.
+
+    With batch_size > 1, `fn` takes a list of up to batch_size items and
+    returns a list of results (None entries are dropped). A batch is cut
+    when it is full or `max_wait` seconds after its first item arrived, so
+    a slow source still gets its items through promptly.
+    """
+
+    def __init__(self, name: str, fn: Callable[[Any], Any], workers: int = 1, queue_size: int = 32,
+                 batch_size: int = 1, max_wait: float = 0.05):
+        self.name = name
+        self.fn = fn
+        self.workers = max(1, workers)
+        self.queue_size = max(1, queue_size)
+        self.batch_size = max(1, batch_size)
+        self.max_wait = max_wait
+
+class StageStats:
+    """Counters for one stage, including the depth of its input queue."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.processed = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.max_queue_depth = 0
+        self._depth_total = 0
+        self._depth_samples = 0
+
+    def sample_depth(self, depth: int):
+        self.max_queue_depth = max(self.max_queue_depth, depth)
+        self._depth_total += depth
+        self._depth_samples += 1
+
+    def to_dict(self, wall_seconds: float) -> dict:
+        return {
+            "processed": self.processed,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "throughput_per_sec": round(self.processed / wall_seconds, 3) if wall_seconds > 0 else 0.0,
+            "max_queue_depth": self.max_queue_depth,
+            "avg_queue_depth": round(self._depth_total / self._depth_samples, 2) if self._depth_samples else 0.0,
+        }
+
+class StagedPipeline:
+    """
+    Runs a chain of stages connected by bounded asyncio queues.
+
+    The source is iterated on the calling thread, because it is usually a
+    scraper bound to Playwright's sync API, and each item is handed to an event
+    loop on a background thread where the stages run. A full queue blocks the
+    stage (or source) feeding it, so a slow exporter throttles scoring and
+    scraping instead of letting work pile up in memory. Stage functions run
+    in the loop's thread pool, so parsing and scoring overlap network waits.
+    """
+
+    def __init__(self, stages: List[Stage], source_name: str = "source"):
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        self.stages = stages
+        self.source_stats = StageStats(source_name)
+        self.stats = {stage.name: StageStats(stage.name) for stage in stages}
+        self.wall_seconds = 0.0
+        self.first_output_seconds: Optional[float] = None
+        # (stage name, item, error) for every item a stage failed on
+        self.failures: List[Tuple[str, Any, str]] = []
+
+    def run(self, source: Iterable[Any]) -> Dict[str, dict]:
+        """Pushes every source item through the stages and returns report()."""
+        started = time.monotonic()
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        queues: List[asyncio.Queue] = []
+        done: Dict[str, Any] = {}
+
+        def run_loop():
+            asyncio.set_event_loop(loop)
+
+            async def main():
+                queues.extend(asyncio.Queue(maxsize=stage.queue_size) for stage in self.stages)
+                ready.set()
+                await asyncio.gather(*(self._run_stage(i, queues, started) for i in range(len(self.stages))))
+
+            try:
+                loop.run_until_complete(main())
+            except BaseException as e:
+                done["error"] = e
+                ready.set()
+            finally:
+                loop.close()
+
+        worker = threading.Thread(target=run_loop, name="pipeline-stages", daemon=True)
+        worker.start()
+        ready.wait()
+
+        try:
+            iterator = iter(source)
+            while "error" not in done:
+                t0 = time.monotonic()
+                item = next(iterator, _END)
+                self.source_stats.busy_seconds += time.monotonic() - t0
+                if item is _END:
+                    break
+                self.source_stats.processed += 1
+                # Blocks while the first stage's queue is full (backpressure)
+                asyncio.run_coroutine_threadsafe(queues[0].put(item), loop).result()
+        finally:
+            if "error" not in done:
+                for _ in range(self.stages[0].workers):
+                    asyncio.run_coroutine_threadsafe(queues[0].put(_END), loop).result()
+            worker.join()
+
+        self.wall_seconds = time.monotonic() - started
+        if "error" in done:
+            raise done["error"]
+        return self.report()
+
+    async def _run_stage(self, index: int, queues: List[asyncio.Queue], started: float):
+        stage = self.stages[index]
+        stats = self.stats[stage.name]
+        inbox = queues[index]
+        outbox = queues[index + 1] if index + 1 < len(queues) else None
+        is_last = outbox is None
+        loop = asyncio.get_running_loop()
+
+        async def next_batch() -> Tuple[List[Any], bool]:
+            """Up to batch_size items, and whether the end marker was reached."""
+            stats.sample_depth(inbox.qsize())
+            item = await inbox.get()
+            if item is _END:
+                return [], True
+            batch = [item]
+            deadline = loop.time() + stage.max_wait
+            while len(batch) < stage.batch_size:
+                try:
+                    if inbox.empty():
+                        # An item that arrives as the wait times out stays queued
+                        item = await asyncio.wait_for(inbox.get(), max(0.0, deadline - loop.time()))
+                    else:
+                        item = inbox.get_nowait()
+                except asyncio.TimeoutError:
+                    break
+                if item is _END:
+                    return batch, True
+                batch.append(item)
+            return batch, False
+
+        async def work():
+            ended = False
+            while not ended:
+                if stage.batch_size > 1:
+                    items, ended = await next_batch()
+                    if not items:
+                        return
+                    arg = items
+                else:
+                    stats.sample_depth(inbox.qsize())
+                    item = await inbox.get()
+                    if item is _END:
+                        return
+                    items = [item]
+                    arg = item
+                t0 = time.monotonic()
+                try:
+                    result = await loop.run_in_executor(None, stage.fn, arg)
+                except Exception as e:
+                    stats.errors += len(items)
+                    self.failures.extend((stage.name, item, f"{type(e).__name__}: {e}") for item in items)
+                    metrics.inc("pipeline_failures", len(items), stage=stage.name)
+                    continue
+                finally:
+                    stats.busy_seconds += time.monotonic() - t0
+                stats.processed += len(items)
+                if is_last and self.first_output_seconds is None:
+                    self.first_output_seconds = time.monotonic() - started
+                if outbox is not None:
+                    for out in (result if stage.batch_size > 1 else [result]):
+                        if out is not None:
+                            await outbox.put(out)
+
+        await asyncio.gather(*(work() for _ in range(stage.workers)))
+        # Every worker downstream needs its own end marker
+        if outbox is not None:
+            for _ in range(self.stages[index + 1].workers):
+                await outbox.put(_END)
+
+    def report(self) -> Dict[str, dict]:
+        report = {self.source_stats.name: self.source_stats.to_dict(self.wall_seconds)}
+        for stage in self.stages:
+            report[stage.name] = self.stats[stage.name].to_dict(self.wall_seconds)
+        return report
+
+    def format_report(self) -> str:
+        lines = [f"{'stage':<12} {'items':>6} {'errors':>6} {'busy s':>8} {'items/s':>8} {'max q':>6} {'avg q':>6}"]
+        for name, row in self.report().items():
+            lines.append(
+                f"{name:<12} {row['processed']:>6} {row['errors']:>6} {row['busy_seconds']:>8.2f} "
+                f"{row['throughput_per_sec']:>8.2f} {row['max_queue_depth']:>6} {row['avg_queue_depth']:>6}"
+            )
+        lines.append(f"wall time {self.wall_seconds:.2f}s")
+        if self.first_output_seconds is not None:
+            lines.append(f"first result after {self.first_output_seconds:.2f}s")
+        return "\n".join(lines)
@@ -0,0 +1,182 @@
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+import numpy as np
+from app.models.records import NormalizedJobRecord
+from app.models.resume import NormalizedResume
+from app.normalization.skill_vocabulary import SkillVocabulary
+from app.otpm.engine import OTPMEngine
+
+def _timestamp(date: datetime) -> float:
+    # Naive datetimes are UTC, like the store's timestamps
+    return date.replace(tzinfo=date.tzinfo or timezone.utc).timestamp()
+
+class RankingIndex:
+    """
+    Top-K jobs for a resume over a large corpus of normalized jobs, with
+    the same scores as OTPMEngine.calculate_probability.
+
+    Jobs are bucketed by (experience_years, visa_sponsorship): within a
+    bucket every component of the score is fixed except skill coverage, so
+    a bucket's jobs can only take the four OTPMEngine.tier_scores. Buckets
+    are visited best first, and once K jobs are held every bucket whose
+    best score cannot beat the K-th one is skipped without looking at its
+    jobs. Within a bucket, skill overlap comes from an inverted index of
+    skill -> jobs, so only the resume's postings lists are read.
+
+    Ties are broken by the newest posting first, then by insertion order.
+    The index is rebuilt on the first query after add().
+    """
+
+    def __init__(self, engine: Optional[OTPMEngine] = None):
+        self.engine = engine or OTPMEngine()
+        self.jobs: List[NormalizedJobRecord] = []
+        self._posted: List[float] = []
+        self._built = False
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def add(self, n_job: NormalizedJobRecord, posted: Optional[datetime] = None):
+        """
+        Adds a job; `posted` is what `since` filters on. Jobs without a
+        date never pass a `since` filter and rank last among ties.
+        """
+        self.jobs.append(n_job)
+        self._posted.append(_timestamp(posted) if posted else -np.inf)
+        self._built = False
+
+    def add_all(self, n_jobs: Iterable[NormalizedJobRecord], posted: Optional[Iterable[Optional[datetime]]] = None):
+        n_jobs = list(n_jobs)
+        for n_job, date in zip(n_jobs, posted if posted is not None else [None] * len(n_jobs)):
+            self.add(n_job, date)
+
+    @classmethod
+    def from_store(cls, store, since: Optional[datetime] = None,
+                   engine: Optional[OTPMEngine] = None) -> "RankingIndex":
+        """
+        Indexes the normalized jobs in a ParquetJobStore, keeping the latest
+        scrape of each job. A job is dated by its posting date, or by when
+        it was scraped if the posting date is unknown.
+        """
+        columns = ["job_id", "required_skills", "experience_years", "visa_sponsorship",
+                   "posted_date", "scraped_at"]
+        filters = [("scraped_at", ">=", since)] if since else None
+        table = store.read(filters, columns=columns).to_pydict()
+
+        latest: Dict[str, int] = {}
+        for i, (job_id, visa, scraped_at) in enumerate(zip(table["job_id"], table["visa_sponsorship"], table["scraped_at"])):
+            if visa is None:
+                continue  # stored without normalization
+            previous = latest.get(job_id)
+            if previous is None or scraped_at >= table["scraped_at"][previous]:
+                latest[job_id] = i
+
+        index = cls(engine)
+        for i in latest.values():
+            index.add(
+                NormalizedJobRecord.from_skills(
+                    table["job_id"][i], table["required_skills"][i] or (),
+                    table["experience_years"][i] or 0.0, table["visa_sponsorship"][i]
+                ),
+                table["posted_date"][i] or table["scraped_at"][i]
+            )
+        return index
+
+    def _build(self):
+        n = len(self.jobs)
+        posted = np.array(self._posted, dtype=np.float64)
+        # Position of each job in tie-break order: newest first, then insertion order
+        order = np.lexsort((np.arange(n), -posted))
+        self.sorted_posted = posted[order]
+        self.rank = np.empty(n, dtype=np.int64)
+        self.rank[order] = np.arange(n)
+
+        keys: Dict[Tuple[float, str], int] = {}
+        bucket = np.empty(n, dtype=np.int64)
+        skill_counts = np.empty(n, dtype=np.int64)
+        postings: Dict[Tuple[int, int], List[int]] = {}
+        for i, n_job in enumerate(self.jobs):
+            b = bucket[i] = keys.setdefault((n_job.experience_years, n_job.visa_sponsorship), len(keys))
+            skill_ids = SkillVocabulary.bit_ids(n_job.skill_mask)
+            skill_counts[i] = len(skill_ids)
+            for skill_id in skill_ids:
+                postings.setdefault((b, skill_id), []).append(i)
+
+        # Per bucket: members in tie-break order, and postings as positions in that order
+        self.bucket_keys = list(keys)
+        self.buckets = []
+        position = np.empty(n, dtype=np.int64)
+        for b in range(len(keys)):
+            members = order[bucket[order] == b]
+            position[members] = np.arange(len(members))
+            self.buckets.append(_Bucket(members, self.rank[members], skill_counts[members], {}))
+        for (b, skill_id), jobs in postings.items():
+            self.buckets[b].postings[skill_id] = position[jobs]
+        self._built = True
+
+    def _top(self, idx: np.ndarray, levels: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """The k best of idx by (score level, tie-break rank)."""
+        key = levels * len(self.jobs) + self.rank[idx]
+        if len(key) > k:
+            best = np.argpartition(key, k - 1)[:k]
+            idx, levels, key = idx[best], levels[best], key[best]
+        order = np.argsort(key)
+        return idx[order], levels[order]
+
+    def top_k(self, resume: NormalizedResume, k: int = 50,
+              since: Optional[datetime] = None) -> List[Tuple[NormalizedJobRecord, float]]:
+        """
+        The k best (job, score) pairs for the resume, best first, optionally
+        limited to jobs dated at or after `since`.
+        """
+        if not self._built:
+            self._build()
+        if k <= 0 or not self.jobs:
+            return []
+        # Jobs dated since `since` are the ones ranked below the cutoff
+        cutoff = len(self.jobs)
+        if since:
+            cutoff = int(np.searchsorted(-self.sorted_posted, -_timestamp(since), side="right"))
+
+        # Reachable scores per bucket and skill tier, as levels into `values` (0 = best)
+        tiers = np.array([
+            self.engine.tier_scores(years, visa, resume) for years, visa in self.bucket_keys
+        ])
+        values, levels = np.unique(-tiers, return_inverse=True)
+        values, levels = -values, levels.reshape(tiers.shape)
+        vocabulary = SkillVocabulary.shared()
+        skill_ids = {vocabulary.id(skill) for skill in resume.skills}
+
+        idx = np.empty(0, dtype=np.int64)
+        top = np.empty(0, dtype=np.int64)
+        for b in np.argsort(levels[:, 0], kind="stable"):
+            if len(idx) == k and levels[b, 0] > top[-1]:
+                break  # neither this bucket nor any later one can beat the k-th job
+            bucket = self.buckets[b]
+            size = int(np.searchsorted(bucket.ranks, cutoff))
+            if not size:
+                continue
+
+            # Overlap is how many of the resume's skill postings a job appears in
+            lists = [bucket.postings[s] for s in skill_ids if s in bucket.postings]
+            overlap = np.bincount(np.concatenate(lists), minlength=size)[:size] if lists else np.zeros(size)
+            skill_counts = bucket.skill_counts[:size]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                overlap_ratio = np.where(skill_counts == 0, 1.0, overlap / skill_counts)
+            tier = np.select([overlap_ratio >= 0.8, overlap_ratio >= 0.5, overlap_ratio < 0.2], [0, 1, 3], 2)
+
+            bucket_levels = levels[b][tier]
+            if len(idx) == k:
+                keep = bucket_levels <= top[-1]
+                members, bucket_levels = bucket.members[:size][keep], bucket_levels[keep]
+            else:
+                members = bucket.members[:size]
+            idx, top = self._top(np.concatenate([idx, members]), np.concatenate([top, bucket_levels]), k)
+
+        return [(self.jobs[i], float(values[level])) for i, level in zip(idx, top)]
+
+class _Bucket(NamedTuple):
+    members: np.ndarray
+    ranks: np.ndarray
+    skill_counts: np.ndarray
+    postings: Dict[int, np.ndarray]
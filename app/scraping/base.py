@@ -1,37 +1,156 @@
+import asyncio
+import functools
+import inspect
+import queue
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence, Tuple
 from playwright.sync_api import Playwright, Browser, Page
+from app import metrics
 from app.models.job import Job
+from app.scraping.page_pool import (
+    BLOCKED_RESOURCE_TYPES, TRACKER_DOMAINS, PagePool, ScrapeMetrics, should_block
+)
+from app.scraping.rate_limiter import HostRateLimiter
+from app.storage.job_cache import JobCache
+
+_DONE = object()
+
+def _traced(fn, name: str):
+    """Wraps a scraper method in a span labelled with the scraper class; None results count as failures."""
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(self, *args, **kwargs):
+            scraper = type(self).__name__
+            with metrics.span(name, scraper=scraper):
+                result = await fn(self, *args, **kwargs)
+            if result is None:
+                metrics.inc("scrape_failures", scraper=scraper)
+            return result
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        scraper = type(self).__name__
+        with metrics.span(name, scraper=scraper):
+            result = fn(self, *args, **kwargs)
+        if result is None:
+            metrics.inc("scrape_failures", scraper=scraper)
+        return result
+    return wrapper
 
 class BaseScraper(ABC):
     """
     Abstract base class for all job scrapers.
     Manages Playwright browser lifecycle and defines common interface.
     """
-    
-    def __init__(self, playwright: Playwright, headless: bool = True):
+
+    # Subclasses can widen or narrow what gets aborted before it hits the network
+    BLOCKED_RESOURCE_TYPES = BLOCKED_RESOURCE_TYPES
+    TRACKER_DOMAINS = TRACKER_DOMAINS
+
+    # Entry points every subclass gets wrapped in a metrics span
+    TRACED_METHODS = ("scrape_job", "scrape_job_async", "search_jobs")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in BaseScraper.TRACED_METHODS:
+            if name in cls.__dict__:
+                setattr(cls, name, _traced(cls.__dict__[name], name))
+
+    def __init__(
+        self,
+        playwright: Playwright,
+        headless: bool = True,
+        cache: Optional[JobCache] = None,
+        block_resources: bool = True,
+        page_max_uses: int = 25,
+        context_max_pages: int = 200,
+        requests_per_second: float = 0.5,
+        adaptive_rate: bool = True
+    ):
         self.playwright = playwright
         self.headless = headless
+        self.cache = cache
+        self.block_resources = block_resources
+        self.page_max_uses = page_max_uses
+        self.context_max_pages = context_max_pages
+        self.metrics = ScrapeMetrics()
+        self.adaptive_rate = adaptive_rate
+        # Detail-page budget per host; scrapers report throttling to it
+        self.rate_limiter = HostRateLimiter(requests_per_second, adaptive=adaptive_rate)
         self.browser: Optional[Browser] = None
-        self._context = None
+        self._pool: Optional[PagePool] = None
+        self._context_args = {}
 
     def start_browser(self, **context_args):
         """Initializes the browser."""
         if not self.browser:
+            self._context_args = context_args
             self.browser = self.playwright.chromium.launch(headless=self.headless)
-            self._context = self.browser.new_context(**context_args)
+            self._pool = PagePool(
+                self._new_context,
+                self.metrics,
+                page_max_uses=self.page_max_uses,
+                context_max_pages=self.context_max_pages
+            )
 
     def stop_browser(self):
         """Closes the browser."""
+        if self._pool:
+            self._pool.close()
+            self._pool = None
         if self.browser:
             self.browser.close()
             self.browser = None
 
+    def limiter_for(self, requests_per_second: float) -> HostRateLimiter:
+        """The detail-page limiter, restarted if a caller asks for a different base rate."""
+        if self.rate_limiter.requests_per_second != requests_per_second:
+            self.rate_limiter = HostRateLimiter(requests_per_second, adaptive=self.adaptive_rate)
+        return self.rate_limiter
+
     def get_page(self) -> Page:
-        """Returns a new page in the current context."""
-        if not self.browser:
-            self.start_browser()
-        return self._context.new_page()
+        """Returns a warm page from the pool; hand it back with release_page."""
+        with metrics.span("scraper.get_page"):
+            if not self.browser:
+                self.start_browser()
+            return self._pool.acquire()
+
+    def release_page(self, page: Page):
+        """Returns a page to the pool (it is closed once it has been used enough)."""
+        if self._pool:
+            self._pool.release(page)
+        else:
+            page.close()
+
+    def _new_context(self):
+        context = self.browser.new_context(**self._context_args)
+        if self.block_resources:
+            context.route("**/*", self._route)
+        context.on("response", self.metrics.on_response)
+        return context
+
+    def _is_blocked(self, request) -> bool:
+        return should_block(request.resource_type, request.url,
+                            self.BLOCKED_RESOURCE_TYPES, self.TRACKER_DOMAINS)
+
+    def _route(self, route):
+        blocked = self._is_blocked(route.request)
+        self.metrics.record_request(blocked)
+        if blocked:
+            route.abort()
+        else:
+            route.continue_()
+
+    async def _route_async(self, route):
+        blocked = self._is_blocked(route.request)
+        self.metrics.record_request(blocked)
+        if blocked:
+            await route.abort()
+        else:
+            await route.continue_()
 
     @abstractmethod
     def scrape_job(self, url: str) -> Optional[Job]:
@@ -42,14 +161,174 @@ class BaseScraper(ABC):
         pass
 
     @abstractmethod
-    @abstractmethod
-    def search_jobs(self, query: str, location: str, limit: int = 10) -> tuple:
+    def search_jobs(self, query: str, location: str, filters: dict = None, limit: int = 10) -> tuple:
         """
         Searches for jobs matching criteria.
         Returns: (List[Job], str_total_count)
         """
         pass
+
+    def _cached_job(self, url: str) -> Optional[Job]:
+        """Returns a fresh cached scrape of `url`, if a cache is configured."""
+        if self.cache:
+            job = self.cache.get_job(url)
+            if job:
+                metrics.inc("cache_hits")
+                print(f"Cache hit: {url}")
+            return job
+        return None
+
+    def _store_job(self, job: Optional[Job], started: float):
+        if self.cache and job:
+            self.cache.put_job(job, fetch_seconds=time.monotonic() - started)
+
+    def _store_cards(self, cards: List[Job]):
+        """Records search cards, reporting how many were already known."""
+        if self.cache and cards:
+            known = sum(1 for card in cards if self.cache.get_card(card.url))
+            self.cache.put_cards(cards)
+            print(f"{known}/{len(cards)} search results already seen in cache.")
+
+    def scrape_jobs_concurrently(
+        self,
+        urls: Sequence[str],
+        concurrency: int = 4,
+        requests_per_second: float = 0.5
+    ) -> Iterator[Tuple[str, Optional[Job]]]:
         """
-        Searches for jobs matching criteria.
+        Scrapes many job URLs with a bounded pool of `concurrency` pages.
+        Politeness is enforced by the scraper's per-host rate limiter, shared
+        by all pages, rather than by fixed sleeps.
+        Yields (url, job) pairs in completion order; job is None on failure.
+
+        Concurrency is an optional capability: a scraper opts in by defining
+        `async def scrape_job_async(self, page, url)`, the counterpart of
+        scrape_job on a page from Playwright's async API. Scrapers without
+        it are scraped one URL at a time through scrape_job.
         """
-        pass
+        limiter = self.limiter_for(requests_per_second)
+        if not self.supports_concurrency:
+            yield from self._scrape_sequentially(urls, limiter)
+            return
+
+        results: queue.Queue = queue.Queue()
+        stop = threading.Event()
+
+        def run():
+            try:
+                asyncio.run(self._scrape_many_async(list(urls), concurrency, limiter, results.put, stop))
+            except Exception as e:
+                results.put(e)
+            finally:
+                results.put(_DONE)
+
+        # Async Playwright gets its own event loop on its own thread so it
+        # never collides with the sync API the rest of the scraper uses here.
+        worker = threading.Thread(target=run, name="scraper-pool", daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = results.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            worker.join()
+
+    @property
+    def supports_concurrency(self) -> bool:
+        return hasattr(self, "scrape_job_async")
+
+    def _scrape_sequentially(self, urls: Sequence[str], limiter: HostRateLimiter) -> Iterator[Tuple[str, Optional[Job]]]:
+        for url in urls:
+            # Cached jobs skip the browser, so they need no politeness wait
+            if not (self.cache and self.cache.has_job(url)):
+                limiter.acquire(url)
+            yield url, self.scrape_job(url)
+
+    async def _scrape_many_async(self, urls, concurrency, limiter, emit, stop):
+        """
+        Runs the page pool on the worker thread's event loop. It launches its
+        own Chromium rather than reusing self.browser: sync Playwright objects
+        are bound to the thread and dispatcher that created them, so the
+        scraper's browser cannot be driven from async code on another thread.
+        """
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=self.headless)
+            try:
+                context = await browser.new_context(**self._context_args)
+                if self.block_resources:
+                    await context.route("**/*", self._route_async)
+                context.on("response", self.metrics.on_response)
+
+                uses = {}
+
+                async def new_page():
+                    page = await context.new_page()
+                    self.metrics.pages_created += 1
+                    uses[page] = 0
+                    return page
+
+                pages: asyncio.Queue = asyncio.Queue()
+                live = max(1, min(concurrency, len(urls)))
+                for _ in range(live):
+                    pages.put_nowait(await new_page())
+
+                async def replace(page):
+                    nonlocal live
+                    uses.pop(page, None)
+                    try:
+                        if not page.is_closed():
+                            await page.close()
+                            self.metrics.pages_recycled += 1
+                        return await new_page()
+                    except Exception as e:
+                        # The context died; carry on with the pages still open
+                        print(f"Could not replace page: {e}")
+                        live -= 1
+                        return None
+
+                async def fetch(url: str):
+                    cached = self._cached_job(url)
+                    if cached:
+                        emit((url, cached))
+                        return
+
+                    page = await pages.get()
+                    if page is None:
+                        # No pages left: pass the marker on and fail the rest
+                        pages.put_nowait(None)
+                        if not stop.is_set():
+                            emit((url, None))
+                        return
+                    job = None
+                    try:
+                        if stop.is_set():
+                            return
+                        await limiter.acquire_async(url)
+                        started = time.monotonic()
+                        job = await self.scrape_job_async(page, url)
+                        self._store_job(job, started)
+                    except Exception as e:
+                        print(f"Error scraping {url}: {e}")
+                    finally:
+                        # Replace pages that died with the request or have served enough
+                        uses[page] = uses.get(page, 0) + 1
+                        if page.is_closed() or uses[page] >= self.page_max_uses:
+                            page = await replace(page)
+                        if page is not None:
+                            pages.put_nowait(page)
+                        elif live == 0:
+                            # Wake the fetches still waiting so they fail fast
+                            pages.put_nowait(None)
+                    if not stop.is_set():
+                        emit((url, job))
+
+                await asyncio.gather(*(fetch(url) for url in urls))
+            finally:
+                await browser.close()
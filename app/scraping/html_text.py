@@ -0,0 +1,137 @@
+"""
+Job description HTML to plain text, with a choice of extractor:
+
+- "lxml" (default): one pass over the parsed tree. Headings and paragraphs
+  become their own lines separated by a blank line, list items become
+  "- " bullets (indented when nested), and everything else is collapsed
+  whitespace. No markdown emphasis, link syntax or hard wrapping, so
+  JobParser scans only the posting's words.
+- "html2text": the previous markdown-ish conversion, links dropped.
+
+set_extractor() picks the one html_to_text() uses for the whole process.
+"""
+import re
+from typing import Callable, Dict, List
+from app import metrics
+
+_HEADINGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+# Start on a fresh line, after a blank one
+_PARAGRAPHS = _HEADINGS | {"p", "ul", "ol", "dl", "table", "blockquote", "pre", "section", "article"}
+# Start on a fresh line
+_LINES = {"div", "li", "tr", "dt", "dd", "header", "footer", "figure", "figcaption", "hr"}
+_LISTS = {"ul", "ol"}
+_DROPPED = {"script", "style", "noscript", "template", "head", "svg", "button", "form"}
+
+_SPACES = re.compile(r"\s+")
+
+class _TextBuilder:
+    """Accumulates inline text and emits it as whole lines."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.inline: List[str] = []
+        self.prefix = ""
+        self.depth = 0  # list nesting
+
+    def text(self, value):
+        if value:
+            self.inline.append(value)
+
+    def line(self):
+        text = _SPACES.sub(" ", "".join(self.inline)).strip()
+        self.inline = []
+        if text:
+            self.lines.append(self.prefix + text)
+        self.prefix = ""
+
+    def blank(self):
+        self.line()
+        if self.lines and self.lines[-1]:
+            self.lines.append("")
+
+    def br(self):
+        # Two <br>s in a row are a paragraph break, as LinkedIn descriptions use them
+        if self.inline:
+            self.line()
+        else:
+            self.blank()
+
+    def walk(self, element):
+        tag = element.tag
+        if isinstance(tag, str):
+            tag = tag.lower()
+            if tag in _DROPPED:
+                self.text(element.tail)
+                return
+            # A list nested in a list item continues it rather than opening a paragraph
+            paragraph = tag in _PARAGRAPHS and not (tag in _LISTS and self.depth)
+            if tag == "br":
+                self.br()
+            elif paragraph:
+                self.blank()
+            elif tag in _LINES or tag in _LISTS:
+                self.line()
+            if tag == "li":
+                self.prefix = "  " * max(0, self.depth - 1) + "- "
+            elif tag in _LISTS:
+                self.depth += 1
+
+            self.text(element.text)
+            for child in element:
+                self.walk(child)
+
+            if tag in _LISTS:
+                self.depth -= 1
+            if paragraph:
+                self.blank()
+            elif tag in _LINES or tag in _LISTS:
+                self.line()
+        self.text(element.tail)
+
+    def result(self) -> str:
+        self.line()
+        while self.lines and not self.lines[-1]:
+            self.lines.pop()
+        return "\n".join(self.lines)
+
+def lxml_text(raw_html: str) -> str:
+    """Structure-preserving plain text from one lxml parse (see module docstring)."""
+    if not raw_html or not raw_html.strip():
+        return ""
+    import lxml.etree
+    import lxml.html
+    try:
+        root = lxml.html.document_fromstring(raw_html)
+    except (lxml.etree.ParserError, ValueError):
+        # Nothing but comments, or a str with an XML encoding declaration:
+        # html2text takes any input, and these are too rare to need structure
+        return html2text_text(raw_html).strip()
+    builder = _TextBuilder()
+    builder.walk(root)
+    return builder.result()
+
+def html2text_text(raw_html: str) -> str:
+    """Markdown-ish text from html2text, links dropped."""
+    import html2text
+    h = html2text.HTML2Text()
+    h.ignore_links = True
+    return h.handle(raw_html)
+
+EXTRACTORS: Dict[str, Callable[[str], str]] = {
+    "lxml": lxml_text,
+    "html2text": html2text_text,
+}
+
+_extractor = lxml_text
+
+def set_extractor(name: str):
+    """Selects the extractor html_to_text() uses, by EXTRACTORS name."""
+    global _extractor
+    if name not in EXTRACTORS:
+        raise ValueError(f"Unknown text extractor: {name} (choose from {', '.join(EXTRACTORS)})")
+    _extractor = EXTRACTORS[name]
+
+@metrics.timed("html_to_text")
+def html_to_text(raw_html: str) -> str:
+    """Job description HTML to plain text with the selected extractor."""
+    return _extractor(raw_html)
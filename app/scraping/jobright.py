@@ -1,14 +1,23 @@
-from typing import List, Optional
-from app.models.job import Job
-from app.scraping.base import BaseScraper
+import re
+from typing import Optional
+from urllib.parse import urlencode
+from app.scraping.structured import StructuredDataScraper
 
-class JobrightScraper(BaseScraper):
-    def scrape_job(self, url: str) -> Optional[Job]:
-        # TODO: Implement Jobright job details scraping
-        print(f"Scraping Jobright URL: {url}")
-        return None
+class JobrightScraper(StructuredDataScraper):
+    """
+    Jobright (jobright.ai). Job pages at /jobs/info/<id> are server-rendered
+    with the posting in __NEXT_DATA__ (and JSON-LD on most pages).
+    """
+    SOURCE = "jobright"
+    BASE_URL = "https://jobright.ai"
+    JOB_URL_TEMPLATE = "https://jobright.ai/jobs/info/{id}"
+    JOB_LINK_PATTERN = re.compile(r'href="((?:https://jobright\.ai)?/jobs/info/[\w-]+)[^"]*"')
 
-    def search_jobs(self, query: str, location: str, limit: int = 10) -> List[Job]:
-        # TODO: Implement Jobright search
-        print(f"Searching Jobright for {query} in {location}")
-        return []
+    ID_KEYS = ["jobId", "id"]
+    TITLE_KEYS = ["jobTitle", "title"]
+    COMPANY_KEYS = ["companyName", "company.companyName", "company.name", "company"]
+    LOCATION_KEYS = ["jobLocation", "location", "locations"]
+    DESCRIPTION_KEYS = ["jobSummary", "jobDescription", "description"]
+
+    def search_url(self, query: str, location: str, filters: Optional[dict] = None) -> str:
+        return f"{self.BASE_URL}/jobs/search?{urlencode({'value': query, 'location': location})}"
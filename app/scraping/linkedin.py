@@ -1,8 +1,38 @@
+import asyncio
+import time
 from typing import List, Optional
+from app import metrics
 from app.models.job import Job
+from app.scraping import linkedin_html
 from app.scraping.base import BaseScraper
+from app.scraping.rate_limiter import THROTTLE_STATUSES, HostRateLimiter, is_timeout, retry_after
 
 class LinkedInScraper(BaseScraper):
+    """
+    Scrapes LinkedIn's public job views and search results with Playwright.
+    search_mode: "paginated" (guest endpoint by offset) or "scroll".
+    """
+
+    # Selector fallbacks for the public job view, tried in order
+    COMPANY_SELECTORS = linkedin_html.COMPANY_SELECTORS
+    LOCATION_SELECTORS = linkedin_html.LOCATION_SELECTORS
+    DESCRIPTION_SELECTORS = linkedin_html.DESCRIPTION_SELECTORS
+
+    def __init__(
+        self,
+        playwright,
+        headless: bool = True,
+        cache=None,
+        search_mode: str = "paginated",
+        search_concurrency: int = 4,
+        search_requests_per_second: float = 2.0,
+        **kwargs
+    ):
+        super().__init__(playwright, headless=headless, cache=cache, **kwargs)
+        self.search_mode = search_mode
+        self.search_concurrency = search_concurrency
+        self.search_limiter = HostRateLimiter(search_requests_per_second, burst=search_concurrency)
+
     def start_browser(self):
         # Override to inject random User-Agent
         from fake_useragent import UserAgent
@@ -11,13 +41,20 @@ class LinkedInScraper(BaseScraper):
         print(f"Starting browser with UA: {user_agent}")
         super().start_browser(user_agent=user_agent)
 
-    def _jitter(self, min_sec: float = 2.0, max_sec: float = 5.0):
-        """Random sleep to mimic human behavior."""
-        import time
-        import random
-        sleep_time = random.uniform(min_sec, max_sec)
-        print(f"Sleeping for {sleep_time:.2f}s...")
-        time.sleep(sleep_time)
+    def _check_response(self, url: str, response, page_url: str) -> bool:
+        """
+        Reports a navigation to the rate limiter: 429/503/999 and auth-wall
+        redirects back it off (the caller records success once the job card
+        renders). Returns whether the page is usable.
+        """
+        status = response.status if response else 0
+        if status in THROTTLE_STATUSES:
+            self.rate_limiter.record_throttle(url, f"http_{status}", retry_after(response.headers))
+            return False
+        if linkedin_html.is_auth_wall(page_url):
+            self.rate_limiter.record_throttle(url, "auth_wall")
+            return False
+        return True
 
     def scrape_job(self, url: str) -> Optional[Job]:
         """
@@ -25,276 +62,302 @@ class LinkedInScraper(BaseScraper):
         Note: LinkedIn acts differently for logged-in vs public views.
         This focuses on the public job view.
         """
+        cached = self._cached_job(url)
+        if cached:
+            return cached
+
+        # Pacing is the caller's rate_limiter (see limiter_for), which this
+        # method feeds with how LinkedIn responded
         print(f"Scraping LinkedIn URL: {url}")
         
-        # Jitter before action
-        self._jitter(1.0, 3.0)
-        
+        started = time.monotonic()
         page = self.get_page()
         try:
             # direct navigation to the job URL
             # Reduced timeout to 15s to fail fast
-            page.goto(url, wait_until="domcontentloaded", timeout=15000)
+            load_started = time.monotonic()
+            with metrics.span("page.goto"):
+                response = page.goto(url, wait_until="domcontentloaded", timeout=15000)
+            self.metrics.record_page_load(time.monotonic() - load_started)
+            if not self._check_response(url, response, page.url):
+                print("Throttled or auth walled by LinkedIn")
+                return None
             
             # Simple check to see if we got a job page or auth wall
             # Common public job page selectors
             try:
                 # Wait for title to appear
-                page.wait_for_selector(".top-card-layout__title, h1", timeout=5000)
+                with metrics.span("page.wait_for_selector"):
+                    page.wait_for_selector(".top-card-layout__title, h1", timeout=5000)
             except Exception:
+                self.rate_limiter.record_throttle(url, "timeout")
                 print("Could not find job title - possibly auth walled or invalid URL")
                 return None
 
-            title = page.locator(".top-card-layout__title").first.or_(page.locator("h1").first).inner_text().strip()
-            
-            # Company
-            # Strategy: Try multiple specific selectors, fallback to anything that looks like a company link/text
-            company_selectors = [
-                ".top-card-layout__first-subline .topcard__org-name-link",
-                ".job-details-jobs-unified-top-card__company-name",
-                ".topcard__org-name-link",
-                "a[data-tracking-control-name='public_jobs_topcard-org-name']"
-            ]
-            company = "Unknown Company"
-            for selector in company_selectors:
-                el = page.locator(selector).first
-                if el.count():
-                    company = el.inner_text().strip()
-                    break
-
-            # Location
-            location_selectors = [
-                ".top-card-layout__first-subline .topcard__flavor--bullet",
-                ".job-details-jobs-unified-top-card__primary-description span",
-                "span.topcard__flavor--bullet"
-            ]
-            
-            location = "Unknown Location"
-            for selector in location_selectors:
-                el = page.locator(selector).first
-                if el.count():
-                    location = el.inner_text().strip()
-                    break
-
-            # Description (using html2text to clean)
-            import html2text
-            h = html2text.HTML2Text()
-            h.ignore_links = True
-            
-            # Show more button might need clicking if it exists, though usually full text is in DOM
-            # .show-more-less-html__markup is common for public pages
-            desc_locator = page.locator(".show-more-less-html__markup").first
-            if not desc_locator.count():
-                 desc_locator = page.locator("#job-details").first
-            
-            raw_html = desc_locator.inner_html() if desc_locator.count() else ""
-            description = h.handle(raw_html)
-            
-            # Jitter inside page just in case we need to act more human
-            self._jitter(0.5, 1.5)
-
-            return Job(
-                id=url, # using URL as ID for now
-                title=title,
-                company=company,
-                location=location,
-                description=description,
-                url=url,
-                source="linkedin",
-                raw_data={"html_content_length": len(raw_html)}
-            )
+            # Every field, with its selector fallbacks, in one round-trip
+            fields = page.evaluate(_EXTRACT_JOB_JS, linkedin_html.JOB_SELECTORS)
+            if not fields:
+                self.rate_limiter.record_throttle(url, "auth_wall")
+                print("Could not find job title - possibly auth walled or invalid URL")
+                return None
+            self.rate_limiter.record_success(url)
 
         except Exception as e:
+            if is_timeout(e):
+                self.rate_limiter.record_throttle(url, "timeout")
             print(f"Error scraping LinkedIn: {e}")
             return None
         finally:
-            page.close()
+            self.release_page(page)
+
+        # The description is converted after the page is back in the pool
+        try:
+            job = self._build_job(
+                url, fields["title"], fields["company"], fields["location"], fields["description_html"]
+            )
+        except Exception as e:
+            print(f"Error scraping LinkedIn: {e}")
+            return None
+        self._store_job(job, started)
+        return job
+
+    async def scrape_job_async(self, page, url: str) -> Optional[Job]:
+        """
+        Same extraction as scrape_job, on a pooled async page. Pacing is left
+        to the caller's rate limiter, which this reports to like scrape_job.
+        """
+        print(f"Scraping LinkedIn URL: {url}")
+        load_started = time.monotonic()
+        try:
+            with metrics.span("page.goto"):
+                response = await page.goto(url, wait_until="domcontentloaded", timeout=15000)
+        except Exception as e:
+            if is_timeout(e):
+                self.rate_limiter.record_throttle(url, "timeout")
+            raise
+        self.metrics.record_page_load(time.monotonic() - load_started)
+        if not self._check_response(url, response, page.url):
+            print("Throttled or auth walled by LinkedIn")
+            return None
+        try:
+            with metrics.span("page.wait_for_selector"):
+                await page.wait_for_selector(".top-card-layout__title, h1", timeout=5000)
+        except Exception:
+            self.rate_limiter.record_throttle(url, "timeout")
+            print("Could not find job title - possibly auth walled or invalid URL")
+            return None
 
-    def search_jobs(self, query: str, location: str, filters: dict = None, limit: int = 10) -> List[Job]:
+        fields = await page.evaluate(_EXTRACT_JOB_JS, linkedin_html.JOB_SELECTORS)
+        if not fields:
+            self.rate_limiter.record_throttle(url, "auth_wall")
+            print("Could not find job title - possibly auth walled or invalid URL")
+            return None
+        self.rate_limiter.record_success(url)
+
+        # Off the event loop, which is driving every other pooled page meanwhile
+        return await asyncio.to_thread(
+            self._build_job, url, fields["title"], fields["company"], fields["location"], fields["description_html"]
+        )
+
+    def _build_job(self, url: str, title: str, company: str, location: str, raw_html: str) -> Job:
+        return linkedin_html.build_job(url, title, company, location, raw_html)
+
+    def search_jobs(self, query: str, location: str, filters: dict = None, limit: int = 10) -> tuple:
         """
         Searches for jobs on LinkedIn (public view) with filters.
         filters: dict with keys 'time' (str), 'experience' (List[str])
+
+        The first page comes from the rendered search page. In "paginated"
+        mode the rest is fetched by offset from the guest endpoint, several
+        pages per round; "scroll" mode drives the infinite scroller instead.
+        Returns: (List[Job], str_total_count)
         """
         print(f"Searching LinkedIn for '{query}' in '{location}' with filters: {filters}")
         page = self.get_page()
-        jobs_found = []
-        
-        try:
-            # Construct search URL
-            base_url = "https://www.linkedin.com/jobs/search"
-            params = [
-                f"keywords={query}",
-                f"location={location}"
-            ]
-            
-            if filters:
-                # Time filter
-                t_filter = filters.get("time", "").lower()
-                if t_filter:
-                    if t_filter == "24h":
-                        params.append("f_TPR=r86400")
-                    elif t_filter == "week":
-                        params.append("f_TPR=r604800")
-                    elif t_filter == "month":
-                         params.append("f_TPR=r2592000")
-                    elif t_filter.endswith("h"):
-                        # Granular: 1h, 12h, etc.
-                        try:
-                            hours = int(t_filter[:-1])
-                            seconds = hours * 3600
-                            params.append(f"f_TPR=r{seconds}")
-                        except:
-                            # Fallback if parse fails
-                            pass
-                     
-                # Experience filter
-                # 1=Internship, 2=Entry level, 3=Associate, 4=Mid-Senior, 5=Director, 6=Executive
-                # LinkedIn joins these with commas: f_E=2,3
-                exp_map = {
-                    "internship": "1",
-                    "entry": "2",
-                    "associate": "3",
-                    "mid_senior": "4",
-                    "director": "5"
-                }
-                exp_vals = []
-                for level in filters.get("experience", []):
-                    if val := exp_map.get(level.lower()):
-                        exp_vals.append(val)
-                
-                if exp_vals:
-                    params.append(f"f_E={','.join(exp_vals)}")
-            
-            # Enforce "Most Recent" sort order
-            params.append("sortBy=DD")
 
-            search_url = f"{base_url}?{'&'.join(params)}"
+        try:
+            search_url = linkedin_html.search_url(query, location, filters)
             print(f"URL: {search_url}")
             
-            self._jitter(1.0, 2.0)
-            page.goto(search_url, wait_until="domcontentloaded", timeout=20000)
-            
-            # Extract Total Job Count (Best Attempt)
-            total_jobs_text = "Unknown"
-            try:
-                # Selectors for result count: usually "1,000+" or "54"
-                count_el = page.locator(".results-context-header__job-count").first
-                if count_el.count():
-                    total_jobs_text = count_el.inner_text().strip()
-            except:
-                pass
-            
-            print(f"Indices say: {total_jobs_text} total jobs found.")
+            self.rate_limiter.acquire(search_url)
+            with metrics.span("page.goto"):
+                response = page.goto(search_url, wait_until="domcontentloaded", timeout=20000)
+            if not self._check_response(search_url, response, page.url):
+                print("Search was throttled or auth walled by LinkedIn")
+                return [], "0"
 
             # Wait for job list to load
             try:
-                page.wait_for_selector(".jobs-search__results-list li, ul.jobs-search__results-list", timeout=10000)
+                with metrics.span("page.wait_for_selector"):
+                    page.wait_for_selector(".jobs-search__results-list li, ul.jobs-search__results-list", timeout=10000)
             except:
                 print("No results found or page structure changed.")
                 return [], "0"
- 
-            # Dynamic Scroll Loop
-            # We want to load enough jobs to satisfy 'limit'.
-            # LinkedIn loads ~25 jobs per scroll usually.
-            print(f"Scrolling to load at least {limit} jobs...")
-            
-            current_count = 0
-            retries = 0
-            while current_count < limit and retries < 5:
-                # Scroll to bottom
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                self._jitter(1.5, 3.0)
-                
-                # Check new count
-                job_cards_locator = page.locator(".jobs-search__results-list li")
-                new_count = job_cards_locator.count()
-                
-                if new_count == current_count:
-                    # No new jobs loaded? Try 'See more' button if exists
-                    try:
-                        see_more_btn = page.locator("button.infinite-scroller__show-more-button").first
-                        if see_more_btn.count() and see_more_btn.is_visible():
-                            print("Clicking 'See more jobs' button...")
-                            see_more_btn.click()
-                            self._jitter(2.0, 4.0)
-                        else:
-                            retries += 1
-                    except:
-                        retries += 1
-                else:
-                    retries = 0 # Reset retries if we found more jobs
-                    print(f"Loaded {new_count} jobs so far...")
-                
-                current_count = new_count
-                
-                # Safety break
-                if retries >= 3:
-                     print("Suggests end of list or stuck. Stopping scroll.")
-                     break
-
-            # Extract job cards
-            job_cards = page.locator(".jobs-search__results-list li")
-            count = job_cards.count()
-            print(f"Final Count on Page: {count}. Processing top {limit}...")
-
-            for i in range(min(count, limit)):
-                card = job_cards.nth(i)
-                try:
-                    # Link usually is in an 'a' tag with class 'base-card__full-link' or similar
-                    link_el = card.locator("a.base-card__full-link").first
-                    if not link_el.count():
-                         link_el = card.locator("a").first # Fallback
-                    
-                    url = link_el.get_attribute("href")
-                    if not url: continue
-                    
-                    # Clean URL (remove tracking params)
-                    if "?" in url:
-                        url = url.split("?")[0]
-                        
-                    title = card.locator(".base-search-card__title").first.inner_text().strip()
-                    company = card.locator(".base-search-card__subtitle").first.inner_text().strip()
-                    
-                    # Extract "posted" text for Repost detection
-                    # Usually in a 'time' tag or '.job-search-card__listdate'
-                    posted_text = ""
-                    time_el = card.locator("time").first
-                    if time_el.count():
-                        posted_text = time_el.inner_text().strip()
-                    
-                    # REPOST DETECTION V3: Broad Sweep
-                    # Check entire card text for "repost"
-                    card_text = card.inner_text().lower()
-                    
-                    is_repost = False
-                    if "repost" in card_text:
-                        is_repost = True
-                        if "repost" not in posted_text.lower():
-                             posted_text = f"{posted_text} (Reposted)" 
-                        elif not any(x in posted_text.lower() for x in ["repost", "ago"]):
-                             # If posted_text is empty or weird, just set it
-                             posted_text = "Reposted"
-
-                    # Create placeholder job
-                    jobs_found.append(Job(
-                        id=url, 
-                        title=title,
-                        company=company,
-                        location=location, # Default to search loc if specific not found
-                        description="", # Empty for now
-                        url=url,
-                        source="linkedin",
-                        raw_data={"posted_text": posted_text}
-                    ))
-                    
-                except Exception as e:
-                    print(f"Error parsing card {i}: {e}")
-                    continue
 
+            if self.search_mode == "scroll":
+                self._scroll_results(page, limit)
+
+            # All cards and the result count in one evaluate instead of a
+            # locator round-trip per card field
+            total_jobs_text, cards = self._extract_cards(page)
+            print(f"Indices say: {total_jobs_text} total jobs found.")
+
+            if self.search_mode == "paginated" and len(cards) < limit:
+                print(f"Fetching result pages by offset until {limit} jobs...")
+                cards = linkedin_html.collect_cards(
+                    cards,
+                    lambda offsets: self._fetch_result_pages(page, query, location, filters, offsets),
+                    limit,
+                    concurrency=self.search_concurrency
+                )
+
+            print(f"Final Count: {len(cards)}. Processing top {limit}...")
+            jobs_found = [linkedin_html.card_to_job(card, location) for card in cards[:limit]]
+            self._store_cards(jobs_found)
             return jobs_found, total_jobs_text
 
         except Exception as e:
             print(f"Error during search: {e}")
             return [], "0"
         finally:
-            page.close()
+            self.release_page(page)
+
+    def _extract_cards(self, page) -> tuple:
+        """Returns (total_count_text, cards) for the rendered search page."""
+        result = page.evaluate(_EXTRACT_CARDS_JS, {
+            "card": linkedin_html.CARD_SELECTOR,
+            "fields": linkedin_html.CARD_SELECTORS,
+            "count": linkedin_html.COUNT_SELECTOR,
+        })
+        cards = []
+        for raw in result["cards"]:
+            card = linkedin_html.card_from_fields(
+                raw["url"], raw["title"], raw["company"], raw["posted_text"], raw["card_text"], raw["location"]
+            )
+            if card:
+                cards.append(card)
+        return result["total"] or "Unknown", cards
+
+    def _fetch_result_pages(self, page, query: str, location: str, filters: dict, offsets) -> List[str]:
+        """
+        Fetches guest result pages for `offsets` concurrently from inside the
+        page (same origin, same cookies) in a single evaluate call.
+        """
+        urls = [linkedin_html.search_url(query, location, filters, start=offset) for offset in offsets]
+        for url in urls:
+            self.search_limiter.acquire(url)
+        return page.evaluate(_FETCH_PAGES_JS, urls)
+
+    def _scroll_results(self, page, limit: int):
+        """Legacy infinite-scroll loading, kept for when the guest endpoint is unavailable."""
+        # LinkedIn loads ~25 jobs per scroll usually.
+        print(f"Scrolling to load at least {limit} jobs...")
+
+        current_count = 0
+        retries = 0
+        while current_count < limit and retries < 5:
+            # Each scroll fetches more results, so it is paced like any request
+            self.rate_limiter.acquire(page.url)
+            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            self._wait_for_more_cards(page, current_count)
+
+            # Check new count
+            new_count = page.locator(".jobs-search__results-list li").count()
+
+            if new_count == current_count:
+                # No new jobs loaded? Try 'See more' button if exists
+                try:
+                    see_more_btn = page.locator("button.infinite-scroller__show-more-button").first
+                    if see_more_btn.count() and see_more_btn.is_visible():
+                        print("Clicking 'See more jobs' button...")
+                        self.rate_limiter.acquire(page.url)
+                        see_more_btn.click()
+                        self._wait_for_more_cards(page, current_count)
+                    else:
+                        retries += 1
+                except:
+                    retries += 1
+            else:
+                retries = 0 # Reset retries if we found more jobs
+                print(f"Loaded {new_count} jobs so far...")
+
+            current_count = new_count
+
+            # Safety break
+            if retries >= 3:
+                print("Suggests end of list or stuck. Stopping scroll.")
+                break
+
+    def _wait_for_more_cards(self, page, count: int, timeout: float = 5000):
+        """Waits until the result list grows past `count` cards (or the timeout, e.g. at the end)."""
+        try:
+            with metrics.span("page.wait_for_selector"):
+                page.wait_for_function(
+                    "n => document.querySelectorAll('.jobs-search__results-list li').length > n",
+                    arg=count, timeout=timeout
+                )
+        except Exception:
+            pass
+
+# Job view fields; each selector list is tried in order inside the page.
+# Returns null when there is no title (auth wall or invalid URL).
+_EXTRACT_JOB_JS = """
+(selectors) => {
+    const first = (list) => {
+        for (const selector of list) {
+            const el = document.querySelector(selector);
+            if (el) return el;
+        }
+        return null;
+    };
+    const title = first(selectors.title);
+    if (!title) return null;
+    const company = first(selectors.company);
+    const location = first(selectors.location);
+    const description = first(selectors.description);
+    return {
+        title: title.innerText.trim(),
+        company: company ? company.innerText.trim() : "Unknown Company",
+        location: location ? location.innerText.trim() : "Unknown Location",
+        description_html: description ? description.innerHTML : ""
+    };
+}
+"""
+
+# Raw fields of every search card plus the result count
+_EXTRACT_CARDS_JS = """
+(args) => {
+    const first = (root, list) => {
+        for (const selector of list) {
+            const el = root.querySelector(selector);
+            if (el) return el;
+        }
+        return null;
+    };
+    const text = (el) => el ? el.innerText.trim() : "";
+    const cards = Array.from(document.querySelectorAll(args.card)).map((card) => {
+        const link = first(card, args.fields.link);
+        return {
+            url: link ? link.getAttribute("href") : null,
+            title: text(first(card, args.fields.title)),
+            company: text(first(card, args.fields.company)),
+            location: text(first(card, args.fields.location)),
+            posted_text: text(first(card, args.fields.posted)),
+            card_text: card.innerText
+        };
+    });
+    return {total: text(document.querySelector(args.count)), cards: cards};
+}
+"""
+
+# Fetches several URLs in parallel from the page; failed pages come back empty
+_FETCH_PAGES_JS = """
+async (urls) => Promise.all(urls.map(async (url) => {
+    try {
+        const response = await fetch(url, {credentials: "include"});
+        return response.ok ? await response.text() : "";
+    } catch (e) {
+        return "";
+    }
+}))
+"""
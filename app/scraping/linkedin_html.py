@@ -0,0 +1,271 @@
+"""
+Parsing of LinkedIn's server-rendered public HTML (job views and search
+cards), shared by the browser scraper and the plain-HTTP scraper.
+"""
+from html import escape
+from typing import Callable, List, Optional, Sequence
+from urllib.parse import urlencode
+from app.models.job import Job
+from app.scraping.html_text import html_to_text
+
+BASE_URL = "https://www.linkedin.com"
+SEARCH_PATH = "/jobs/search"
+# Guest pagination endpoint: returns bare <li> cards for ?start=<offset>
+GUEST_SEARCH_PATH = "/jobs-guest/jobs/api/seeMoreJobPostings/search"
+
+# Selector fallbacks for the public job view, tried in order
+TITLE_SELECTORS = [
+    ".top-card-layout__title",
+    "h1"
+]
+COMPANY_SELECTORS = [
+    ".top-card-layout__first-subline .topcard__org-name-link",
+    ".job-details-jobs-unified-top-card__company-name",
+    ".topcard__org-name-link",
+    "a[data-tracking-control-name='public_jobs_topcard-org-name']"
+]
+LOCATION_SELECTORS = [
+    ".top-card-layout__first-subline .topcard__flavor--bullet",
+    ".job-details-jobs-unified-top-card__primary-description span",
+    "span.topcard__flavor--bullet"
+]
+DESCRIPTION_SELECTORS = [
+    ".show-more-less-html__markup",
+    "#job-details"
+]
+JOB_SELECTORS = {
+    "title": TITLE_SELECTORS,
+    "company": COMPANY_SELECTORS,
+    "location": LOCATION_SELECTORS,
+    "description": DESCRIPTION_SELECTORS,
+}
+
+# Search result cards
+CARD_SELECTOR = ".jobs-search__results-list li"
+CARD_SELECTORS = {
+    "link": ["a.base-card__full-link", "a"],
+    "title": [".base-search-card__title"],
+    "company": [".base-search-card__subtitle"],
+    "location": [".job-search-card__location"],
+    "posted": ["time"],
+}
+COUNT_SELECTOR = ".results-context-header__job-count"
+
+# Experience filter values
+# 1=Internship, 2=Entry level, 3=Associate, 4=Mid-Senior, 5=Director, 6=Executive
+EXPERIENCE_CODES = {
+    "internship": "1",
+    "entry": "2",
+    "associate": "3",
+    "mid_senior": "4",
+    "director": "5"
+}
+
+# Where LinkedIn sends logged-out visitors it will not serve
+AUTH_WALL_MARKERS = ("/authwall", "/login", "/signup", "/checkpoint", "/uas/")
+
+def search_params(query: str, location: str, filters: Optional[dict] = None) -> List[tuple]:
+    """
+    Query parameters for a public job search, most recent first.
+    filters: dict with keys 'time' (24h, week, month or <n>h) and 'experience' (List[str])
+    """
+    params = [("keywords", query), ("location", location)]
+    filters = filters or {}
+
+    t_filter = (filters.get("time") or "").lower()
+    if t_filter == "24h":
+        params.append(("f_TPR", "r86400"))
+    elif t_filter == "week":
+        params.append(("f_TPR", "r604800"))
+    elif t_filter == "month":
+        params.append(("f_TPR", "r2592000"))
+    elif t_filter.endswith("h"):
+        # Granular: 1h, 12h, etc.
+        try:
+            params.append(("f_TPR", f"r{int(t_filter[:-1]) * 3600}"))
+        except ValueError:
+            pass
+
+    # LinkedIn joins these with commas: f_E=2,3
+    exp_vals = [EXPERIENCE_CODES[level.lower()] for level in filters.get("experience", [])
+                if level.lower() in EXPERIENCE_CODES]
+    if exp_vals:
+        params.append(("f_E", ",".join(exp_vals)))
+
+    # Enforce "Most Recent" sort order
+    params.append(("sortBy", "DD"))
+    return params
+
+def search_url(query: str, location: str, filters: Optional[dict] = None,
+               start: Optional[int] = None, base_url: str = BASE_URL) -> str:
+    """Full search page URL, or the guest pagination URL when `start` is given."""
+    params = search_params(query, location, filters)
+    if start is None:
+        return f"{base_url}{SEARCH_PATH}?{urlencode(params, safe=',')}"
+    params.append(("start", str(start)))
+    return f"{base_url}{GUEST_SEARCH_PATH}?{urlencode(params, safe=',')}"
+
+def clean_job_url(url: str) -> str:
+    """Drops tracking parameters from a job link."""
+    return url.split("?")[0]
+
+def is_auth_wall(url: str) -> bool:
+    """True when a (final, post-redirect) URL is a sign-in or challenge page."""
+    return any(marker in url for marker in AUTH_WALL_MARKERS)
+
+def _doc(html: str):
+    import lxml.html
+    return lxml.html.fromstring((html or "").strip() or "<html></html>")
+
+def _first(root, selectors: List[str]):
+    for selector in selectors:
+        found = root.cssselect(selector)
+        if found:
+            return found[0]
+    return None
+
+def _text(el) -> str:
+    return " ".join(el.text_content().split()) if el is not None else ""
+
+def inner_html(el) -> str:
+    import lxml.html
+    parts = [escape(el.text or "", quote=False)]
+    parts.extend(lxml.html.tostring(child, encoding="unicode") for child in el)
+    return "".join(parts)
+
+def parse_job_page(html: str) -> Optional[dict]:
+    """
+    Extracts title, company, location and description HTML from a public
+    job view. Returns None when there is no job title (auth wall or bad URL).
+    """
+    root = _doc(html)
+    title = _text(_first(root, JOB_SELECTORS["title"]))
+    if not title:
+        return None
+
+    company_el = _first(root, JOB_SELECTORS["company"])
+    location_el = _first(root, JOB_SELECTORS["location"])
+    desc_el = _first(root, JOB_SELECTORS["description"])
+    return {
+        "title": title,
+        "company": _text(company_el) if company_el is not None else "Unknown Company",
+        "location": _text(location_el) if location_el is not None else "Unknown Location",
+        "description_html": inner_html(desc_el) if desc_el is not None else "",
+    }
+
+def parse_total_count(html: str) -> str:
+    """Result count from the full search page, e.g. "1,000+"."""
+    el = _first(_doc(html), [COUNT_SELECTOR])
+    return _text(el) if el is not None else "Unknown"
+
+def card_from_fields(url: Optional[str], title: str, company: str, posted_text: str, card_text: str,
+                     location: str = "") -> Optional[dict]:
+    """
+    Normalizes raw card fields (from lxml or an in-page evaluate) into a card
+    dict with url, title, company, location and posted_text. None without a link.
+    """
+    if not url:
+        return None
+    # Repost detection: check the entire card text for "repost"
+    if "repost" in card_text.lower() and "repost" not in posted_text.lower():
+        posted_text = f"{posted_text} (Reposted)"
+    return {
+        "url": clean_job_url(url),
+        "title": title,
+        "company": company,
+        "location": location,
+        "posted_text": posted_text,
+    }
+
+def parse_search_cards(html: str) -> List[dict]:
+    """
+    Parses job cards from a search page or a guest pagination fragment.
+    Each card is a dict with url, title, company, location and posted_text.
+    """
+    root = _doc(html)
+    cards = root.cssselect(CARD_SELECTOR) or root.xpath("//li")
+
+    results = []
+    for card in cards:
+        link_el = _first(card, CARD_SELECTORS["link"])
+        parsed = card_from_fields(
+            link_el.get("href") if link_el is not None else None,
+            _text(_first(card, CARD_SELECTORS["title"])),
+            _text(_first(card, CARD_SELECTORS["company"])),
+            _text(_first(card, CARD_SELECTORS["posted"])),
+            card.text_content(),
+            _text(_first(card, CARD_SELECTORS["location"]))
+        )
+        if parsed:
+            results.append(parsed)
+    return results
+
+def collect_cards(
+    first_cards: List[dict],
+    fetch_pages: Callable[[Sequence[int]], List[str]],
+    limit: int,
+    concurrency: int = 4
+) -> List[dict]:
+    """
+    Pages through guest search results after `first_cards` until `limit`
+    cards are collected or a page comes back empty.
+
+    fetch_pages(offsets) returns the HTML for each offset, in order. The first
+    call fetches one page to learn the page size; after that each call asks
+    for up to `concurrency` pages at once.
+    """
+    cards = list(first_cards)
+    seen = {card["url"] for card in cards}
+    offset = len(cards)
+    page_size = None
+
+    while len(cards) < limit:
+        if page_size is None:
+            offsets = [offset]
+        else:
+            wanted = -(-(limit - len(cards)) // page_size)
+            offsets = [offset + i * page_size for i in range(max(1, min(concurrency, wanted)))]
+
+        exhausted = False
+        for html in fetch_pages(offsets):
+            page_cards = parse_search_cards(html) if html else []
+            if not page_cards:
+                # Pages after an empty one are empty too
+                exhausted = True
+                break
+            page_size = page_size or len(page_cards)
+            offset += len(page_cards)
+            for card in page_cards:
+                if card["url"] not in seen:
+                    seen.add(card["url"])
+                    cards.append(card)
+        if exhausted:
+            break
+    return cards[:limit]
+
+def build_job(url: str, title: str, company: str, location: str, raw_html: str) -> Job:
+    description = html_to_text(raw_html)
+
+    return Job(
+        id=url, # using URL as ID for now
+        title=title,
+        company=company,
+        location=location,
+        description=description,
+        url=url,
+        source="linkedin",
+        raw_data={"html_content_length": len(raw_html), "description_html": raw_html}
+    )
+
+def card_to_job(card: dict, location: str) -> Job:
+    """Placeholder Job for a search card; the description comes from the detail scrape."""
+    return Job(
+        id=card["url"],
+        title=card["title"],
+        company=card["company"],
+        location=card.get("location") or location, # Default to search loc if specific not found
+        description="", # Empty for now
+        url=card["url"],
+        source="linkedin",
+        raw_data={"posted_text": card["posted_text"]}
+    )
@@ -0,0 +1,278 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Optional, Sequence, Tuple
+from app.models.job import Job
+from app.scraping import linkedin_html
+from app.scraping.base import BaseScraper
+from app.scraping.rate_limiter import THROTTLE_STATUSES, HostRateLimiter, is_healthy, is_timeout, retry_after
+
+# Responses LinkedIn uses to turn away logged-out clients; a browser session may get through.
+# Rate limiting (THROTTLE_STATUSES) is a failed fetch to back off from, not a wall.
+BLOCKED_STATUSES = {401, 403}
+
+class LinkedInHttpScraper(BaseScraper):
+    """
+    Browserless LinkedIn scraper.
+
+    Public job views and the guest search pagination endpoint are
+    server-rendered, so a pooled keep-alive HTTP client plus lxml produce the
+    same Job objects as LinkedInScraper without running Chromium. The browser
+    scraper is only started (lazily) for URLs that hit an auth wall.
+    """
+
+    def __init__(
+        self,
+        playwright=None,
+        headless: bool = True,
+        cache=None,
+        base_url: str = linkedin_html.BASE_URL,
+        browser_fallback: bool = True,
+        timeout: float = 15.0,
+        search_concurrency: int = 4,
+        search_requests_per_second: float = 2.0,
+        client=None,
+        **kwargs
+    ):
+        super().__init__(playwright, headless=headless, cache=cache, **kwargs)
+        self.base_url = base_url.rstrip("/")
+        self.browser_fallback = browser_fallback
+        self.timeout = timeout
+        self.search_concurrency = search_concurrency
+        self.search_limiter = HostRateLimiter(search_requests_per_second, burst=search_concurrency)
+        self.fallbacks = 0
+        self._client = client
+        self._fallback: Optional[BaseScraper] = None
+        self._owned_playwright = None
+
+    def start_browser(self):
+        """No browser to start; opens the HTTP client instead."""
+        self._get_client()
+
+    def stop_browser(self):
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        if self._fallback is not None:
+            self._fallback.stop_browser()
+            self._fallback = None
+        if self._owned_playwright is not None:
+            self._owned_playwright.stop()
+            self._owned_playwright = None
+
+    def _get_client(self):
+        if self._client is None:
+            import httpx
+            from fake_useragent import UserAgent
+            try:
+                import h2  # noqa: F401 (HTTP/2 needs the optional h2 package)
+                http2 = True
+            except ImportError:
+                http2 = False
+
+            user_agent = UserAgent(platforms="desktop").random
+            print(f"Starting HTTP client (HTTP/2: {http2}) with UA: {user_agent}")
+            self._client = httpx.Client(
+                http2=http2,
+                follow_redirects=True,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                headers={
+                    "User-Agent": user_agent,
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                    "Accept-Language": "en-US,en;q=0.9",
+                }
+            )
+        return self._client
+
+    def _get(self, url: str):
+        """GET with page metrics; returns (response, walled)."""
+        started = time.monotonic()
+        try:
+            response = self._get_client().get(url)
+        except Exception as e:
+            if is_timeout(e):
+                self.rate_limiter.record_throttle(url, "timeout")
+            raise
+        self.metrics.record_page_load(time.monotonic() - started)
+        self.metrics.record_request(blocked=False)
+        self.metrics.record_bytes(len(response.content))
+
+        walled = (response.status_code in BLOCKED_STATUSES
+                  or linkedin_html.is_auth_wall(str(response.url)))
+        if response.status_code in THROTTLE_STATUSES:
+            self.rate_limiter.record_throttle(url, f"http_{response.status_code}", retry_after(response.headers))
+        elif walled:
+            self.rate_limiter.record_throttle(url, "auth_wall")
+        elif is_healthy(response.status_code):
+            self.rate_limiter.record_success(url)
+        return response, walled
+
+    def _scrape_http(self, url: str) -> Tuple[Optional[Job], bool]:
+        """
+        Fetches and parses one job view. Returns (job, needs_browser).
+        Safe to call from worker threads: it never touches Playwright.
+        """
+        started = time.monotonic()
+        try:
+            response, walled = self._get(url)
+        except Exception as e:
+            print(f"Error fetching {url}: {e}")
+            return None, False
+        if response.status_code in THROTTLE_STATUSES:
+            # The limiter is backing off; retrying in the browser would only hit the host again
+            print(f"Throttled (HTTP {response.status_code}) at {url}")
+            return None, False
+        if walled:
+            print(f"Auth wall at {url}")
+            return None, True
+        if response.status_code >= 400:
+            print(f"HTTP {response.status_code} for {url}")
+            return None, False
+
+        fields = linkedin_html.parse_job_page(response.text)
+        if not fields:
+            # Expired, removed or invalid postings; auth walls were caught above,
+            # and nothing else is worth starting Chromium for
+            print(f"Could not find job title at {url} - posting expired or invalid")
+            return None, False
+
+        job = linkedin_html.build_job(
+            url, fields["title"], fields["company"], fields["location"], fields["description_html"]
+        )
+        self._store_job(job, started)
+        return job, False
+
+    def _browser_scraper(self) -> BaseScraper:
+        if self._fallback is None:
+            from app.scraping.linkedin import LinkedInScraper
+            playwright = self.playwright
+            if playwright is None:
+                from playwright.sync_api import sync_playwright
+                self._owned_playwright = sync_playwright().start()
+                playwright = self._owned_playwright
+            self._fallback = LinkedInScraper(
+                playwright,
+                headless=self.headless,
+                cache=self.cache,
+                block_resources=self.block_resources,
+                page_max_uses=self.page_max_uses
+            )
+            # One set of page metrics and one rate budget for the whole run
+            self._fallback.metrics = self.metrics
+            self._fallback.rate_limiter = self.rate_limiter
+            self._fallback.start_browser()
+        return self._fallback
+
+    def _scrape_with_browser(self, url: str) -> Optional[Job]:
+        if not self.browser_fallback:
+            return None
+        self.fallbacks += 1
+        print(f"Falling back to the browser for {url}")
+        # A second request to the host, so it waits out any cooldown the wall just set
+        self.rate_limiter.acquire(url)
+        return self._browser_scraper().scrape_job(url)
+
+    def scrape_job(self, url: str) -> Optional[Job]:
+        cached = self._cached_job(url)
+        if cached:
+            return cached
+
+        print(f"Fetching LinkedIn URL: {url}")
+        job, needs_browser = self._scrape_http(url)
+        if needs_browser:
+            return self._scrape_with_browser(url)
+        return job
+
+    def scrape_jobs_concurrently(
+        self,
+        urls: Sequence[str],
+        concurrency: int = 4,
+        requests_per_second: float = 0.5
+    ) -> Iterator[Tuple[str, Optional[Job]]]:
+        """
+        Fetches job views on a thread pool sharing the pooled client and a
+        per-host rate limiter. Auth-walled URLs are retried with the browser
+        on the calling thread, since sync Playwright is bound to it.
+        """
+        limiter = self.limiter_for(requests_per_second)
+
+        def fetch(url: str) -> Tuple[Optional[Job], bool]:
+            cached = self._cached_job(url)
+            if cached:
+                return cached, False
+            limiter.acquire(url)
+            print(f"Fetching LinkedIn URL: {url}")
+            return self._scrape_http(url)
+
+        self._get_client()
+        pool = ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="http-scraper")
+        try:
+            futures = {pool.submit(fetch, url): url for url in urls}
+            for future in as_completed(futures):
+                url = futures[future]
+                job, needs_browser = future.result()
+                if needs_browser:
+                    job = self._scrape_with_browser(url)
+                yield url, job
+        finally:
+            # A consumer that stops early should not wait for the whole queue
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _fetch_result_pages(self, query: str, location: str, filters: dict, offsets) -> List[str]:
+        """Fetches guest result pages for `offsets` in parallel; failed pages come back empty."""
+        def fetch(offset: int) -> str:
+            url = linkedin_html.search_url(query, location, filters, start=offset, base_url=self.base_url)
+            self.search_limiter.acquire(url)
+            try:
+                response, walled = self._get(url)
+            except Exception as e:
+                print(f"Error fetching results at offset {offset}: {e}")
+                return ""
+            return "" if walled or response.status_code >= 400 else response.text
+
+        with ThreadPoolExecutor(max_workers=len(offsets), thread_name_prefix="http-search") as pool:
+            return list(pool.map(fetch, offsets))
+
+    def search_jobs(self, query: str, location: str, filters: dict = None, limit: int = 10) -> tuple:
+        """
+        Searches public LinkedIn jobs: the first page comes from the search
+        page (which also carries the result count), further pages from the
+        guest pagination endpoint by offset, several at a time.
+        Returns: (List[Job], str_total_count)
+        """
+        print(f"Searching LinkedIn (HTTP) for '{query}' in '{location}' with filters: {filters}")
+        url = linkedin_html.search_url(query, location, filters, base_url=self.base_url)
+        print(f"URL: {url}")
+
+        try:
+            self.search_limiter.acquire(url)
+            response, walled = self._get(url)
+            if response.status_code in THROTTLE_STATUSES:
+                print(f"Search was throttled (HTTP {response.status_code})")
+                return [], "0"
+            if walled:
+                if self.browser_fallback:
+                    self.fallbacks += 1
+                    print("Search hit an auth wall, falling back to the browser")
+                    return self._browser_scraper().search_jobs(query, location, filters=filters, limit=limit)
+                return [], "0"
+
+            total_jobs_text = linkedin_html.parse_total_count(response.text)
+            print(f"Indices say: {total_jobs_text} total jobs found.")
+
+            cards = linkedin_html.parse_search_cards(response.text)
+            if len(cards) < limit:
+                cards = linkedin_html.collect_cards(
+                    cards,
+                    lambda offsets: self._fetch_result_pages(query, location, filters, offsets),
+                    limit,
+                    concurrency=self.search_concurrency
+                )
+                print(f"Loaded {len(cards)} jobs.")
+        except Exception as e:
+            print(f"Error during search: {e}")
+            return [], "0"
+
+        jobs_found: List[Job] = [linkedin_html.card_to_job(card, location) for card in cards[:limit]]
+        self._store_cards(jobs_found)
+        return jobs_found, total_jobs_text
@@ -0,0 +1,222 @@
+import queue
+import threading
+from contextlib import AbstractContextManager
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
+from app.models.job import Job
+from app.normalization.fingerprint import company_title_key, normalize_company, normalize_locations, normalize_title
+from app.scraping.base import BaseScraper
+
+_DONE = object()
+
+ScraperFactory = Callable[[], AbstractContextManager]
+
+def merge_search_result(full_job: Job, search_result: Job) -> Job:
+    """Fills gaps in a detail scrape with what the search card already told us."""
+    if full_job.company == "Unknown Company": full_job.company = search_result.company
+    if full_job.location == "Unknown Location": full_job.location = search_result.location
+    return full_job
+
+class CrossSourceIndex:
+    """
+    Postings claimed so far, keyed by normalized company + title. Two
+    postings from different sources are the same job when their locations
+    also agree (for multi-location postings, when any place is shared); a
+    posting with no specific location matches any location under its key.
+    Postings from the same source are never merged: a board listing one
+    title in several cities means several openings. Postings without a
+    known company and title (link-only search cards) are not claimed, since
+    they would all share one key; they are checked once detailed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, List[Tuple[Optional[FrozenSet[str]], str, str]]] = {}
+
+    def claim(self, source: str, company: str, title: str, location: str, url: str) -> Optional[str]:
+        """Registers the posting and returns None, or returns the URL it duplicates."""
+        if not normalize_title(title) or normalize_company(company) in ("", "unknown company"):
+            return None
+        key = company_title_key(company, title)
+        places = normalize_locations(location)
+        with self._lock:
+            entries = self._entries.setdefault(key, [])
+            for other_places, other_source, other_url in entries:
+                if other_url == url:
+                    return None
+                if other_source == source:
+                    continue
+                if places is None or other_places is None or places & other_places:
+                    return other_url
+            entries.append((places, source, url))
+            return None
+
+class ScrapeOrchestrator:
+    """
+    Runs several scrapers at once, one thread per source, each with its own
+    per-host rate limiter. Search results are deduplicated across sources
+    before any detail page is fetched, so a job cross-posted to three boards
+    costs one detail scrape; detailed jobs are checked once more (with their
+    full company/location) before they are yielded for scoring.
+
+    `sources` maps a source name to a factory returning a context manager
+    that yields a started BaseScraper. `skip_card` can veto search cards
+    before detailing (e.g. URLs already known to be re-listings). The factory runs on the source's own
+    thread, which keeps sync Playwright on the thread that created it.
+    `saved_search(source)` can return that source's cards from an earlier,
+    interrupted run instead of searching again; `on_search(cards, source)`
+    is told about each fresh search.
+    """
+
+    def __init__(
+        self,
+        sources: Dict[str, ScraperFactory],
+        requests_per_second: float = 0.5,
+        rate_limits: Optional[Dict[str, float]] = None,
+        concurrency: int = 1,
+        queue_size: int = 64,
+        skip_card: Optional[Callable[[Job], bool]] = None,
+        saved_search: Optional[Callable[[str], Optional[List[Job]]]] = None,
+        on_search: Optional[Callable[[List[Job], str], None]] = None
+    ):
+        self.sources = sources
+        self.requests_per_second = requests_per_second
+        self.rate_limits = rate_limits or {}
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.skip_card = skip_card
+        self.saved_search = saved_search
+        self.on_search = on_search
+
+        self.cards = CrossSourceIndex()
+        self.details = CrossSourceIndex()
+        self.stats: Dict[str, Dict[str, int]] = {
+            name: {"results": 0, "duplicates": 0, "skipped": 0, "scraped": 0, "failed": 0, "errors": 0} for name in sources
+        }
+        self.page_metrics: Dict[str, dict] = {}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, source: str, field: str, n: int = 1):
+        with self._stats_lock:
+            self.stats[source][field] += n
+
+    def run(self, query: str, location: str, filters: Optional[dict] = None, limit: int = 10) -> Iterator[Job]:
+        """Yields unique detailed jobs from all sources as they complete."""
+        results: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        threads = [
+            threading.Thread(
+                target=self._run_source,
+                args=(name, factory, query, location, filters, limit, results, stop),
+                name=f"source-{name}",
+                daemon=True
+            )
+            for name, factory in self.sources.items()
+        ]
+        for thread in threads:
+            thread.start()
+
+        remaining = len(threads)
+        try:
+            while remaining:
+                item = results.get()
+                if item is _DONE:
+                    remaining -= 1
+                    continue
+                source, job = item
+                duplicate = self.details.claim(source, job.company, job.title, job.location, job.url)
+                if duplicate:
+                    print(f"   [{source}] {job.title} @ {job.company} duplicates {duplicate}, skipping")
+                    self._count(source, "duplicates")
+                    continue
+                yield job
+        finally:
+            stop.set()
+            # Unblock producers waiting on a full queue
+            while any(t.is_alive() for t in threads):
+                try:
+                    results.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+
+    def _put(self, results: queue.Queue, item, stop: threading.Event) -> bool:
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _run_source(self, name, factory, query, location, filters, limit, results, stop):
+        try:
+            with factory() as scraper:
+                try:
+                    cards = self.saved_search(name) if self.saved_search else None
+                    if cards is not None:
+                        print(f"[{name}] Reusing {len(cards)} saved search results")
+                        total = str(len(cards))
+                    else:
+                        cards, total = scraper.search_jobs(query, location, filters=filters, limit=limit)
+                        if self.on_search:
+                            self.on_search(cards, name)
+                    self._count(name, "results", len(cards))
+
+                    unique = []
+                    for card in cards:
+                        if self.skip_card and self.skip_card(card):
+                            self._count(name, "skipped")
+                            continue
+                        duplicate = self.cards.claim(name, card.company, card.title, card.location, card.url)
+                        if duplicate:
+                            self._count(name, "duplicates")
+                        else:
+                            unique.append(card)
+                    print(f"[{name}] {len(cards)} results ({total} total), "
+                          f"{len(unique)} new after cross-source dedupe")
+
+                    for job in self._details(name, scraper, unique, stop):
+                        if not self._put(results, (name, job), stop):
+                            break
+                finally:
+                    self.page_metrics[name] = dict(scraper.metrics.summary(), rates=scraper.rate_limiter.rates())
+        except Exception as e:
+            print(f"[{name}] source failed: {e}")
+            self._count(name, "errors")
+        finally:
+            results.put(_DONE)
+
+    def _details(self, name: str, scraper: BaseScraper, cards: List[Job], stop: threading.Event) -> Iterator[Job]:
+        rps = self.rate_limits.get(name, self.requests_per_second)
+        by_url = {card.url: card for card in cards}
+
+        if self.concurrency > 1:
+            pairs = scraper.scrape_jobs_concurrently(list(by_url), concurrency=self.concurrency,
+                                                     requests_per_second=rps)
+            for url, job in pairs:
+                if stop.is_set():
+                    pairs.close()
+                    return
+                if job:
+                    self._count(name, "scraped")
+                    yield merge_search_result(job, by_url[url])
+                else:
+                    self._count(name, "failed")
+            return
+
+        limiter = scraper.limiter_for(rps)
+        for url, card in by_url.items():
+            if stop.is_set():
+                return
+            # Cached jobs skip the network, so they need no politeness wait
+            if not (scraper.cache and scraper.cache.has_job(url)):
+                limiter.acquire(url)
+            job = scraper.scrape_job(url)
+            if job:
+                self._count(name, "scraped")
+                yield merge_search_result(job, card)
+            else:
+                self._count(name, "failed")
+
+    def report(self) -> dict:
+        with self._stats_lock:
+            return {name: dict(stats, pages=self.page_metrics.get(name, {})) for name, stats in self.stats.items()}
@@ -0,0 +1,161 @@
+import threading
+from typing import Callable, Iterable, List, Optional
+from urllib.parse import urlparse
+
+# Resource types a scraper never reads: dropping them saves bandwidth and render time
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet", "imageset", "texttrack"}
+
+# Analytics and ad hosts (matched as host suffixes)
+TRACKER_DOMAINS = (
+    "doubleclick.net",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "facebook.net",
+    "bat.bing.com",
+    "px.ads.linkedin.com",
+    "snap.licdn.com",
+    "sc.lfeeder.com",
+    "hotjar.com",
+    "scorecardresearch.com",
+)
+
+def should_block(resource_type: str, url: str,
+                 blocked_types: Iterable[str] = BLOCKED_RESOURCE_TYPES,
+                 tracker_domains: Iterable[str] = TRACKER_DOMAINS) -> bool:
+    if resource_type in blocked_types:
+        return True
+    host = urlparse(url).hostname or ""
+    return any(host == d or host.endswith("." + d) for d in tracker_domains)
+
+class ScrapeMetrics:
+    """
+    Per-run page metrics: load times, requests allowed/blocked and bytes
+    received (from Content-Length, so chunked responses count as 0).
+    Shared by the sync scraper and the concurrent pool, hence the lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.page_loads: List[float] = []
+        self.requests_allowed = 0
+        self.requests_blocked = 0
+        self.bytes_received = 0
+        self.pages_created = 0
+        self.pages_recycled = 0
+        self.contexts_recycled = 0
+
+    def record_page_load(self, seconds: float):
+        with self._lock:
+            self.page_loads.append(seconds)
+
+    def record_request(self, blocked: bool):
+        with self._lock:
+            if blocked:
+                self.requests_blocked += 1
+            else:
+                self.requests_allowed += 1
+
+    def record_bytes(self, length: int):
+        with self._lock:
+            self.bytes_received += length
+
+    def on_response(self, response):
+        """Playwright 'response' event handler."""
+        try:
+            length = int(response.headers.get("content-length", 0))
+        except (TypeError, ValueError):
+            length = 0
+        self.record_bytes(length)
+
+    def summary(self) -> dict:
+        with self._lock:
+            loads = sorted(self.page_loads)
+            n = len(loads)
+            return {
+                "pages_loaded": n,
+                "avg_load_seconds": round(sum(loads) / n, 3) if n else 0.0,
+                "p95_load_seconds": round(loads[min(n - 1, int(n * 0.95))], 3) if n else 0.0,
+                "requests_allowed": self.requests_allowed,
+                "requests_blocked": self.requests_blocked,
+                "bytes_received": self.bytes_received,
+                "avg_bytes_per_page": self.bytes_received // n if n else 0,
+                "pages_created": self.pages_created,
+                "pages_recycled": self.pages_recycled,
+                "contexts_recycled": self.contexts_recycled,
+            }
+
+class PagePool:
+    """
+    Warm, reusable pages for the sync scraper.
+
+    Released pages go back to an idle list (up to `max_idle`) instead of being
+    closed. A page is recycled after `page_max_uses` checkouts, and the whole
+    context after it has created `context_max_pages` pages, which bounds the
+    memory a long run can accumulate in one browser context.
+    """
+
+    def __init__(self, new_context: Callable[[], object], metrics: Optional[ScrapeMetrics] = None,
+                 max_idle: int = 1, page_max_uses: int = 25, context_max_pages: int = 200):
+        self._new_context = new_context
+        self.metrics = metrics or ScrapeMetrics()
+        self.max_idle = max(1, max_idle)
+        self.page_max_uses = max(1, page_max_uses)
+        self.context_max_pages = max(1, context_max_pages)
+
+        self.context = None
+        self._idle: List[object] = []
+        self._uses = {}
+        self._out = 0
+        self._context_pages = 0
+
+    def acquire(self):
+        while self._idle:
+            page = self._idle.pop()
+            if not page.is_closed():
+                self._out += 1
+                return page
+            self._uses.pop(page, None)
+
+        if self.context is not None and self._context_pages >= self.context_max_pages and self._out == 0:
+            self._close_context()
+            self.metrics.contexts_recycled += 1
+        if self.context is None:
+            self.context = self._new_context()
+            self._context_pages = 0
+
+        page = self.context.new_page()
+        self._context_pages += 1
+        self.metrics.pages_created += 1
+        self._uses[page] = 0
+        self._out += 1
+        return page
+
+    def release(self, page):
+        self._out = max(0, self._out - 1)
+        uses = self._uses.get(page, 0) + 1
+        self._uses[page] = uses
+        if page.is_closed():
+            self._uses.pop(page, None)
+            return
+        if uses >= self.page_max_uses or len(self._idle) >= self.max_idle:
+            self._uses.pop(page, None)
+            page.close()
+            self.metrics.pages_recycled += 1
+            return
+        self._idle.append(page)
+
+    def close(self):
+        self._close_context()
+
+    def _close_context(self):
+        for page in self._idle:
+            self._uses.pop(page, None)
+        self._idle = []
+        if self.context is not None:
+            try:
+                self.context.close()
+            except Exception:
+                pass
+            self.context = None
@@ -0,0 +1,196 @@
+import asyncio
+import email.utils
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
+from app import metrics
+
+# Statuses that mean "slow down" regardless of site (999 is LinkedIn's bot block)
+THROTTLE_STATUSES = {429, 503, 999}
+
+def is_timeout(error: BaseException) -> bool:
+    """Timeouts from the standard library, httpx or Playwright (none share a base class)."""
+    return isinstance(error, TimeoutError) or "Timeout" in type(error).__name__
+
+def is_healthy(status: int) -> bool:
+    """Whether a response status should speed an adaptive limiter up (2xx/3xx)."""
+    return 200 <= status < 400
+
+def retry_after(headers) -> Optional[float]:
+    """Seconds asked for by a Retry-After header (delta-seconds or HTTP date), if any."""
+    value = headers.get("retry-after") if headers else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+class TokenBucket:
+    """
+    Token bucket allowing `rate` requests per second with bursts of up to `burst`.
+    Thread-safe; callers reserve a slot and then sleep for the returned delay,
+    either blocking (`acquire`) or from a coroutine (`acquire_async`).
+    """
+
+    def __init__(self, rate: float, burst: int = 1, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes one token and returns how long the caller must wait before using it.
+        Tokens may go negative, which queues callers behind each other fairly.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        delay = self.reserve()
+        if delay > 0:
+            metrics.observe("rate_limit_wait", delay)
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        delay = self.reserve()
+        if delay > 0:
+            metrics.observe("rate_limit_wait", delay)
+            await asyncio.sleep(delay)
+
+class AdaptiveRateController(TokenBucket):
+    """
+    TokenBucket whose rate follows how the site responds (AIMD): every
+    healthy response adds `increase` req/s, up to `max_rate`; a throttling
+    signal (auth wall, timeout, HTTP 429/503/999) multiplies the rate by
+    `decrease`, down to `min_rate`, and holds new requests back for a
+    cooldown that doubles with each consecutive throttle, or the server's
+    Retry-After if longer (up to `max_backoff` seconds). Defaults are relative to the starting rate:
+    between 1/16x and 4x, +10% of it per healthy response.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        min_rate: Optional[float] = None,
+        max_rate: Optional[float] = None,
+        increase: Optional[float] = None,
+        decrease: float = 0.5,
+        backoff: float = 2.0,
+        max_backoff: float = 120.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        super().__init__(rate, burst, clock)
+        self.min_rate = min_rate or rate / 16
+        self.max_rate = max_rate or rate * 4
+        self.increase = increase or rate / 10
+        self.decrease = decrease
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.successes = 0
+        self.throttles = 0
+        self.consecutive_throttles = 0
+
+    def record_success(self):
+        with self._lock:
+            self._refill()
+            self.successes += 1
+            self.consecutive_throttles = 0
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def record_throttle(self, retry_after: Optional[float] = None) -> float:
+        """Backs off; returns the cooldown in seconds, at least the server's Retry-After."""
+        with self._lock:
+            self._refill()
+            self.throttles += 1
+            self.consecutive_throttles += 1
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            cooldown = self.backoff * 2 ** (self.consecutive_throttles - 1)
+            cooldown = min(self.max_backoff, max(cooldown, retry_after or 0.0))
+            # Debt in tokens: the next reservation waits out the cooldown, later ones queue behind it
+            self._tokens = min(self._tokens, 0.0) - cooldown * self.rate
+            return cooldown
+
+class HostRateLimiter:
+    """
+    Keeps one TokenBucket per host so that concurrent workers share a single
+    request budget for each site instead of sleeping a fixed time per request.
+    With `adaptive`, each host gets an AdaptiveRateController instead, fed
+    through record_success / record_throttle; `adaptive_args` go to it.
+    """
+
+    def __init__(self, requests_per_second: float = 1.0, burst: int = 1, adaptive: bool = False, **adaptive_args):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.adaptive = adaptive
+        self.adaptive_args = adaptive_args
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host(url: str) -> str:
+        return urlparse(url).netloc or url
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        host = self.host(url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                if self.adaptive:
+                    bucket = AdaptiveRateController(self.requests_per_second, self.burst, **self.adaptive_args)
+                else:
+                    bucket = TokenBucket(self.requests_per_second, self.burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def record_success(self, url: str):
+        """A healthy response from url's host; speeds an adaptive limiter up."""
+        bucket = self.bucket_for(url)
+        if isinstance(bucket, AdaptiveRateController):
+            bucket.record_success()
+            metrics.gauge("rate_limit_rps", bucket.rate, host=self.host(url))
+
+    def record_throttle(self, url: str, reason: str, retry_after: Optional[float] = None):
+        """The host pushed back (auth wall, timeout, 429/503/999); an adaptive limiter backs off."""
+        host = self.host(url)
+        metrics.inc("throttles", host=host, reason=reason)
+        bucket = self.bucket_for(url)
+        if isinstance(bucket, AdaptiveRateController):
+            cooldown = bucket.record_throttle(retry_after)
+            metrics.gauge("rate_limit_rps", bucket.rate, host=host)
+            print(f"Throttled by {host} ({reason}): {bucket.rate:.2f} req/s, pausing {cooldown:.0f}s")
+
+    def rates(self) -> Dict[str, float]:
+        """Current requests per second for each host seen so far."""
+        with self._lock:
+            return {host: bucket.rate for host, bucket in self._buckets.items()}
+
+    def acquire(self, url: str):
+        self.bucket_for(url).acquire()
+
+    async def acquire_async(self, url: str):
+        await self.bucket_for(url).acquire_async()
@@ -1,14 +1,23 @@
-from typing import List, Optional
-from app.models.job import Job
-from app.scraping.base import BaseScraper
+import re
+from typing import Optional
+from urllib.parse import urlencode
+from app.scraping.structured import StructuredDataScraper
 
-class SimplifyScraper(BaseScraper):
-    def scrape_job(self, url: str) -> Optional[Job]:
-        # TODO: Implement Simplify job details scraping
-        print(f"Scraping Simplify URL: {url}")
-        return None
+class SimplifyScraper(StructuredDataScraper):
+    """
+    Simplify (simplify.jobs). Postings at /p/<uuid> carry schema.org
+    JobPosting JSON-LD; the search page lists them in __NEXT_DATA__.
+    """
+    SOURCE = "simplify"
+    BASE_URL = "https://simplify.jobs"
+    JOB_URL_TEMPLATE = "https://simplify.jobs/p/{id}"
+    JOB_LINK_PATTERN = re.compile(r'href="((?:https://simplify\.jobs)?/p/[\w-]+)[^"]*"')
 
-    def search_jobs(self, query: str, location: str, limit: int = 10) -> List[Job]:
-        # TODO: Implement Simplify search
-        print(f"Searching Simplify for {query} in {location}")
-        return []
+    ID_KEYS = ["id", "uuid"]
+    TITLE_KEYS = ["title", "position"]
+    COMPANY_KEYS = ["company.name", "company_name", "companyName"]
+    LOCATION_KEYS = ["locations", "location"]
+    DESCRIPTION_KEYS = ["description"]
+
+    def search_url(self, query: str, location: str, filters: Optional[dict] = None) -> str:
+        return f"{self.BASE_URL}/jobs?{urlencode({'query': query, 'location': location})}"
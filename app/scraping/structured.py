@@ -0,0 +1,314 @@
+"""
+Job boards built on Next.js (Jobright, Simplify) ship their data in the HTML
+as schema.org JobPosting JSON-LD and/or the __NEXT_DATA__ props blob, so they
+can be scraped over plain HTTP without rendering anything.
+"""
+import json
+import re
+import time
+from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urljoin
+from pydantic import ValidationError
+from app.models.job import Job
+from app.scraping.base import BaseScraper
+from app.scraping.html_text import html_to_text
+from app.scraping.rate_limiter import THROTTLE_STATUSES, is_healthy, is_timeout, retry_after
+
+_JSON_LD = re.compile(r'<script[^>]+type="application/ld\+json"[^>]*>(.*?)</script>', re.S | re.I)
+_NEXT_DATA = re.compile(r'<script[^>]+id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.S | re.I)
+
+def _walk(node: Any) -> Iterator[dict]:
+    """Every dict in a JSON tree, depth first."""
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            yield item
+            stack.extend(reversed(list(item.values())))
+        elif isinstance(item, list):
+            stack.extend(reversed(item))
+
+def _loads(raw: str) -> Any:
+    try:
+        return json.loads(raw.strip())
+    except ValueError:
+        return None
+
+def json_ld_blocks(html: str) -> List[Any]:
+    return [data for data in (_loads(raw) for raw in _JSON_LD.findall(html)) if data is not None]
+
+def next_data(html: str) -> Any:
+    match = _NEXT_DATA.search(html)
+    return _loads(match.group(1)) if match else None
+
+def _is_type(node: dict, name: str) -> bool:
+    kind = node.get("@type")
+    return kind == name or (isinstance(kind, list) and name in kind)
+
+def _posting_location(posting: dict) -> str:
+    if posting.get("jobLocationType") == "TELECOMMUTE":
+        return "Remote"
+    locations = posting.get("jobLocation") or []
+    if isinstance(locations, dict):
+        locations = [locations]
+    names = []
+    for place in locations:
+        address = place.get("address", {}) if isinstance(place, dict) else {}
+        if isinstance(address, str):
+            names.append(address)
+            continue
+        parts = [address.get(k) for k in ("addressLocality", "addressRegion")]
+        name = ", ".join(p for p in parts if isinstance(p, str) and p)
+        if name:
+            names.append(name)
+    return "; ".join(dict.fromkeys(names))
+
+def parse_job_posting(html: str) -> Optional[dict]:
+    """
+    The first schema.org JobPosting in the page's JSON-LD as a dict with
+    title, company, location, description_html and posted_date (ISO string).
+    """
+    for block in json_ld_blocks(html):
+        for node in _walk(block):
+            if not _is_type(node, "JobPosting") or not node.get("title"):
+                continue
+            org = node.get("hiringOrganization") or {}
+            return {
+                "title": str(node["title"]).strip(),
+                "company": (org.get("name") if isinstance(org, dict) else str(org)) or "Unknown Company",
+                "location": _posting_location(node) or "Unknown Location",
+                "description_html": node.get("description") or "",
+                "posted_date": node.get("datePosted"),
+            }
+    return None
+
+def _pick(node: dict, keys: Sequence[str]) -> Any:
+    """First present key; dotted keys reach into nested dicts."""
+    for key in keys:
+        value = node
+        for part in key.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        if value not in (None, "", []):
+            return value
+    return None
+
+def _as_text(value: Any) -> str:
+    if isinstance(value, list):
+        return "; ".join(_as_text(v) for v in value if v)
+    if isinstance(value, dict):
+        return str(value.get("name") or value.get("value") or "")
+    return str(value or "").strip()
+
+class StructuredDataScraper(BaseScraper):
+    """
+    Base for boards that embed their job data as JSON in the page.
+
+    Subclasses set the URLs and the key names used in their __NEXT_DATA__
+    props; the key lists are tried in order, so a renamed field only needs a
+    new entry. Detail pages prefer JSON-LD JobPosting (a stable, public
+    schema) and fall back to __NEXT_DATA__.
+    """
+    SOURCE = ""
+    BASE_URL = ""
+    JOB_URL_TEMPLATE = ""  # formatted with id=
+    JOB_LINK_PATTERN = re.compile(r"$^")  # job links in the search page markup
+
+    ID_KEYS = ["id"]
+    TITLE_KEYS = ["title"]
+    COMPANY_KEYS = ["companyName", "company.name", "company"]
+    LOCATION_KEYS = ["location", "locations"]
+    DESCRIPTION_KEYS = ["description"]
+
+    def __init__(self, playwright=None, headless: bool = True, cache=None, client=None, timeout: float = 15.0, **kwargs):
+        super().__init__(playwright, headless=headless, cache=cache, **kwargs)
+        self.timeout = timeout
+        self._client = client
+
+    def start_browser(self):
+        """No browser needed; opens the HTTP client."""
+        self._get_client()
+
+    def stop_browser(self):
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            import httpx
+            from fake_useragent import UserAgent
+            self._client = httpx.Client(
+                follow_redirects=True,
+                timeout=self.timeout,
+                headers={
+                    "User-Agent": UserAgent(platforms="desktop").random,
+                    "Accept-Language": "en-US,en;q=0.9",
+                }
+            )
+        return self._client
+
+    def _fetch(self, url: str) -> Optional[str]:
+        started = time.monotonic()
+        try:
+            response = self._get_client().get(url)
+        except Exception as e:
+            if is_timeout(e):
+                self.rate_limiter.record_throttle(url, "timeout")
+            print(f"Error fetching {url}: {e}")
+            return None
+        self.metrics.record_page_load(time.monotonic() - started)
+        self.metrics.record_bytes(len(response.content))
+        # Other errors (403, 404, 500) neither speed the limiter up nor back it off
+        if response.status_code in THROTTLE_STATUSES:
+            self.rate_limiter.record_throttle(url, f"http_{response.status_code}", retry_after(response.headers))
+        elif is_healthy(response.status_code):
+            self.rate_limiter.record_success(url)
+        if response.status_code >= 400:
+            print(f"HTTP {response.status_code} for {url}")
+            return None
+        return response.text
+
+    @abstractmethod
+    def search_url(self, query: str, location: str, filters: Optional[dict] = None) -> str:
+        """The board's search page for a query."""
+
+    def job_url(self, job_id: str) -> str:
+        return self.JOB_URL_TEMPLATE.format(id=job_id)
+
+    def _record_fields(self, node: dict) -> Optional[dict]:
+        """Title/company/location of a job-like dict from __NEXT_DATA__, if it is one."""
+        job_id = _pick(node, self.ID_KEYS)
+        title = _pick(node, self.TITLE_KEYS)
+        company = _pick(node, self.COMPANY_KEYS)
+        if job_id is None or not isinstance(title, str) or not company:
+            return None
+        return {
+            "id": str(job_id),
+            "title": title.strip(),
+            "company": _as_text(company) or "Unknown Company",
+            "location": _as_text(_pick(node, self.LOCATION_KEYS)) or "Unknown Location",
+            "description_html": _as_text(_pick(node, self.DESCRIPTION_KEYS)),
+        }
+
+    def parse_search_page(self, html: str) -> List[dict]:
+        """Job records from __NEXT_DATA__, or bare job links when there is none."""
+        records = []
+        seen = set()
+        data = next_data(html)
+        if data is not None:
+            for node in _walk(data):
+                record = self._record_fields(node)
+                if record and record["id"] not in seen:
+                    seen.add(record["id"])
+                    record["url"] = self.job_url(record["id"])
+                    records.append(record)
+        if not records:
+            for href in self.JOB_LINK_PATTERN.findall(html):
+                url = urljoin(self.BASE_URL, href.split("?")[0])
+                if url not in seen:
+                    seen.add(url)
+                    records.append({"url": url, "title": "", "company": "Unknown Company",
+                                    "location": "Unknown Location"})
+        return records
+
+    def parse_job_page(self, html: str) -> Optional[dict]:
+        posting = parse_job_posting(html)
+        if posting:
+            return posting
+        data = next_data(html)
+        if data is not None:
+            for node in _walk(data):
+                record = self._record_fields(node)
+                if record and record["description_html"]:
+                    return record
+        return None
+
+    def _make_job(self, url: str, fields: dict) -> Job:
+        raw_html = fields.get("description_html") or ""
+        data = dict(
+            id=url,
+            title=fields["title"],
+            company=fields["company"],
+            location=fields["location"],
+            description=html_to_text(raw_html) if "<" in raw_html else raw_html,
+            url=url,
+            source=self.SOURCE,
+            posted_date=fields.get("posted_date"),
+            raw_data={"html_content_length": len(raw_html), "description_html": raw_html}
+        )
+        try:
+            return Job(**data)
+        except ValidationError:
+            # An unparseable datePosted should not cost us the job
+            data["posted_date"] = None
+            return Job(**data)
+
+    def scrape_job(self, url: str) -> Optional[Job]:
+        cached = self._cached_job(url)
+        if cached:
+            return cached
+
+        print(f"Scraping {self.SOURCE} URL: {url}")
+        started = time.monotonic()
+        html = self._fetch(url)
+        if html is None:
+            return None
+        fields = self.parse_job_page(html)
+        if not fields:
+            print(f"No job data found at {url}")
+            return None
+        job = self._make_job(url, fields)
+        self._store_job(job, started)
+        return job
+
+    def scrape_jobs_concurrently(
+        self,
+        urls: Sequence[str],
+        concurrency: int = 4,
+        requests_per_second: float = 0.5
+    ) -> Iterator[Tuple[str, Optional[Job]]]:
+        """Thread-pool fetching over the shared client, paced per host."""
+        limiter = self.limiter_for(requests_per_second)
+
+        def fetch(url: str) -> Optional[Job]:
+            if not (self.cache and self.cache.has_job(url)):
+                limiter.acquire(url)
+            return self.scrape_job(url)
+
+        self._get_client()
+        pool = ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix=f"{self.SOURCE}-scraper")
+        try:
+            futures = {pool.submit(fetch, url): url for url in urls}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def search_jobs(self, query: str, location: str, filters: dict = None, limit: int = 10) -> tuple:
+        """
+        Returns: (List[Job], str_total_count)
+        """
+        url = self.search_url(query, location, filters)
+        print(f"Searching {self.SOURCE} for '{query}' in '{location}': {url}")
+        html = self._fetch(url)
+        if html is None:
+            return [], "0"
+
+        records = self.parse_search_page(html)
+        jobs_found = [
+            Job(
+                id=record["url"],
+                title=record["title"],
+                company=record["company"],
+                location=record["location"],
+                description="",
+                url=record["url"],
+                source=self.SOURCE,
+                raw_data={}
+            )
+            for record in records[:limit]
+        ]
+        self._store_cards(jobs_found)
+        return jobs_found, str(len(records))
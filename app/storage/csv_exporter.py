@@ -1,10 +1,13 @@
 import csv
 from typing import List
+from app import metrics
 from app.models.normalized_job import NormalizedJob
 from app.models.job import Job
+from app.storage.export_rows import CSV_HEADERS, job_status
 
 class CsvExporter:
     @staticmethod
+    @metrics.timed("export.csv")
     def export_with_scores(
         normalized_jobs: List[NormalizedJob], 
         original_jobs: List[Job], 
@@ -19,13 +22,7 @@ class CsvExporter:
         # Create a lookup for original jobs
         job_map = {j.id: j for j in original_jobs}
         
-        headers = [
-            "Company", "Role", "Location", 
-            "Status", "Posted Text",
-            "OTPM Probability", "Recommendation",
-            "Visa Sponsorship", "Experience (Years)", "Skills Found", 
-            "URL"
-        ]
+        headers = CSV_HEADERS
         
         rows = []
         for i, n_job in enumerate(normalized_jobs):
@@ -33,10 +30,8 @@ class CsvExporter:
             if not orig: continue
             
             # Determine Status (Fresh vs Repost)
-            status = "Fresh"
+            status = job_status(orig)
             posted_text = orig.raw_data.get("posted_text", "")
-            if "repost" in posted_text.lower():
-                status = "Repost"
             
             row = [
                 orig.company,
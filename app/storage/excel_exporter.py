@@ -1,10 +1,13 @@
 import pandas as pd
 from typing import List
+from app import metrics
 from app.models.job import Job
 from app.models.normalized_job import NormalizedJob
+from app.storage.export_rows import AnalysisCounters, job_status
 
 class ExcelExporter:
     @staticmethod
+    @metrics.timed("export.excel")
     def export(
         normalized_jobs: List[NormalizedJob], 
         original_jobs: List[Job], 
@@ -21,6 +24,7 @@ class ExcelExporter:
         # 1. Prepare Data for 'Jobs' Sheet
         job_map = {j.id: j for j in original_jobs}
         data = []
+        counters = AnalysisCounters()
         
         if not scores: scores = [0.0] * len(normalized_jobs)
         if not recommendations: recommendations = ["N/A"] * len(normalized_jobs)
@@ -31,7 +35,9 @@ class ExcelExporter:
             
             # Repost Check
             posted_text = orig.raw_data.get("posted_text", "")
-            status = "Repost" if "repost" in posted_text.lower() else "Fresh"
+            status = job_status(orig)
+            score = float(f"{scores[i]:.2f}")
+            counters.add(status, score, recommendations[i], n_job.skill_mask)
             
             data.append({
                 "Company": orig.company,
@@ -39,7 +45,7 @@ class ExcelExporter:
                 "Location": orig.location,
                 "Status": status,
                 "Posted Text": posted_text,
-                "OTPM Probability": float(f"{scores[i]:.2f}"),
+                "OTPM Probability": score,
                 "Recommendation": recommendations[i],
                 "Visa Sponsorship": n_job.visa_sponsorship,
                 "Experience Years": n_job.experience_years,
@@ -51,35 +57,7 @@ class ExcelExporter:
         
         # 2. Prepare Data for 'Analysis' Sheet
         # Stats: Total Jobs, Fresh vs Repost, Avg OTPM, Visa Friendly Count, Top Skills
-        
-        total_jobs = len(df_jobs)
-        fresh_count = len(df_jobs[df_jobs["Status"] == "Fresh"]) if not df_jobs.empty else 0
-        repost_count = total_jobs - fresh_count
-        avg_score = df_jobs["OTPM Probability"].mean() if not df_jobs.empty else 0.0
-        
-        strong_apply_count = len(df_jobs[df_jobs["Recommendation"] == "STRONG APPLY"]) if not df_jobs.empty else 0
-        apply_count = len(df_jobs[df_jobs["Recommendation"] == "APPLY"]) if not df_jobs.empty else 0
-        
-        # Frequency of extracted skills
-        all_skills = []
-        for s_str in df_jobs["Skills Found"]:
-             if s_str:
-                 all_skills.extend([s.strip() for s in s_str.split(",") if s.strip()])
-        
-        from collections import Counter
-        skill_counts = Counter(all_skills).most_common(5)
-        top_skills_str = ", ".join([f"{k} ({v})" for k,v in skill_counts])
-        
-        analysis_data = [
-            {"Metric": "Total Jobs Found", "Value": total_jobs},
-            {"Metric": "Fresh Jobs", "Value": fresh_count},
-            {"Metric": "Reposts", "Value": repost_count},
-            {"Metric": "Average OTPM Score", "Value": f"{avg_score:.2f}"},
-            {"Metric": "Strong Apply Candidates", "Value": strong_apply_count},
-            {"Metric": "Apply Candidates", "Value": apply_count},
-            {"Metric": "Top 5 Needed Skills", "Value": top_skills_str}
-        ]
-        df_analysis = pd.DataFrame(analysis_data)
+        df_analysis = pd.DataFrame(counters.rows())
         
         # 3. Write to Excel
         try:
@@ -0,0 +1,88 @@
+from collections import Counter
+from typing import Dict, List
+import numpy as np
+from app.models.job import Job
+from app.normalization.skill_vocabulary import SkillVocabulary
+
+CSV_HEADERS = [
+    "Company", "Role", "Location", 
+    "Status", "Posted Text",
+    "OTPM Probability", "Recommendation",
+    "Visa Sponsorship", "Experience (Years)", "Skills Found", 
+    "URL"
+]
+
+EXCEL_HEADERS = [
+    "Company", "Role", "Location",
+    "Status", "Posted Text",
+    "OTPM Probability", "Recommendation",
+    "Visa Sponsorship", "Experience Years", "Skills Found",
+    "URL"
+]
+
+def job_status(job: Job) -> str:
+    """
+    Fresh vs Repost: the search card says so, or the near-duplicate index
+    matched the description to an earlier posting.
+    """
+    if job.raw_data.get("duplicate_of"):
+        return "Repost"
+    posted_text = job.raw_data.get("posted_text", "")
+    return "Repost" if "repost" in posted_text.lower() else "Fresh"
+
+class AnalysisCounters:
+    """
+    Running aggregates behind the 'Analysis' sheet.
+    Updated one row at a time, so memory does not grow with the job count:
+    skill bitsets are buffered and folded into per-skill-id counts in
+    blocks of BATCH rows with one array popcount each.
+    """
+    BATCH = 1024
+
+    def __init__(self):
+        self.total = 0
+        self.fresh = 0
+        self.score_sum = 0.0
+        self.recommendations: Counter = Counter()
+        self.vocabulary = SkillVocabulary.shared()
+        self.skill_counts = np.zeros(0, dtype=np.int64)
+        self._pending: List[int] = []
+
+    def add(self, status: str, score: float, recommendation: str, skill_mask: int):
+        self.total += 1
+        if status == "Fresh":
+            self.fresh += 1
+        self.score_sum += score
+        self.recommendations[recommendation] += 1
+        if skill_mask:
+            self._pending.append(skill_mask)
+            if len(self._pending) >= self.BATCH:
+                self._flush()
+
+    def _flush(self):
+        counts = self.vocabulary.counts(self._pending)
+        self._pending = []
+        if len(counts) > len(self.skill_counts):
+            counts[:len(self.skill_counts)] += self.skill_counts
+            self.skill_counts = counts
+        else:
+            self.skill_counts[:len(counts)] += counts
+
+    def top_skills(self, n: int = 5) -> List[tuple]:
+        """(skill, count) for the n most common skills; ties go to the lower skill id."""
+        self._flush()
+        order = np.argsort(-self.skill_counts, kind="stable")[:n]
+        return [(self.vocabulary.name(int(i)), int(self.skill_counts[i])) for i in order if self.skill_counts[i]]
+
+    def rows(self) -> List[Dict[str, object]]:
+        avg_score = self.score_sum / self.total if self.total else 0.0
+        top_skills_str = ", ".join([f"{k} ({v})" for k, v in self.top_skills(5)])
+        return [
+            {"Metric": "Total Jobs Found", "Value": self.total},
+            {"Metric": "Fresh Jobs", "Value": self.fresh},
+            {"Metric": "Reposts", "Value": self.total - self.fresh},
+            {"Metric": "Average OTPM Score", "Value": f"{avg_score:.2f}"},
+            {"Metric": "Strong Apply Candidates", "Value": self.recommendations["STRONG APPLY"]},
+            {"Metric": "Apply Candidates", "Value": self.recommendations["APPLY"]},
+            {"Metric": "Top 5 Needed Skills", "Value": top_skills_str}
+        ]
@@ -0,0 +1,126 @@
+import sqlite3
+import threading
+import time
+from typing import Iterable, Optional
+from app.models.job import Job
+
+class JobCache:
+    """
+    Persistent SQLite cache of scraped jobs keyed by URL (Job.id).
+
+    Two tables are kept: full detail scrapes ('jobs') and the lighter card
+    metadata returned by search_jobs ('cards'). Entries older than
+    `ttl_seconds` are treated as misses and purged lazily.
+    Safe to share between the main thread and the concurrent scraping pool.
+    """
+
+    def __init__(self, path: str = "job_cache.db", ttl_seconds: float = 7 * 24 * 3600):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                url TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                fetch_seconds REAL NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS cards (
+                url TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            );
+        """)
+        self._conn.commit()
+
+        # Counters for this process
+        self.job_hits = 0
+        self.job_misses = 0
+        self.card_hits = 0
+        self.card_misses = 0
+        self.saved_seconds = 0.0
+
+    # --- Detail scrapes ---
+
+    def get_job(self, url: str) -> Optional[Job]:
+        """Returns the cached Job for `url`, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, fetch_seconds FROM jobs WHERE url = ? AND fetched_at >= ?",
+                (url, self._cutoff())
+            ).fetchone()
+            if row is None:
+                self.job_misses += 1
+                return None
+            self.job_hits += 1
+            # Each hit saves roughly what the original scrape cost
+            self.saved_seconds += row[1]
+        return Job.model_validate_json(row[0])
+
+    def has_job(self, url: str) -> bool:
+        """Checks for a fresh entry without touching the hit/miss counters."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM jobs WHERE url = ? AND fetched_at >= ?", (url, self._cutoff())
+            ).fetchone()
+        return row is not None
+
+    def put_job(self, job: Job, fetch_seconds: float = 0.0):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs (url, payload, fetched_at, fetch_seconds) VALUES (?, ?, ?, ?)",
+                (job.id, job.model_dump_json(), time.time(), fetch_seconds)
+            )
+            self._conn.commit()
+
+    # --- Search cards ---
+
+    def get_card(self, url: str) -> Optional[Job]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM cards WHERE url = ? AND fetched_at >= ?", (url, self._cutoff())
+            ).fetchone()
+            if row is None:
+                self.card_misses += 1
+                return None
+            self.card_hits += 1
+        return Job.model_validate_json(row[0])
+
+    def put_cards(self, cards: Iterable[Job]):
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cards (url, payload, fetched_at) VALUES (?, ?, ?)",
+                [(c.id, c.model_dump_json(), now) for c in cards]
+            )
+            self._conn.commit()
+
+    # --- Maintenance ---
+
+    def purge_expired(self) -> int:
+        """Deletes expired entries and returns how many rows were removed."""
+        cutoff = self._cutoff()
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM jobs WHERE fetched_at < ?", (cutoff,)).rowcount
+            removed += self._conn.execute("DELETE FROM cards WHERE fetched_at < ?", (cutoff,)).rowcount
+            self._conn.commit()
+        return removed
+
+    def stats(self) -> dict:
+        lookups = self.job_hits + self.job_misses
+        return {
+            "job_hits": self.job_hits,
+            "job_misses": self.job_misses,
+            "job_hit_rate": self.job_hits / lookups if lookups else 0.0,
+            "card_hits": self.card_hits,
+            "card_misses": self.card_misses,
+            "browser_seconds_saved": self.saved_seconds,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _cutoff(self) -> float:
+        return time.time() - self.ttl_seconds
@@ -0,0 +1,181 @@
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from typing import List, Optional, Tuple
+import numpy as np
+from app.models.job import Job
+
+_WORDS = re.compile(r"[a-z0-9]+")
+
+# Mersenne-style modulus just above 2^32: (a * x + b) stays below 2^64 for
+# 32-bit shingle hashes and a < 2^31, so the permutation math fits in uint64.
+_PRIME = np.uint64(4294967311)
+
+class NearDuplicateIndex:
+    """
+    MinHash / LSH index over job descriptions, persisted in SQLite.
+
+    Descriptions are normalized and cut into word shingles; a job's MinHash
+    signature estimates Jaccard similarity between shingle sets. Signatures
+    are split into `bands` bands and each band is bucketed, so a lookup only
+    compares against jobs that share at least one bucket instead of the whole
+    history. With 16 bands of 8 rows the candidate curve rises around 0.7
+    similarity; candidates are then confirmed against `threshold`.
+    """
+
+    # SQLite's default limit on bound parameters is 999
+    _CHUNK = 500
+
+    def __init__(self, path: str = "job_cache.db", num_perm: int = 128, bands: int = 16,
+                 shingle_size: int = 5, threshold: float = 0.8, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.path = path
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2**31, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 2**31, size=num_perm, dtype=np.uint64)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS minhash (
+                job_id TEXT PRIMARY KEY,
+                signature BLOB NOT NULL,
+                duplicate_of TEXT,
+                similarity REAL,
+                added_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS minhash_bands (
+                band INTEGER NOT NULL,
+                bucket INTEGER NOT NULL,
+                job_id TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS minhash_bands_lookup ON minhash_bands (band, bucket);
+        """)
+        self._conn.commit()
+
+        self.checked = 0
+        self.duplicates = 0
+
+    def shingles(self, text: str) -> List[int]:
+        """32-bit hashes of the normalized text's word shingles."""
+        words = _WORDS.findall((text or "").lower())
+        if not words:
+            return []
+        k = min(self.shingle_size, len(words))
+        return list({
+            zlib.crc32(" ".join(words[i:i + k]).encode("utf-8"))
+            for i in range(len(words) - k + 1)
+        })
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        hashes = self.shingles(text)
+        if not hashes:
+            return None
+        x = np.asarray(hashes, dtype=np.uint64)[:, None]
+        return ((self._a * x + self._b) % _PRIME).min(axis=0)
+
+    def _buckets(self, signature: np.ndarray) -> List[Tuple[int, int]]:
+        buckets = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            digest = hashlib.blake2b(chunk, digest_size=8).digest()
+            buckets.append((band, int.from_bytes(digest, "big", signed=True)))
+        return buckets
+
+    def query(self, signature: np.ndarray, exclude_id: Optional[str] = None) -> Optional[Tuple[str, float]]:
+        """
+        Best prior match at or above the threshold, as (original job id,
+        estimated similarity). Matches that were themselves duplicates resolve
+        to the job they duplicate.
+        """
+        buckets = self._buckets(signature)
+        where = " OR ".join(["(band = ? AND bucket = ?)"] * len(buckets))
+        params = [value for pair in buckets for value in pair]
+        with self._lock:
+            candidates = [row[0] for row in self._conn.execute(
+                f"SELECT DISTINCT job_id FROM minhash_bands WHERE {where}", params
+            )]
+            candidates = [c for c in candidates if c != exclude_id]
+            if not candidates:
+                return None
+            rows = []
+            # A popular bucket can hold more candidates than one statement may bind
+            for chunk in self._chunks(candidates):
+                marks = ",".join("?" * len(chunk))
+                rows.extend(self._conn.execute(
+                    f"SELECT job_id, signature, duplicate_of FROM minhash WHERE job_id IN ({marks})", chunk
+                ))
+
+        best = None
+        for job_id, blob, duplicate_of in rows:
+            similarity = float(np.mean(np.frombuffer(blob, dtype=np.uint64) == signature))
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (duplicate_of or job_id, similarity)
+        if best and best[0] == exclude_id:
+            return None
+        return best
+
+    def _chunks(self, items: List[str]):
+        for i in range(0, len(items), self._CHUNK):
+            yield items[i:i + self._CHUNK]
+
+    def add(self, job_id: str, signature: np.ndarray, duplicate_of: Optional[str] = None,
+            similarity: Optional[float] = None):
+        with self._lock:
+            known = self._conn.execute("SELECT 1 FROM minhash WHERE job_id = ?", (job_id,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO minhash (job_id, signature, duplicate_of, similarity, added_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job_id, signature.astype(np.uint64).tobytes(), duplicate_of, similarity, time.time())
+            )
+            if known:
+                self._conn.execute("DELETE FROM minhash_bands WHERE job_id = ?", (job_id,))
+            self._conn.executemany(
+                "INSERT INTO minhash_bands (band, bucket, job_id) VALUES (?, ?, ?)",
+                [(band, bucket, job_id) for band, bucket in self._buckets(signature)]
+            )
+            self._conn.commit()
+
+    def check(self, job: Job) -> Optional[str]:
+        """
+        Matches a detailed job against everything seen before, records it, and
+        flags it in raw_data ("duplicate_of", "duplicate_similarity") when it
+        re-lists an earlier posting. Returns the original job id, if any.
+        """
+        signature = self.signature(job.description)
+        if signature is None:
+            return None
+        self.checked += 1
+        match = self.query(signature, exclude_id=job.id)
+        duplicate_of, similarity = match if match else (None, None)
+        self.add(job.id, signature, duplicate_of, similarity)
+        if duplicate_of:
+            self.duplicates += 1
+            job.raw_data["duplicate_of"] = duplicate_of
+            job.raw_data["duplicate_similarity"] = round(similarity, 3)
+        return duplicate_of
+
+    def known_duplicate(self, job_id: str) -> Optional[str]:
+        """The original a previously checked job was flagged as a re-listing of."""
+        with self._lock:
+            row = self._conn.execute("SELECT duplicate_of FROM minhash WHERE job_id = ?", (job_id,)).fetchone()
+        return row[0] if row else None
+
+    def stats(self) -> dict:
+        with self._lock:
+            indexed = self._conn.execute("SELECT COUNT(*) FROM minhash").fetchone()[0]
+        return {"indexed": indexed, "checked": self.checked, "duplicates": self.duplicates}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
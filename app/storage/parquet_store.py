@@ -0,0 +1,183 @@
+import os
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+from app.models.job import Job
+from app.models.normalized_job import NormalizedJob
+
+class ParquetJobStore:
+    """
+    Columnar store of scraped jobs, their normalization and OTPM results.
+
+    Rows are appended as Parquet files under a Hive-style layout,
+    `<root>/source=<source>/scrape_date=<YYYY-MM-DD>/part-<uuid>.parquet`,
+    so reads filtering on source or date skip whole directories and other
+    predicates are pushed down to row-group statistics.
+
+    Requires pyarrow.
+    """
+
+    PARTITION_COLUMNS = ["source", "scrape_date"]
+
+    def __init__(self, root: str = "job_store"):
+        self.root = root
+
+    @staticmethod
+    def _schema():
+        import pyarrow as pa
+        return pa.schema([
+            ("job_id", pa.string()),
+            ("title", pa.string()),
+            ("company", pa.string()),
+            ("location", pa.string()),
+            ("url", pa.string()),
+            ("posted_text", pa.string()),
+            ("posted_date", pa.timestamp("us", tz="UTC")),
+            ("scraped_at", pa.timestamp("us", tz="UTC")),
+            ("description", pa.string()),
+            ("description_html", pa.string()),
+            ("required_skills", pa.list_(pa.string())),
+            ("experience_years", pa.float64()),
+            ("visa_sponsorship", pa.string()),
+            ("otpm_score", pa.float64()),
+            ("recommendation", pa.string()),
+        ])
+
+    @staticmethod
+    def make_row(
+        job: Job,
+        n_job: Optional[NormalizedJob] = None,
+        score: Optional[float] = None,
+        recommendation: Optional[str] = None,
+        scraped_at: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """Flattens one job and its results into a store row."""
+        scraped_at = scraped_at or datetime.now(timezone.utc)
+        return {
+            "job_id": job.id,
+            "title": job.title,
+            "company": job.company,
+            "location": job.location,
+            "url": job.url,
+            "posted_text": job.raw_data.get("posted_text", ""),
+            "posted_date": job.posted_date,
+            "scraped_at": scraped_at,
+            "description": job.description,
+            "description_html": job.raw_data.get("description_html"),
+            "required_skills": list(n_job.required_skills) if n_job else None,
+            "experience_years": n_job.experience_years if n_job else None,
+            "visa_sponsorship": n_job.visa_sponsorship if n_job else None,
+            "otpm_score": score,
+            "recommendation": recommendation,
+            "source": job.source,
+            "scrape_date": scraped_at.strftime("%Y-%m-%d"),
+        }
+
+    def append(
+        self,
+        jobs: Sequence[Job],
+        normalized_jobs: Optional[Sequence[NormalizedJob]] = None,
+        scores: Optional[Sequence[float]] = None,
+        recommendations: Optional[Sequence[str]] = None,
+        scraped_at: Optional[datetime] = None
+    ) -> int:
+        """
+        Appends jobs with their optional results (matched by position).
+        Returns the number of rows written.
+        """
+        rows = []
+        for i, job in enumerate(jobs):
+            rows.append(self.make_row(
+                job,
+                normalized_jobs[i] if normalized_jobs else None,
+                scores[i] if scores else None,
+                recommendations[i] if recommendations else None,
+                scraped_at
+            ))
+        return self.append_rows(rows)
+
+    def append_rows(self, rows: Iterable[Dict[str, Any]]) -> int:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        partitions: Dict[tuple, List[Dict[str, Any]]] = {}
+        for row in rows:
+            partitions.setdefault((row["source"], row["scrape_date"]), []).append(row)
+
+        schema = self._schema()
+        written = 0
+        for (source, scrape_date), part_rows in partitions.items():
+            directory = os.path.join(self.root, f"source={source}", f"scrape_date={scrape_date}")
+            os.makedirs(directory, exist_ok=True)
+            table = pa.Table.from_pylist(part_rows, schema=schema)
+            pq.write_table(table, os.path.join(directory, f"part-{uuid.uuid4().hex}.parquet"))
+            written += len(part_rows)
+        return written
+
+    def read(self, filters=None, columns: Optional[List[str]] = None):
+        """
+        Reads matching rows as a pyarrow Table.
+
+        `filters` is either a pyarrow compute expression or a list of
+        (column, op, value) tuples ANDed together, for example
+        [("visa_sponsorship", "==", "LIKELY"), ("experience_years", "<=", 2)].
+        Partition columns (source, scrape_date) can be filtered like any other.
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+
+        schema = self._schema()
+        for name in self.PARTITION_COLUMNS:
+            schema = schema.append(pa.field(name, pa.string()))
+        if not os.path.isdir(self.root):
+            table = schema.empty_table()
+            return table.select(columns) if columns else table
+
+        partitioning = ds.partitioning(
+            pa.schema([(name, pa.string()) for name in self.PARTITION_COLUMNS]), flavor="hive"
+        )
+        # The full schema, so files written before a column was added read it as null
+        dataset = ds.dataset(self.root, format="parquet", partitioning=partitioning, schema=schema)
+        if isinstance(filters, list):
+            filters = pq.filters_to_expression(filters) if filters else None
+        return dataset.to_table(filter=filters, columns=columns)
+
+class ParquetAppender:
+    """
+    Buffers rows for a ParquetJobStore and writes them in batches of
+    `flush_rows`, keeping files reasonably sized when jobs arrive one at a time.
+    Same write(job, n_job, score, recommendation) interface as the streaming exporters.
+    `on_flush` is called with the URLs of each batch once it is on disk.
+    """
+
+    def __init__(self, store: ParquetJobStore, flush_rows: int = 500,
+                 on_flush: Optional[Callable[[List[str]], None]] = None):
+        self.store = store
+        self.flush_rows = flush_rows
+        self.on_flush = on_flush
+        self.count = 0
+        self._rows: List[Dict[str, Any]] = []
+
+    def write(self, job: Job, n_job: Optional[NormalizedJob] = None,
+              score: Optional[float] = None, recommendation: Optional[str] = None):
+        self._rows.append(ParquetJobStore.make_row(job, n_job, score, recommendation))
+        if len(self._rows) >= self.flush_rows:
+            self.flush()
+
+    def flush(self):
+        if self._rows:
+            self.count += self.store.append_rows(self._rows)
+            if self.on_flush:
+                self.on_flush([row["url"] for row in self._rows])
+            self._rows = []
+
+    def close(self):
+        self.flush()
+        print(f"Stored {self.count} jobs in {self.store.root}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,84 @@
+import json
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Tuple
+from app.models.records import NormalizedJobRecord
+
+class ResultStore:
+    """
+    SQLite store of pipeline results keyed by content hashes.
+
+    'normalized' maps a job content key (description + parser fingerprint) to
+    the NormalizedJob it produced (as a NormalizedJobRecord); 'scores' maps (job content key, resume key)
+    to the OTPM score. Keys are computed by the caller, so entries never go
+    stale: a changed input simply hashes to a new key.
+    """
+
+    # SQLite's default limit on bound parameters is 999
+    _CHUNK = 500
+
+    def __init__(self, path: str = "job_cache.db"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS normalized (
+                job_key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS scores (
+                job_key TEXT NOT NULL,
+                resume_key TEXT NOT NULL,
+                score REAL NOT NULL,
+                PRIMARY KEY (job_key, resume_key)
+            );
+        """)
+        self._conn.commit()
+
+    def get_normalized(self, job_keys: Iterable[str]) -> Dict[str, NormalizedJobRecord]:
+        found = {}
+        for chunk in self._chunks(list(set(job_keys))):
+            marks = ",".join("?" * len(chunk))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT job_key, payload FROM normalized WHERE job_key IN ({marks})", chunk
+                ).fetchall()
+            for key, payload in rows:
+                found[key] = NormalizedJobRecord.from_dict(json.loads(payload))
+        return found
+
+    def put_normalized(self, items: Iterable[Tuple[str, NormalizedJobRecord]]):
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO normalized (job_key, payload) VALUES (?, ?)",
+                [(key, json.dumps(n_job.to_dict(), separators=(",", ":"))) for key, n_job in items]
+            )
+            self._conn.commit()
+
+    def get_scores(self, job_keys: Iterable[str], resume_key: str) -> Dict[str, float]:
+        found = {}
+        for chunk in self._chunks(list(set(job_keys))):
+            marks = ",".join("?" * len(chunk))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT job_key, score FROM scores WHERE resume_key = ? AND job_key IN ({marks})",
+                    [resume_key, *chunk]
+                ).fetchall()
+            found.update(rows)
+        return found
+
+    def put_scores(self, resume_key: str, items: Iterable[Tuple[str, float]]):
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO scores (job_key, resume_key, score) VALUES (?, ?, ?)",
+                [(key, resume_key, score) for key, score in items]
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _chunks(self, items: List[str]):
+        for i in range(0, len(items), self._CHUNK):
+            yield items[i:i + self._CHUNK]
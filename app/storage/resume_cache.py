@@ -0,0 +1,76 @@
+import sqlite3
+import threading
+from typing import Optional
+from app.models.resume import NormalizedResume
+
+class ResumeCache:
+    """
+    SQLite cache for resume parsing, keyed by content hashes.
+
+    'resume_text' maps (file hash, PDF backend) to the extracted text and
+    'resume_parsed' maps a key over text, parser fingerprint and user
+    overrides to the NormalizedResume, so re-scoring with many resume
+    variants skips both PDF extraction and re-parsing.
+    """
+
+    def __init__(self, path: str = "job_cache.db"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS resume_text (
+                file_hash TEXT NOT NULL,
+                backend TEXT NOT NULL,
+                text TEXT NOT NULL,
+                PRIMARY KEY (file_hash, backend)
+            );
+            CREATE TABLE IF NOT EXISTS resume_parsed (
+                resume_key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL
+            );
+        """)
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def get_text(self, file_hash: str, backend: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text FROM resume_text WHERE file_hash = ? AND backend = ?", (file_hash, backend)
+            ).fetchone()
+        self._count(row)
+        return row[0] if row else None
+
+    def put_text(self, file_hash: str, backend: str, text: str):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO resume_text (file_hash, backend, text) VALUES (?, ?, ?)",
+                (file_hash, backend, text)
+            )
+            self._conn.commit()
+
+    def get_resume(self, resume_key: str) -> Optional[NormalizedResume]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM resume_parsed WHERE resume_key = ?", (resume_key,)
+            ).fetchone()
+        self._count(row)
+        return NormalizedResume.model_validate_json(row[0]) if row else None
+
+    def put_resume(self, resume_key: str, resume: NormalizedResume):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO resume_parsed (resume_key, payload) VALUES (?, ?)",
+                (resume_key, resume.model_dump_json())
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _count(self, row):
+        if row:
+            self.hits += 1
+        else:
+            self.misses += 1
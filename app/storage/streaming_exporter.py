@@ -0,0 +1,115 @@
+import csv
+from app import metrics
+from app.models.job import Job
+from app.models.normalized_job import NormalizedJob
+from app.storage.export_rows import CSV_HEADERS, EXCEL_HEADERS, AnalysisCounters, job_status
+
+class StreamingCsvExporter:
+    """
+    Appends one CSV row per scored job and flushes it to disk immediately,
+    so a crashed run keeps every row written before the crash.
+    Same columns as CsvExporter.export_with_scores.
+    """
+
+    def __init__(self, filename: str = "jobs_export.csv", flush_every: int = 1):
+        self.filename = filename
+        self.flush_every = max(1, flush_every)
+        self.count = 0
+        self._file = open(filename, mode='w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(CSV_HEADERS)
+        self._file.flush()
+
+    @metrics.timed("export.csv_write")
+    def write(self, job: Job, n_job: NormalizedJob, score: float, recommendation: str):
+        self._writer.writerow([
+            job.company,
+            job.title,
+            job.location,
+            job_status(job),
+            job.raw_data.get("posted_text", ""),
+            f"{score:.2f}",
+            recommendation,
+            n_job.visa_sponsorship,
+            n_job.experience_years,
+            ", ".join(n_job.keywords),
+            job.url
+        ])
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+            print(f"Successfully exported {self.count} jobs to {self.filename}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class StreamingExcelExporter:
+    """
+    Streams rows into an openpyxl write-only workbook, which spools them to a
+    temporary file instead of holding cells in memory. The 'Analysis' sheet
+    is built from running counters when the exporter is closed.
+    Same sheets and columns as ExcelExporter.export.
+    """
+
+    def __init__(self, filename: str = "jobs_export.xlsx"):
+        from openpyxl import Workbook
+
+        # Ensure filename ends with .xlsx
+        if not filename.endswith(".xlsx"):
+            filename = filename.replace(".csv", "") + ".xlsx"
+        self.filename = filename
+        self.count = 0
+        self.counters = AnalysisCounters()
+
+        self._workbook = Workbook(write_only=True)
+        self._jobs_sheet = self._workbook.create_sheet("Jobs")
+        self._analysis_sheet = self._workbook.create_sheet("Analysis")
+        self._jobs_sheet.append(EXCEL_HEADERS)
+        self._closed = False
+
+    @metrics.timed("export.excel_write")
+    def write(self, job: Job, n_job: NormalizedJob, score: float, recommendation: str):
+        status = job_status(job)
+        score = float(f"{score:.2f}")
+        self.counters.add(status, score, recommendation, n_job.skill_mask)
+        self._jobs_sheet.append([
+            job.company,
+            job.title,
+            job.location,
+            status,
+            job.raw_data.get("posted_text", ""),
+            score,
+            recommendation,
+            n_job.visa_sponsorship,
+            n_job.experience_years,
+            ", ".join(n_job.keywords),
+            job.url
+        ])
+        self.count += 1
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._analysis_sheet.append(["Metric", "Value"])
+        for row in self.counters.rows():
+            self._analysis_sheet.append([row["Metric"], row["Value"]])
+        try:
+            with metrics.span("export.excel_save"):
+                self._workbook.save(self.filename)
+            print(f"Successfully exported {self.count} jobs to {self.filename}")
+        except Exception as e:
+            print(f"Error exporting Excel: {e}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
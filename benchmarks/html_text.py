@@ -0,0 +1,68 @@
+"""
+Description HTML to text: html2text vs. the lxml extractor, on the saved
+LinkedIn job view plus the description corpus
+(benchmarks/data/job_descriptions.jsonl) rendered as LinkedIn-style markup
+(<strong> headings, <br> breaks, <ul> bullets). "long" postings join five
+descriptions. Reports time per description, output size, and whether
+JobParser extracts the same skills, experience and visa signal from both.
+
+Usage: python -m benchmarks.html_text
+"""
+import html
+import json
+import os
+import time
+
+from app.normalization.job_parser import JobParser
+from app.scraping import linkedin_html
+from app.scraping.html_text import html2text_text, lxml_text
+
+CORPUS = os.path.join(os.path.dirname(__file__), "data", "job_descriptions.jsonl")
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures", "linkedin")
+REPEATS = 20
+
+def to_linkedin_html(text: str) -> str:
+    parts = []
+    for block in text.split("\n\n"):
+        lines = [line for line in block.splitlines() if line.strip()]
+        if lines and not lines[0].startswith("- ") and len(lines) > 1:
+            parts.append(f"<strong>{html.escape(lines[0])}</strong><br><br>")
+            lines = lines[1:]
+        bullets = [line[2:] for line in lines if line.startswith("- ")]
+        prose = [line for line in lines if not line.startswith("- ")]
+        if prose:
+            parts.append("<p>" + "<br>".join(html.escape(line) for line in prose) + "</p>")
+        if bullets:
+            parts.append("<ul>" + "".join(f"<li><span>{html.escape(b)}</span></li>" for b in bullets) + "</ul>")
+    return '<div class="show-more-less-html__markup">' + "".join(parts) + "</div>"
+
+def load_corpus():
+    with open(CORPUS, encoding="utf-8") as f:
+        pages = [to_linkedin_html(json.loads(line)["description"]) for line in f if line.strip()]
+    with open(os.path.join(FIXTURES, "job_view.html"), encoding="utf-8") as f:
+        pages.append(linkedin_html.parse_job_page(f.read())["description_html"])
+    long_pages = ["".join(pages[i:i + 5]) for i in range(0, len(pages), 5)]
+    return {"postings": pages, "long": long_pages}
+
+def timed(extract, pages):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        texts = [extract(page) for page in pages]
+    return (time.perf_counter() - start) * 1e6 / (REPEATS * len(pages)), texts
+
+def main():
+    parser = JobParser()
+    corpus = load_corpus()
+    print(f"{'corpus':>9} | {'pages':>5} | {'html2text us':>12} | {'lxml us':>8} | {'speedup':>7} | "
+          f"{'chars h2t/lxml':>15} | {'same parse':>10}")
+    print("-" * 86)
+    for label, pages in corpus.items():
+        slow_us, slow_texts = timed(html2text_text, pages)
+        fast_us, fast_texts = timed(lxml_text, pages)
+        same = sum(parser.parse_fields(a) == parser.parse_fields(b) for a, b in zip(slow_texts, fast_texts))
+        chars = f"{sum(map(len, slow_texts)) // len(pages)}/{sum(map(len, fast_texts)) // len(pages)}"
+        print(f"{label:>9} | {len(pages):>5} | {slow_us:>12.0f} | {fast_us:>8.0f} | {slow_us / fast_us:>6.1f}x | "
+              f"{chars:>15} | {same:>4}/{len(pages):<5}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+JobParser.parse throughput over a corpus of job descriptions
+(benchmarks/data/job_descriptions.jsonl): the legacy per-pattern experience
+regexes and keyword scans vs. the single-pass SignalExtractor, then
+JobParser.parse_many scaling over worker processes.
+
+Usage: python -m benchmarks.job_parser
+"""
+import json
+import os
+import re
+import time
+from typing import List
+
+from app.models.job import Job
+from app.models.normalized_job import NormalizedJob
+from app.normalization.job_parser import JobParser
+
+CORPUS = os.path.join(os.path.dirname(__file__), "data", "job_descriptions.jsonl")
+N_JOBS = 5000
+N_SCALING_JOBS = 50000
+
+def legacy_extract_experience(text: str) -> float:
+    """The pre-SignalExtractor implementation of JobParser._extract_experience."""
+    patterns = [
+        r'(\d+)\s*\+\s*years',
+        r'(\d+)\s*-\s*\d+\s*years',
+        r'(\d+)\s*to\s*\d+\s*years',
+        r'(\d+)\s*years'
+    ]
+    for p in patterns:
+        for m in re.findall(p, text):
+            y = float(m)
+            if 0 < y < 20:
+                return y
+    return 0.0
+
+def legacy_extract_visa_status(text: str) -> str:
+    """The pre-SignalExtractor implementation of JobParser._extract_visa_status."""
+    for keyword in JobParser.VISA_KEYWORDS_NEGATIVE:
+        if keyword in text:
+            return "UNLIKELY"
+    for keyword in JobParser.VISA_KEYWORDS_POSITIVE:
+        if keyword in text:
+            return "LIKELY"
+    return "UNCLEAR"
+
+class LegacyJobParser(JobParser):
+    def parse(self, job: Job) -> NormalizedJob:
+        description_lower = job.description.lower()
+        required_skills = self._extract_skills(description_lower)
+        return NormalizedJob(
+            job_id=job.id,
+            required_skills=required_skills,
+            experience_years=legacy_extract_experience(description_lower),
+            visa_sponsorship=legacy_extract_visa_status(description_lower),
+            keywords=list(required_skills)
+        )
+
+def load_jobs(n: int) -> List[Job]:
+    with open(CORPUS, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    return [
+        Job(
+            id=f"{records[i % len(records)]['id']}-{i}",
+            title=records[i % len(records)]["title"],
+            company="Benchmark Co",
+            location="Remote",
+            description=records[i % len(records)]["description"],
+            url=f"https://example.com/jobs/{i}",
+            source="benchmark"
+        )
+        for i in range(n)
+    ]
+
+def bench(fn, items) -> float:
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    return len(items) / (time.perf_counter() - start)
+
+def main():
+    jobs = load_jobs(N_JOBS)
+    texts = [job.description.lower() for job in jobs]
+    legacy, parser = LegacyJobParser(), JobParser()
+
+    print(f"Corpus: {len(set(texts))} descriptions, {N_JOBS} jobs\n")
+    print(f"{'':>22} | {'legacy/s':>10} | {'single-pass/s':>13} | {'speedup':>8}")
+    print("-" * 62)
+    rows = [
+        ("experience + visa", lambda t: (legacy_extract_experience(t), legacy_extract_visa_status(t)),
+         parser.signals.extract, texts),
+        ("JobParser.parse", legacy.parse, parser.parse, jobs),
+    ]
+    for name, old, new, items in rows:
+        before, after = bench(old, items), bench(new, items)
+        print(f"{name:>22} | {before:>10.0f} | {after:>13.0f} | {after / before:>7.1f}x")
+
+    print(f"\nparse_many over {N_SCALING_JOBS} jobs ({os.cpu_count()} CPUs)")
+    print(f"{'workers':>8} | {'jobs/s':>10} | {'speedup':>8}")
+    print("-" * 32)
+    corpus = load_jobs(N_SCALING_JOBS)
+    baseline = None
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        start = time.perf_counter()
+        parser.parse_many(corpus, workers=workers)
+        rate = N_SCALING_JOBS / (time.perf_counter() - start)
+        baseline = baseline or rate
+        print(f"{workers:>8} | {rate:>10.0f} | {rate / baseline:>7.1f}x")
+
+    # The new patterns are meant to change some answers; list them for review
+    print("\nChanged extractions:")
+    for text in dict.fromkeys(texts):
+        old = (legacy_extract_experience(text), legacy_extract_visa_status(text))
+        new = tuple(parser.signals.extract(text))
+        if old != new:
+            print(f"  {text.splitlines()[0][:50]:<50} {old} -> {new}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+OTPM scoring throughput: scalar calculate_probability loop vs. score_batch,
+for NormalizedJob models and for NormalizedJobRecords (precomputed skill
+bitsets, as used by the pipeline).
+
+Usage: python -m benchmarks.otpm_batch
+"""
+import random
+import time
+
+from app.models.normalized_job import NormalizedJob
+from app.models.records import NormalizedJobRecord
+from app.models.resume import NormalizedResume
+from app.otpm.engine import OTPMEngine
+
+N_JOBS = 20000
+N_RESUMES = 24
+
+SKILLS = ["python", "java", "sql", "aws", "docker", "react", "go", "kafka"]
+
+def random_jobs(rng: random.Random, n: int):
+    return [
+        NormalizedJob(
+            job_id=f"job-{i}",
+            required_skills=rng.sample(SKILLS, rng.randint(0, 6)),
+            experience_years=rng.choice([0.0, 1.0, 2.0, 3.0, 5.0, 8.0]),
+            visa_sponsorship=rng.choice(["LIKELY", "UNLIKELY", "UNCLEAR"])
+        )
+        for i in range(n)
+    ]
+
+def random_resumes(rng: random.Random, n: int):
+    return [
+        NormalizedResume(
+            skills=rng.sample(SKILLS, rng.randint(0, 8)),
+            years_of_experience=rng.choice([0.0, 0.5, 1.0, 2.0, 4.0]),
+            visa_status=rng.choice(["Visa Required", "US Citizen"])
+        )
+        for _ in range(n)
+    ]
+
+def main():
+    rng = random.Random(0)
+    engine = OTPMEngine()
+    jobs = random_jobs(rng, N_JOBS)
+    resumes = random_resumes(rng, N_RESUMES)
+    pairs = N_JOBS * N_RESUMES
+
+    records = [NormalizedJobRecord.from_model(job) for job in jobs]
+
+    print(f"{N_JOBS} jobs x {N_RESUMES} resumes = {pairs} pairs")
+    for name, items in (("models", jobs), ("records", records)):
+        start = time.perf_counter()
+        scalar = [[engine.calculate_probability(job, resume) for resume in resumes] for job in items]
+        scalar_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch = engine.score_batch(items, resumes)
+        batch_s = time.perf_counter() - start
+
+        assert batch.tolist() == scalar
+        print(f"{name}")
+        print(f"  scalar: {scalar_s:.2f}s ({pairs / scalar_s:,.0f} pairs/s)")
+        print(f"  batch:  {batch_s:.2f}s ({pairs / batch_s:,.0f} pairs/s), {scalar_s / batch_s:.1f}x faster")
+
+if __name__ == "__main__":
+    main()
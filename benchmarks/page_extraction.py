@@ -0,0 +1,151 @@
+"""
+LinkedIn page extraction: per-field locator calls vs. a single page.evaluate,
+on the saved fixture pages (a job view and a search page grown to
+CARD_COUNT cards). Reports Playwright round-trips and wall time per page.
+
+Usage: python -m benchmarks.page_extraction
+"""
+import os
+import re
+import time
+
+from app.scraping import linkedin_html
+from app.scraping.linkedin import LinkedInScraper, _EXTRACT_JOB_JS
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures", "linkedin")
+CARD_COUNT = 1000
+REPEATS = 5
+
+# Locator methods that go to the browser; building locators does not
+_ROUND_TRIPS = {"count", "inner_text", "inner_html", "get_attribute", "is_visible", "evaluate", "content"}
+
+class CountingLocator:
+    def __init__(self, locator, counter):
+        self._locator = locator
+        self._counter = counter
+
+    @property
+    def first(self):
+        return CountingLocator(self._locator.first, self._counter)
+
+    def nth(self, i):
+        return CountingLocator(self._locator.nth(i), self._counter)
+
+    def locator(self, selector):
+        return CountingLocator(self._locator.locator(selector), self._counter)
+
+    def or_(self, other):
+        return CountingLocator(self._locator.or_(other._locator), self._counter)
+
+    def __getattr__(self, name):
+        attr = getattr(self._locator, name)
+        if name in _ROUND_TRIPS:
+            self._counter[0] += 1
+        return attr
+
+class CountingPage(CountingLocator):
+    """Counts browser round-trips made through a Page."""
+
+    def locator(self, selector):
+        return CountingLocator(self._locator.locator(selector), self._counter)
+
+def read_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+def search_page(card_count: int) -> str:
+    """The search fixture with its card list grown to `card_count` cards."""
+    html = read_fixture("search.html")
+    cards = re.findall(r"<li>.*?</li>", html, re.S)
+    grown = [
+        re.sub(r"/jobs/view/\d+", f"/jobs/view/{2000 + i}", cards[i % len(cards)])
+        for i in range(card_count)
+    ]
+    start = html.index("<li>")
+    end = html.rindex("</li>") + len("</li>")
+    return html[:start] + "\n".join(grown) + html[end:]
+
+def legacy_job_fields(page) -> dict:
+    """The original scrape_job extraction: a locator call per selector and field."""
+    title = page.locator(".top-card-layout__title").first.or_(page.locator("h1").first).inner_text().strip()
+    company = "Unknown Company"
+    for selector in linkedin_html.COMPANY_SELECTORS:
+        el = page.locator(selector).first
+        if el.count():
+            company = el.inner_text().strip()
+            break
+    location = "Unknown Location"
+    for selector in linkedin_html.LOCATION_SELECTORS:
+        el = page.locator(selector).first
+        if el.count():
+            location = el.inner_text().strip()
+            break
+    raw_html = ""
+    for selector in linkedin_html.DESCRIPTION_SELECTORS:
+        el = page.locator(selector).first
+        if el.count():
+            raw_html = el.inner_html()
+            break
+    return {"title": title, "company": company, "location": location, "description_html": raw_html}
+
+def legacy_cards(page) -> list:
+    """The original search_jobs card loop."""
+    cards = []
+    job_cards = page.locator(linkedin_html.CARD_SELECTOR)
+    for i in range(job_cards.count()):
+        card = job_cards.nth(i)
+        link_el = card.locator("a.base-card__full-link").first
+        if not link_el.count():
+            link_el = card.locator("a").first
+        url = link_el.get_attribute("href")
+        title = card.locator(".base-search-card__title").first.inner_text().strip()
+        company = card.locator(".base-search-card__subtitle").first.inner_text().strip()
+        posted_text = ""
+        time_el = card.locator("time").first
+        if time_el.count():
+            posted_text = time_el.inner_text().strip()
+        location = ""
+        location_el = card.locator(".job-search-card__location").first
+        if location_el.count():
+            location = location_el.inner_text().strip()
+        cards.append(linkedin_html.card_from_fields(url, title, company, posted_text, card.inner_text(), location))
+    return cards
+
+def measure(fn, page, repeats: int = REPEATS):
+    """(round-trips per call, mean ms per call, last result)"""
+    counter = [0]
+    counting = CountingPage(page, counter)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = fn(counting)
+    ms = (time.perf_counter() - start) * 1000 / repeats
+    return counter[0] // repeats, ms, result
+
+def main():
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        scraper = LinkedInScraper(p)
+
+        page.set_content(read_fixture("job_view.html"))
+        print("Job view")
+        calls, ms, before = measure(legacy_job_fields, page)
+        print(f"  locators:  {calls:5d} round-trips {ms:9.2f} ms")
+        calls, ms, after = measure(lambda pg: pg.evaluate(_EXTRACT_JOB_JS, linkedin_html.JOB_SELECTORS), page)
+        print(f"  evaluate:  {calls:5d} round-trips {ms:9.2f} ms")
+        print(f"  same fields: {before == after}")
+
+        page.set_content(search_page(CARD_COUNT))
+        print(f"\nSearch page ({CARD_COUNT} cards)")
+        calls, ms, before = measure(legacy_cards, page, repeats=1)
+        print(f"  locators:  {calls:5d} round-trips {ms:9.2f} ms")
+        calls, ms, (_, after) = measure(scraper._extract_cards, page)
+        print(f"  evaluate:  {calls:5d} round-trips {ms:9.2f} ms")
+        print(f"  same cards: {before == after}")
+
+        browser.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Resume PDF extraction and parsing: pypdf vs. pypdfium2, page-parallel
+extraction on a long document, and cached vs. uncached ResumeParser.parse_file.
+
+Usage: python -m benchmarks.pdf_extraction
+"""
+import glob
+import os
+import tempfile
+import time
+
+from app.extraction.pdf_utils import PdfUtils
+from app.normalization.resume_parser import ResumeParser
+from app.storage.resume_cache import ResumeCache
+
+REPEATS = 20
+LONG_DOC_PAGES = 64
+
+def timed(fn, repeats: int = REPEATS) -> float:
+    """Mean milliseconds per call."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeats
+
+def make_long_pdf(source: str, path: str):
+    import pypdf
+    reader = pypdf.PdfReader(source)
+    writer = pypdf.PdfWriter()
+    while len(writer.pages) < LONG_DOC_PAGES:
+        for page in reader.pages:
+            writer.add_page(page)
+    with open(path, "wb") as f:
+        writer.write(f)
+
+def main():
+    backends = PdfUtils.available_backends()
+    files = sorted(glob.glob("resumes/*.pdf"))
+    print(f"Backends installed: {', '.join(backends)}")
+
+    for path in files:
+        print(f"\n{path}")
+        for backend in backends:
+            ms = timed(lambda: PdfUtils.extract_text(path, backend=backend))
+            print(f"  extract_text[{backend}]: {ms:8.2f} ms")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ResumeCache(os.path.join(tmp, "cache.db"))
+            cached = ResumeParser(cache=cache)
+            cached.parse_file(path)  # warm the cache
+            print(f"  parse_file uncached:     {timed(lambda: ResumeParser().parse_file(path)):8.2f} ms")
+            print(f"  parse_file cached:       {timed(lambda: cached.parse_file(path)):8.2f} ms")
+            cache.close()
+
+    if files:
+        with tempfile.TemporaryDirectory() as tmp:
+            long_pdf = os.path.join(tmp, "long.pdf")
+            make_long_pdf(files[0], long_pdf)
+            print(f"\n{LONG_DOC_PAGES}-page document")
+            for backend in backends:
+                serial = timed(lambda: PdfUtils.extract_text(long_pdf, backend=backend, workers=1), 3)
+                parallel = timed(lambda: PdfUtils.extract_text(long_pdf, backend=backend), 3)
+                print(f"  {backend:<10} serial {serial:8.1f} ms | page-parallel {parallel:8.1f} ms "
+                      f"({os.cpu_count()} cpus)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Top-K ranking over a large synthetic corpus: RankingIndex.top_k vs. scoring
+every job with OTPMEngine.score_batch and sorting. Skill sets are drawn from
+the JobParser vocabulary with a Zipf-like popularity so common skills have
+long postings lists, as in real scrapes.
+
+Usage: python -m benchmarks.ranking
+"""
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from app.models.records import NormalizedJobRecord
+from app.models.resume import NormalizedResume
+from app.normalization.job_parser import JobParser
+from app.otpm.engine import OTPMEngine
+from app.recommendation.ranking import RankingIndex
+
+N_JOBS = 300_000
+K = 50
+N_QUERIES = 20
+
+def make_corpus(rng: random.Random, skills):
+    weights = [1 / (rank + 1) for rank in range(len(skills))]
+    now = datetime.now(timezone.utc)
+    jobs, dates = [], []
+    for i in range(N_JOBS):
+        job_skills = set(rng.choices(skills, weights, k=rng.choice([0, 2, 4, 6, 8, 12])))
+        jobs.append(NormalizedJobRecord.from_skills(
+            f"job-{i}", job_skills, rng.choice([0.0, 1.0, 2.0, 3.0, 5.0, 7.0, 10.0]),
+            rng.choice(["LIKELY", "UNLIKELY", "UNCLEAR", "UNCLEAR"])
+        ))
+        dates.append(now - timedelta(hours=rng.randint(0, 24 * 90)))
+    return jobs, dates
+
+def main():
+    rng = random.Random(0)
+    skills = sorted(set(JobParser().skill_matcher.terms.values()))
+    rng.shuffle(skills)
+    jobs, dates = make_corpus(rng, skills)
+    engine = OTPMEngine()
+    resumes = [
+        NormalizedResume(skills=rng.sample(skills[:40], 10), years_of_experience=rng.choice([0.0, 2.0, 4.0]),
+                         visa_status=rng.choice(["Visa Required", "US Citizen"]))
+        for _ in range(N_QUERIES)
+    ]
+    since = datetime.now(timezone.utc) - timedelta(days=30)
+
+    index = RankingIndex(engine)
+    index.add_all(jobs, dates)
+    start = time.perf_counter()
+    index.top_k(resumes[0], K)
+    print(f"{N_JOBS} jobs, {len(skills)} skills; index built in {time.perf_counter() - start:.2f}s\n")
+
+    posted = np.array([d.timestamp() for d in dates])
+    print(f"{'query':>22} | {'score_batch ms':>14} | {'top_k ms':>9} | {'speedup':>8}")
+    print("-" * 62)
+    for label, cutoff in (("all jobs", None), ("last 30 days", since)):
+        brute_seconds = index_seconds = 0.0
+        for resume in resumes:
+            start = time.perf_counter()
+            scores = engine.score_batch(jobs, [resume])[:, 0]
+            if cutoff:
+                scores = np.where(posted >= cutoff.timestamp(), scores, -1.0)
+            best = np.lexsort((np.arange(N_JOBS), -posted, -scores))[:K]
+            brute_seconds += time.perf_counter() - start
+
+            start = time.perf_counter()
+            ranked = index.top_k(resume, K, cutoff)
+            index_seconds += time.perf_counter() - start
+            assert [job.job_id for job, _ in ranked] == [jobs[i].job_id for i in best]
+
+        brute_ms, index_ms = brute_seconds * 1000 / N_QUERIES, index_seconds * 1000 / N_QUERIES
+        print(f"{label:>22} | {brute_ms:>14.1f} | {index_ms:>9.2f} | {brute_ms / index_ms:>7.0f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Pydantic models vs. slotted records: memory per 100k objects and
+construction throughput for Job / JobRecord and NormalizedJob /
+NormalizedJobRecord. Descriptions come from benchmarks/data and the inputs
+share them; validation copies each string into the model, while a record
+keeps a reference, so the Job row includes those copies.
+
+Usage: python -m benchmarks.records
+"""
+import gc
+import json
+import os
+import time
+import tracemalloc
+from typing import Callable, List
+
+from app.models.job import Job
+from app.models.normalized_job import NormalizedJob
+from app.models.records import JobRecord, NormalizedJobRecord
+from app.normalization.job_parser import JobParser
+
+CORPUS = os.path.join(os.path.dirname(__file__), "data", "job_descriptions.jsonl")
+N_OBJECTS = 100_000
+
+def load_corpus() -> List[dict]:
+    with open(CORPUS, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def job_fields(corpus: List[dict], i: int) -> dict:
+    record = corpus[i % len(corpus)]
+    return dict(
+        id=f"https://www.linkedin.com/jobs/view/{4000000000 + i}",
+        title=record["title"],
+        company="Benchmark Co",
+        location="Remote",
+        description=record["description"],
+        url=f"https://www.linkedin.com/jobs/view/{4000000000 + i}",
+        source="linkedin"
+    )
+
+def measure(build: Callable[[int], object]):
+    """(MiB retained for N_OBJECTS objects, objects built per second)"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    objects = [build(i) for i in range(N_OBJECTS)]
+    seconds = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return retained / 2**20, N_OBJECTS / seconds
+
+def main():
+    corpus = load_corpus()
+    parser = JobParser()
+    fields = [job_fields(corpus, i) for i in range(N_OBJECTS)]
+    # One parse per distinct description; the objects differ only by id
+    parsed = [parser.parse_fields(record["description"]) for record in corpus]
+
+    def normalized_model(i: int) -> NormalizedJob:
+        skills, years, visa = parsed[i % len(parsed)]
+        return NormalizedJob(job_id=fields[i]["id"], required_skills=skills, experience_years=years,
+                             visa_sponsorship=visa, keywords=list(skills))
+
+    def normalized_record(i: int) -> NormalizedJobRecord:
+        skills, years, visa = parsed[i % len(parsed)]
+        return NormalizedJobRecord.from_skills(fields[i]["id"], skills, years, visa)
+
+    rows = [
+        ("Job", lambda i: Job(**fields[i])),
+        ("JobRecord", lambda i: JobRecord(**fields[i])),
+        ("NormalizedJob", normalized_model),
+        ("NormalizedJobRecord", normalized_record),
+    ]
+    print(f"{N_OBJECTS} objects")
+    print(f"{'':>20} | {'MiB':>8} | {'bytes/obj':>9} | {'objects/s':>10}")
+    print("-" * 56)
+    for name, build in rows:
+        mib, rate = measure(build)
+        print(f"{name:>20} | {mib:>8.1f} | {mib * 2**20 / N_OBJECTS:>9.0f} | {rate:>10.0f}")
+
+if __name__ == "__main__":
+    main()
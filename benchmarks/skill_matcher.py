@@ -0,0 +1,84 @@
+"""
+Skill matching throughput: legacy per-skill regex loop vs. SkillMatcher.
+
+Usage: python -m benchmarks.skill_matcher
+"""
+import random
+import re
+import string
+import time
+from typing import List, Set
+
+from app.normalization.job_parser import JobParser
+from app.normalization.skill_matcher import SkillMatcher
+
+VOCAB_SIZES = [50, 500, 5000]
+N_DESCRIPTIONS = 200
+
+FILLER = (
+    "we are looking for an engineer to join our platform team and build reliable "
+    "services for millions of users. you will design, ship and operate backend "
+    "systems, collaborate with product, and mentor junior engineers. requirements: "
+    "3+ years of experience, strong communication skills, bachelor's degree in "
+    "computer science or related field. benefits include health, dental, 401k."
+).split()
+
+def legacy_extract_skills(skills: Set[str], text: str) -> List[str]:
+    """The pre-SkillMatcher implementation of JobParser._extract_skills."""
+    found_skills = []
+    for skill in skills:
+        if skill in {'c++', 'node.js', 'c#', '.net', 'ci/cd'}:
+            if skill in text:
+                found_skills.append(skill)
+        else:
+            pattern = re.compile(r'\b' + re.escape(skill) + r'\b')
+            if pattern.search(text):
+                found_skills.append(skill)
+    return sorted(found_skills)
+
+def make_vocabulary(size: int, rng: random.Random) -> Set[str]:
+    vocab = set(sorted(JobParser.COMMON_SKILLS)[:size])
+    while len(vocab) < size:
+        word = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+        vocab.add(word)
+    return vocab
+
+def make_descriptions(vocab: Set[str], rng: random.Random) -> List[str]:
+    terms = sorted(vocab)
+    docs = []
+    for _ in range(N_DESCRIPTIONS):
+        words = [rng.choice(FILLER) for _ in range(450)]
+        for _ in range(12):
+            words.insert(rng.randrange(len(words)), rng.choice(terms))
+        docs.append(" ".join(words))
+    return docs
+
+def bench(fn, docs: List[str]) -> float:
+    start = time.perf_counter()
+    for doc in docs:
+        fn(doc)
+    return len(docs) / (time.perf_counter() - start)
+
+def main():
+    rng = random.Random(42)
+    print(f"{'terms':>6} | {'legacy docs/s':>14} | {'matcher docs/s':>15} | {'speedup':>8} | {'compile ms':>10}")
+    print("-" * 66)
+    for size in VOCAB_SIZES:
+        vocab = make_vocabulary(size, rng)
+        docs = make_descriptions(vocab, rng)
+
+        start = time.perf_counter()
+        matcher = SkillMatcher(vocab)
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        # Both implementations must agree before timing them
+        for doc in docs[:20]:
+            assert matcher.find(doc) == legacy_extract_skills(vocab, doc)
+
+        # The legacy loop is too slow at large vocabularies to time on the full set
+        legacy = bench(lambda d: legacy_extract_skills(vocab, d), docs[:20])
+        fast = bench(matcher.find, docs)
+        print(f"{size:>6} | {legacy:>14.1f} | {fast:>15.1f} | {fast / legacy:>7.1f}x | {compile_ms:>10.1f}")
+
+if __name__ == "__main__":
+    main()
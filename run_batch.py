@@ -1,12 +1,11 @@
 import sys
 import os
-import time
-from playwright.sync_api import sync_playwright
-from app.scraping.linkedin import LinkedInScraper
-from app.normalization.job_parser import JobParser
-from app.storage.excel_exporter import ExcelExporter
+import argparse
+from app import metrics
 from app.models.resume import NormalizedResume
-from app.otpm.engine import OTPMEngine
+from app.pipeline.checkpoint import RunJournal
+from app.pipeline.config import RunConfig
+from app.pipeline.runner import run_pipeline
 
 def setup_resume():
     """Handles resume selection or manual input."""
@@ -69,9 +68,30 @@ def setup_resume():
         )
     return resume
 
-def run_batch():
+def run_batch(
+    concurrency: int = 1,
+    requests_per_second: float = 0.5,
+    cache_path: str = "job_cache.db",
+    cache_ttl_hours: float = 168,
+    store_root: str = "job_store",
+    fetch_mode: str = "browser",
+    sources: list = None,
+    journal_out: str = "run_batch.journal.jsonl",
+    resume_run: bool = False
+):
+    metrics.reset()
     print("OA Trigger Engine - Batch Search Mode")
     print("-" * 30)
+
+    if resume_run:
+        # The journal holds the interrupted run's answers, so there is nothing to ask
+        journal = RunJournal.load(journal_out)
+        if journal.header and not journal.finished:
+            config = journal.saved_config().model_copy(update={"resume_run": True})
+            print(f"\nResuming batch process for: '{config.query}' in '{config.location}'...")
+            run_and_dump_metrics(config, journal.saved_resume())
+            return
+        print(f"No unfinished run in {journal_out}; starting a new one.")
     
     # 1. Select Mode
     print("Select Mode:")
@@ -109,87 +129,75 @@ def run_batch():
             limit = 10
             print("Invalid number, defaulting to 10.")
     
-    filters = {}
-    if time_filter: filters["time"] = time_filter
-    if level_filter: filters["experience"] = [level_filter]
-    
     # 3. Resume Setup (Only if Analyzing)
     resume = None
-    otpm_engine = None
-    
     if mode == "analyze":
         resume = setup_resume()
-        otpm_engine = OTPMEngine()
+
+    config = RunConfig(
+        query=query,
+        location=location,
+        time_filter=time_filter,
+        experience=[level_filter] if level_filter else [],
+        limit=limit,
+        analyze=mode == "analyze",
+        headless=False,  # headless=False to see it working
+        concurrency=concurrency,
+        requests_per_second=requests_per_second,
+        cache_path=cache_path,
+        cache_ttl_hours=cache_ttl_hours,
+        store_root=store_root,
+        fetch_mode=fetch_mode,
+        sources=sources or ["linkedin"],
+        journal_out=journal_out
+    )
 
     print(f"\nStarting batch process for: '{query}' in '{location}'...")
     print(f"Targeting {limit} jobs.")
-    
-    with sync_playwright() as p:
-        # headless=False to see it working
-        scraper = LinkedInScraper(p, headless=False)
-        scraper.start_browser()
-        
-        # Search
-        print("\nStep 1: Searching for jobs...")
-        jobs_list, total_count_str = scraper.search_jobs(query, location, filters=filters, limit=limit)
-        
-        print(f"\n=== MATCH FOUND: {total_count_str} Total Jobs Available ===")
-        
-        if not jobs_list:
-            print("No jobs found. Exiting.")
-            return
+    run_and_dump_metrics(config, resume)
 
-        print(f"Found {len(jobs_list)} jobs (Top {limit}). Queueing for details...")
-        
-        full_jobs = []
-        
-        # Scrape Details
-        print("\nStep 2: Scraping job details...")
-        for i, search_result in enumerate(jobs_list):
-            print(f"[{i+1}/{len(jobs_list)}] Scraping: {search_result.title} @ {search_result.company}")
-            
-            # Memory Safety
-            if i > 0 and i % 5 == 0:
-                 pass # LinkedInScraper manages page lifecycle per job, so we are safe.
-
-            full_job = scraper.scrape_job(search_result.url)
-            if full_job:
-                if full_job.company == "Unknown Company": full_job.company = search_result.company
-                if full_job.location == "Unknown Location": full_job.location = search_result.location
-                full_jobs.append(full_job)
-            else:
-                print("   Failed to scrape details.")
-            
-            # Simple delay to be nice
-            time.sleep(2)
-
-        # Normalize & Analyze
-        print("\nStep 3: Normalizing & Analyzing...")
-        parser = JobParser()
-        normalized_jobs = []
-        otpm_scores = []
-        recommendations = []
-        
-        for job in full_jobs:
-            n_job = parser.parse(job)
-            normalized_jobs.append(n_job)
-            
-            if mode == "analyze" and resume and otpm_engine:
-                score = otpm_engine.calculate_probability(n_job, resume)
-                rec = otpm_engine.get_recommendation(score)
-                otpm_scores.append(score)
-                recommendations.append(rec)
-                print(f"   -> {job.company}: P(OA)={score:.2f} [{rec}]")
-            else:
-                otpm_scores.append(0.0)
-                recommendations.append("N/A")
-        
-        # Export
-        print("\nStep 4: Exporting to Excel...")
-        filename = f"jobs_{query.replace(' ', '_')}.xlsx"
-        ExcelExporter.export(normalized_jobs, full_jobs, otpm_scores, recommendations, filename)
-        
-        print("\nDone!")
+def run_and_dump_metrics(config: RunConfig, resume):
+    """Runs the pipeline; the metrics file is written even if the run fails."""
+    try:
+        run_pipeline(config, resume=resume)
+    finally:
+        metrics.dump(config.metrics_path())
+        print(f"Metrics written to {config.metrics_path()}")
+    print("\nDone!")
 
 if __name__ == "__main__":
-    run_batch()
+    arg_parser = argparse.ArgumentParser(description="OA Trigger Engine - Batch Search Mode")
+    arg_parser.add_argument("--concurrency", type=int, default=1,
+                            help="Number of job detail pages fetched in parallel (default 1)")
+    arg_parser.add_argument("--rps", type=float, default=0.5,
+                            help="Max detail requests per second per host (default 0.5)")
+    arg_parser.add_argument("--cache", default="job_cache.db",
+                            help="SQLite job cache path (default job_cache.db)")
+    arg_parser.add_argument("--no-cache", action="store_true",
+                            help="Always re-scrape job details")
+    arg_parser.add_argument("--cache-ttl", type=float, default=168,
+                            help="Hours before a cached job is re-scraped (default 168)")
+    arg_parser.add_argument("--store", default="job_store",
+                            help="Parquet store directory for long-term history (default job_store)")
+    arg_parser.add_argument("--no-store", action="store_true",
+                            help="Do not append results to the Parquet store")
+    arg_parser.add_argument("--http", action="store_true",
+                            help="Fetch public pages over plain HTTP, using the browser only for auth walls")
+    arg_parser.add_argument("--source", dest="sources", action="append",
+                            help="Job board to search, repeatable: linkedin, jobright, simplify (default linkedin)")
+    arg_parser.add_argument("--journal", default="run_batch.journal.jsonl",
+                            help="Checkpoint journal of the run (default run_batch.journal.jsonl)")
+    arg_parser.add_argument("--resume-run", action="store_true",
+                            help="Continue the interrupted run in the journal instead of asking for a new one")
+    args = arg_parser.parse_args()
+    run_batch(
+        concurrency=args.concurrency,
+        requests_per_second=args.rps,
+        cache_path=None if args.no_cache else args.cache,
+        cache_ttl_hours=args.cache_ttl,
+        store_root=None if args.no_store else args.store,
+        fetch_mode="http" if args.http else "browser",
+        sources=args.sources,
+        journal_out=args.journal,
+        resume_run=args.resume_run
+    )
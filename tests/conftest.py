@@ -0,0 +1,16 @@
+import pytest
+from app.models.job import Job
+
+@pytest.fixture
+def make_job():
+    """
+    Factory for test postings: make_job(n) is at https://example.com/<n>
+    (pass a URL instead to use it as is), and keyword fields override the
+    defaults.
+    """
+    def make(n=1, **fields) -> Job:
+        url = n if isinstance(n, str) else f"https://example.com/{n}"
+        defaults = dict(id=url, title="Software Engineer", company="Test Corp", location="Remote",
+                        description="", url=url, source="linkedin")
+        return Job(**{**defaults, **fields})
+    return make
@@ -0,0 +1,211 @@
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("lxml")
+
+from app.scraping.linkedin_http import LinkedInHttpScraper
+from app.scraping.rate_limiter import HostRateLimiter
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "fixtures", "linkedin")
+
+def _fixture(name: str) -> bytes:
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serves saved LinkedIn pages at the paths the scraper requests."""
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        if parsed.path.startswith("/jobs/view/walled"):
+            self.send_response(302)
+            self.send_header("Location", "/authwall?trk=job")
+            self.end_headers()
+            return
+        if parsed.path.startswith("/jobs/view/expired"):
+            body = b"<html><body><p>No longer accepting applications</p></body></html>"
+        elif parsed.path.startswith("/jobs/view/"):
+            body = _fixture("job_view.html")
+        elif parsed.path == "/authwall":
+            body = _fixture("authwall.html")
+        elif parsed.path == "/jobs/search":
+            body = _fixture("search.html")
+        elif parsed.path.startswith("/jobs-guest/"):
+            start = int(parse_qs(parsed.query).get("start", ["0"])[0])
+            body = _fixture("guest_page.html") if start == 2 else b""
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture(scope="module")
+def fixture_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+@pytest.fixture
+def scraper(fixture_server):
+    scraper = LinkedInHttpScraper(
+        base_url=fixture_server, browser_fallback=False, search_requests_per_second=1000
+    )
+    yield scraper
+    scraper.stop_browser()
+
+def test_http_scrape_job(scraper, fixture_server):
+    """Test that a public job view is parsed into a Job without a browser"""
+    url = f"{fixture_server}/jobs/view/1001"
+    job = scraper.scrape_job(url)
+
+    assert job.title == "Software Engineer, New Grad"
+    assert job.company == "Acme Corp"
+    assert job.location == "San Francisco, CA"
+    assert "Python & Go" in job.description
+    assert "0-2 years of experience" in job.description
+    assert job.url == url and job.source == "linkedin"
+
+def test_http_search_paginates_guest_endpoint(scraper):
+    """Test that search reads the first page, then pages by offset until the limit"""
+    jobs, total = scraper.search_jobs("Software", "United States", filters={"time": "24h"}, limit=3)
+
+    assert total == "1,000+"
+    assert [j.company for j in jobs] == ["Acme Corp", "Globex", "Initech"]
+    assert jobs[0].url == "https://www.linkedin.com/jobs/view/1001"
+    assert jobs[1].raw_data["posted_text"] == "5 hours ago (Reposted)"
+
+def test_http_search_stops_at_end_of_results(scraper):
+    """Test that an empty guest page ends pagination"""
+    jobs, _ = scraper.search_jobs("Software", "United States", limit=50)
+    assert len(jobs) == 4
+
+def test_auth_wall_uses_browser_fallback(scraper, fixture_server):
+    """Test that an auth wall redirect is handed to the browser scraper"""
+    url = f"{fixture_server}/jobs/view/walled"
+    scraper.rate_limiter = HostRateLimiter(1000.0, adaptive=True, backoff=0.01)
+    assert scraper.scrape_job(url) is None
+
+    class FakeBrowserScraper:
+        def scrape_job(self, url):
+            return "from-browser"
+
+        def stop_browser(self):
+            pass
+
+    scraper.browser_fallback = True
+    scraper._fallback = FakeBrowserScraper()
+    assert scraper.scrape_job(url) == "from-browser"
+    assert scraper.fallbacks == 1
+
+def test_expired_job_skips_browser_fallback(scraper, fixture_server):
+    """Test that a page without a job card is a failed scrape, not a reason to start the browser"""
+    class FakeBrowserScraper:
+        def scrape_job(self, url):
+            raise AssertionError("browser started")
+
+        def stop_browser(self):
+            pass
+
+    scraper.browser_fallback = True
+    scraper._fallback = FakeBrowserScraper()
+    assert scraper.scrape_job(f"{fixture_server}/jobs/view/expired") is None
+    assert scraper.fallbacks == 0
+
+def test_http_concurrent_scrape(scraper, fixture_server):
+    """Test that concurrent fetching yields every URL once"""
+    urls = [f"{fixture_server}/jobs/view/{i}" for i in range(5)]
+    results = dict(scraper.scrape_jobs_concurrently(urls, concurrency=3, requests_per_second=1000))
+
+    assert set(results) == set(urls)
+    assert all(job.title == "Software Engineer, New Grad" for job in results.values())
+
+class ThrottlingHandler(FixtureHandler):
+    """Serves job views, answering 429 to the requests numbered in `throttled`."""
+    throttled = set()
+    served = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with ThrottlingHandler.lock:
+            ThrottlingHandler.served += 1
+            n = ThrottlingHandler.served
+        if n in self.throttled:
+            self.send_response(429)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        super().do_GET()
+
+def test_adaptive_rate_backs_off_on_throttling():
+    """Test that 429s cut the rate and pause requests, and healthy responses win it back"""
+    ThrottlingHandler.throttled, ThrottlingHandler.served = {4, 5, 6}, 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ThrottlingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    scraper = LinkedInHttpScraper(base_url=base, browser_fallback=False)
+    limiter = scraper.rate_limiter = HostRateLimiter(100.0, adaptive=True, backoff=0.05)
+
+    rates, jobs = [], []
+    started = time.monotonic()
+    try:
+        for i in range(12):
+            url = f"{base}/jobs/view/{i}"
+            limiter.acquire(url)
+            jobs.append(scraper.scrape_job(url))
+            rates.append(limiter.rates()[f"127.0.0.1:{server.server_port}"])
+    finally:
+        scraper.stop_browser()
+        server.shutdown()
+    elapsed = time.monotonic() - started
+
+    assert [job is None for job in jobs] == [False] * 3 + [True] * 3 + [False] * 6
+    assert rates[2] > 100.0  # sped up while healthy
+    assert rates[5] == pytest.approx(rates[2] / 8)  # halved on each 429
+    assert rates[-1] > rates[5]  # recovering
+    assert elapsed >= 0.05 + 0.1 + 0.2  # cooldowns doubled between consecutive throttles
+    assert limiter.bucket_for(base).throttles == 3
+
+def test_browser_fallback_respects_throttling():
+    """Test that a 429 is not retried in the browser and an auth wall is only after the cooldown"""
+    ThrottlingHandler.throttled, ThrottlingHandler.served = {1}, 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ThrottlingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    scraper = LinkedInHttpScraper(base_url=base, browser_fallback=True)
+    scraper.rate_limiter = HostRateLimiter(100.0, adaptive=True, backoff=0.05)
+    browser_calls = []
+
+    class FakeBrowserScraper:
+        def scrape_job(self, url):
+            browser_calls.append(time.monotonic())
+            return "from-browser"
+
+        def stop_browser(self):
+            pass
+
+    scraper._fallback = FakeBrowserScraper()
+    try:
+        assert scraper.scrape_job(f"{base}/jobs/view/1") is None
+        assert browser_calls == []
+        walled_at = time.monotonic()
+        assert scraper.scrape_job(f"{base}/jobs/view/walled") == "from-browser"
+    finally:
+        scraper.stop_browser()
+        server.shutdown()
+
+    assert scraper.fallbacks == 1
+    assert browser_calls[0] - walled_at >= 0.1  # second consecutive throttle doubles the 0.05s cooldown
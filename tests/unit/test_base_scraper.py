@@ -0,0 +1,80 @@
+from contextlib import asynccontextmanager
+import playwright.async_api
+from app.scraping.base import BaseScraper
+
+class FakeAsyncPage:
+    def __init__(self):
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+class DyingContext:
+    """Hands out `alive` pages, then fails like a context whose browser crashed."""
+
+    def __init__(self, alive: int):
+        self.alive = alive
+
+    async def new_page(self):
+        if self.alive == 0:
+            raise RuntimeError("Target page, context or browser has been closed")
+        self.alive -= 1
+        return FakeAsyncPage()
+
+    def on(self, event, handler):
+        pass
+
+class FakeBrowser:
+    def __init__(self, context):
+        self.context = context
+
+    async def new_context(self, **kwargs):
+        return self.context
+
+    async def close(self):
+        pass
+
+def fake_async_playwright(context):
+    class Chromium:
+        async def launch(self, headless=True):
+            return FakeBrowser(context)
+
+    class Playwright:
+        chromium = Chromium()
+
+    @asynccontextmanager
+    async def async_playwright():
+        yield Playwright()
+    return async_playwright
+
+class AsyncScraper(BaseScraper):
+    def __init__(self):
+        super().__init__(None, block_resources=False, requests_per_second=1000)
+        self.scraped = []
+
+    def search_jobs(self, query, location, filters=None, limit=10):
+        return [], "0"
+
+    def scrape_job(self, url):
+        raise AssertionError("sequential path used")
+
+    async def scrape_job_async(self, page, url):
+        self.scraped.append(url)
+        # Every page dies with its first request, and the context cannot replace it
+        page.closed = True
+        return None
+
+def test_concurrent_scrape_fails_fast_when_pages_cannot_be_replaced(monkeypatch):
+    """Test that a dead context fails the remaining URLs instead of cancelling the whole batch"""
+    monkeypatch.setattr(playwright.async_api, "async_playwright", fake_async_playwright(DyingContext(alive=2)))
+    scraper = AsyncScraper()
+    urls = [f"https://example.com/{i}" for i in range(6)]
+
+    results = dict(scraper.scrape_jobs_concurrently(urls, concurrency=2, requests_per_second=1000))
+
+    assert results == {url: None for url in urls}
+    assert len(scraper.scraped) == 2  # one request per page before the pool ran dry
+    assert scraper.metrics.pages_created == 2
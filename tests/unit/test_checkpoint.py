@@ -0,0 +1,166 @@
+import csv
+from contextlib import contextmanager
+import pytest
+from app.models.resume import NormalizedResume
+from app.normalization.job_parser import JobParser
+from app.pipeline import runner
+from app.pipeline.checkpoint import RunJournal
+from app.pipeline.config import RunConfig
+from app.scraping.base import BaseScraper
+from app.storage.job_cache import JobCache
+from app.storage.result_store import ResultStore
+from app.storage.streaming_exporter import StreamingCsvExporter
+
+class FlakyScraper(BaseScraper):
+    def __init__(self, make_job, fail_on=None):
+        super().__init__(None, requests_per_second=1000)
+        self.make_job = make_job
+        self.fail_on = fail_on
+        self.searches = 0
+        self.scraped = []
+
+    def search_jobs(self, keywords, location, filters=None, limit=10):
+        self.searches += 1
+        return [self._job(i, "") for i in range(4)], "4"
+
+    def scrape_job(self, url):
+        if url == self.fail_on:
+            raise KeyboardInterrupt
+        self.scraped.append(url)
+        return self._job(int(url.rsplit("/", 1)[1]), "Python, 1+ years")
+
+    def _job(self, i, description):
+        return self.make_job(i, title=f"Engineer {i}", description=description)
+
+def test_resume_run_skips_finished_jobs(tmp_path, monkeypatch, make_job):
+    """Test that a resumed run reuses the search and only scrapes jobs the interrupted run did not finish"""
+    scrapers = [FlakyScraper(make_job, fail_on="https://example.com/2"), FlakyScraper(make_job)]
+
+    @contextmanager
+    def open_scraper(config, cache=None):
+        yield scrapers.pop(0)
+
+    monkeypatch.setattr(runner, "open_scraper", open_scraper)
+    first, second = scrapers
+    config = RunConfig(output=str(tmp_path / "out"), skills=["python"], years_of_experience=2,
+                       cache_path=None, store_root=None, requests_per_second=1000)
+
+    with pytest.raises(KeyboardInterrupt):
+        runner.run_pipeline(config)
+    journal = RunJournal.load(config.journal_path())
+    assert not journal.finished
+    assert sorted(journal.done) == ["https://example.com/0", "https://example.com/1"]
+
+    exported = runner.run_pipeline(config.model_copy(update={"resume_run": True}))
+
+    assert (first.searches, second.searches) == (1, 0)
+    assert second.scraped == ["https://example.com/2", "https://example.com/3"]
+    assert exported == 4
+    with open(f"{config.output}.csv", newline="", encoding="utf-8") as f:
+        assert sorted(row["Role"] for row in csv.DictReader(f)) == [f"Engineer {i}" for i in range(4)]
+    assert RunJournal.load(config.journal_path()).finished
+
+def test_resume_run_restores_store_rows_lost_in_a_hard_kill(tmp_path, monkeypatch, make_job):
+    """Test that journaled jobs whose store batch never reached disk are appended on resume"""
+    pytest.importorskip("pyarrow")
+    from app.storage.parquet_store import ParquetAppender, ParquetJobStore
+
+    scrapers = [FlakyScraper(make_job, fail_on="https://example.com/2"), FlakyScraper(make_job)]
+
+    @contextmanager
+    def open_scraper(config, cache=None):
+        yield scrapers.pop(0)
+
+    monkeypatch.setattr(runner, "open_scraper", open_scraper)
+    config = RunConfig(output=str(tmp_path / "out"), skills=["python"], years_of_experience=2, cache_path=None,
+                       store_root=str(tmp_path / "store"), requests_per_second=1000)
+
+    # A killed process never gets to flush the appender's buffer
+    with monkeypatch.context() as killed:
+        killed.setattr(ParquetAppender, "close", lambda self: None)
+        with pytest.raises(KeyboardInterrupt):
+            runner.run_pipeline(config)
+    assert RunJournal.load(config.journal_path()).unstored()
+
+    runner.run_pipeline(config.model_copy(update={"resume_run": True}))
+
+    stored = ParquetJobStore(config.store_root).read(columns=["job_id"]).column("job_id").to_pylist()
+    assert sorted(stored) == [f"https://example.com/{i}" for i in range(4)]
+    assert not RunJournal.load(config.journal_path()).unstored()
+
+def test_failed_export_is_reported_and_not_journaled(tmp_path, monkeypatch, make_job):
+    """Test that a job whose export raises is listed as failed and left for --resume-run"""
+    @contextmanager
+    def open_scraper(config, cache=None):
+        yield FlakyScraper(make_job)
+
+    real_write = StreamingCsvExporter.write
+    def write(self, job, *args):
+        if job.url == "https://example.com/1":
+            raise OSError("disk full")
+        real_write(self, job, *args)
+
+    monkeypatch.setattr(runner, "open_scraper", open_scraper)
+    monkeypatch.setattr(StreamingCsvExporter, "write", write)
+    config = RunConfig(output=str(tmp_path / "out"), skills=["python"], years_of_experience=2,
+                       cache_path=None, store_root=None, requests_per_second=1000)
+    profiler = runner.Profiler()
+
+    assert runner.run_pipeline(config, profiler=profiler) == 3
+    assert profiler.details["failed_jobs"] == [
+        {"stage": "export", "url": "https://example.com/1", "error": "OSError: disk full"}
+    ]
+    journal = RunJournal.load(config.journal_path())
+    assert not journal.finished and not journal.is_done("https://example.com/1")
+
+def test_resume_run_rejects_a_different_search(tmp_path):
+    """Test that a journal only resumes the run it was written for"""
+    journal = RunJournal(str(tmp_path / "run.journal.jsonl"))
+    journal.start(RunConfig(query="Backend"))
+    journal.close()
+
+    with pytest.raises(ValueError):
+        RunJournal.load(journal.path).resume(RunConfig(query="Frontend"))
+
+def test_resume_run_rejects_a_different_resume_profile(tmp_path):
+    """Test that a journal only resumes with the resume profile its scores came from"""
+    config = RunConfig(query="Backend")
+    profile = NormalizedResume(skills=["python"], years_of_experience=2, visa_status="Visa Required")
+    journal = RunJournal(str(tmp_path / "run.journal.jsonl"))
+    journal.start(config, profile)
+    journal.close()
+
+    with pytest.raises(ValueError, match="resume profile"):
+        RunJournal.load(journal.path).resume(config, profile.model_copy(update={"years_of_experience": 5}))
+    RunJournal.load(journal.path).resume(config, profile.model_copy())
+
+def test_live_run_only_remembers_finished_urls(tmp_path, make_job):
+    """Test that recording a job keeps its URL, not the job, while loaded jobs stay pending"""
+    journal = RunJournal(str(tmp_path / "run.journal.jsonl"))
+    journal.start(RunConfig())
+    job = make_job(1, description="Python")
+    journal.record_job(job, JobParser().parse_record(job), 0.5, "LOW PRIORITY")
+    journal.close()
+
+    assert journal.is_done(job.url) and not journal.pending
+    assert [entry[0] for entry in RunJournal.load(journal.path).pending_exports()] == [job]
+
+def test_run_pipeline_closes_cache_and_store_when_nothing_is_found(tmp_path, monkeypatch, make_job):
+    """Test that the early "No jobs found" return still closes the job cache and result store"""
+    class EmptyScraper(FlakyScraper):
+        def search_jobs(self, keywords, location, filters=None, limit=10):
+            return [], "0"
+
+    @contextmanager
+    def open_scraper(config, cache=None):
+        yield EmptyScraper(make_job)
+
+    closed = []
+    monkeypatch.setattr(runner, "open_scraper", open_scraper)
+    monkeypatch.setattr(JobCache, "close", lambda self: closed.append("cache"))
+    monkeypatch.setattr(ResultStore, "close", lambda self: closed.append("store"))
+    config = RunConfig(output=str(tmp_path / "out"), skills=["python"], years_of_experience=2,
+                       cache_path=str(tmp_path / "cache.db"), store_root=None, requests_per_second=1000)
+
+    assert runner.run_pipeline(config) == 0
+    assert closed == ["store", "cache"]
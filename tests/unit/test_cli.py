@@ -0,0 +1,67 @@
+import json
+import pytest
+from app.main import build_config, build_parser, main
+
+def test_cli_flags_override_config_file(tmp_path):
+    """Test that explicit flags win over config file values"""
+    config_file = tmp_path / "run.json"
+    config_file.write_text(json.dumps({"query": "Data", "limit": "all", "concurrency": 2}))
+
+    args = build_parser().parse_args([
+        "--config", str(config_file), "run", "--query", "Backend", "--level", "entry",
+        "--level", "associate", "--no-store"
+    ])
+    config = build_config(args)
+
+    assert config.query == "Backend"
+    assert config.limit == 1000
+    assert config.concurrency == 2
+    assert config.experience == ["entry", "associate"]
+    assert config.store_root is None
+    assert config.cache_path == "job_cache.db"
+
+def test_cli_normalize_score_export(tmp_path, make_job):
+    """Test the offline subcommands chained through JSONL files"""
+    jobs_file = tmp_path / "jobs.jsonl"
+    jobs_file.write_text("".join(
+        make_job(i, title="Engineer", description=description).model_dump_json() + "\n"
+        for i, description in enumerate(["Python and AWS, 2+ years", "Java, 7+ years, US citizen only"])
+    ))
+    normalized = tmp_path / "normalized.jsonl"
+    scores = tmp_path / "scores.jsonl"
+    output = tmp_path / "out.csv"
+    cache = ["--cache", str(tmp_path / "cache.db")]
+
+    main(["normalize", "--jobs", str(jobs_file), "--out", str(normalized), *cache])
+    main(["score", "--normalized", str(normalized), "--out", str(scores), "--skills", "python,aws",
+          "--years", "2", *cache])
+    main(["export", "--jobs", str(jobs_file), "--normalized", str(normalized), "--scores", str(scores),
+          "--output", str(output)])
+
+    rows = [json.loads(line) for line in scores.read_text().splitlines()]
+    assert [r["recommendation"] for r in rows] == ["STRONG APPLY", "SKIP"]
+    assert len(output.read_text().splitlines()) == 3
+
+def test_cli_rank_lists_stored_jobs(tmp_path, capsys, make_job):
+    """Test that rank prints the best stored jobs for the resume"""
+    pytest.importorskip("pyarrow")
+    from app.models.normalized_job import NormalizedJob
+    from app.storage.parquet_store import ParquetJobStore
+
+    store = ParquetJobStore(str(tmp_path / "store"))
+    jobs = [make_job(i, title=f"Engineer {i}") for i in range(3)]
+    store.append(jobs, [
+        NormalizedJob(job_id=jobs[0].id, required_skills=["java"], experience_years=7.0),
+        NormalizedJob(job_id=jobs[1].id, required_skills=["python"], experience_years=1.0),
+        NormalizedJob(job_id=jobs[2].id, required_skills=["python", "go"], experience_years=1.0),
+    ])
+
+    main(["rank", "--store", str(tmp_path / "store"), "--skills", "python", "--years", "2",
+          "--top", "2", "--days", "30"])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert "Top 2 of 3 stored jobs" in lines
+    assert lines[-2:] == [
+        f"  1.00 [STRONG APPLY] Test Corp: Engineer 1 {jobs[1].id}",
+        f"  0.80 [APPLY] Test Corp: Engineer 2 {jobs[2].id}",
+    ]
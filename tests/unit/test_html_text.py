@@ -0,0 +1,46 @@
+import os
+import pytest
+from app.normalization.job_parser import JobParser
+from app.scraping import html_text, linkedin_html
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "fixtures", "linkedin")
+
+def test_lxml_text_keeps_headings_and_bullets():
+    """Test that the lxml extractor keeps section structure without markdown noise"""
+    raw_html = (
+        "<div><strong>About</strong><br><br>We build <b>payments</b><br>at scale &amp; speed"
+        "<h3>Requirements</h3><ul><li>Python</li><li>Cloud<ul><li>AWS</li></ul></li></ul>"
+        "<script>track()</script><p>3+ years</p></div>"
+    )
+
+    assert html_text.lxml_text(raw_html) == (
+        "About\n\nWe build payments\nat scale & speed\n\nRequirements\n\n"
+        "- Python\n- Cloud\n  - AWS\n\n3+ years"
+    )
+    assert html_text.lxml_text("") == ""
+
+def test_lxml_text_handles_documents_lxml_rejects():
+    """Test that comment-only HTML and encoding declarations do not raise"""
+    assert html_text.lxml_text("<!-- nothing here -->") == ""
+    assert html_text.lxml_text('<?xml version="1.0" encoding="utf-8"?><p>Python &amp; Go</p>') == "Python & Go"
+
+def test_extractors_parse_to_the_same_signals():
+    """Test that switching extractors leaves the parsed job unchanged and keeps the raw HTML"""
+    with open(os.path.join(FIXTURES, "job_view.html"), encoding="utf-8") as f:
+        fields = linkedin_html.parse_job_page(f.read())
+    parser = JobParser()
+
+    parsed = {}
+    try:
+        for name in html_text.EXTRACTORS:
+            html_text.set_extractor(name)
+            job = linkedin_html.build_job("https://example.com/1", fields["title"], fields["company"],
+                                          fields["location"], fields["description_html"])
+            assert job.raw_data["description_html"] == fields["description_html"]
+            parsed[name] = parser.parse_fields(job.description)
+    finally:
+        html_text.set_extractor("lxml")
+
+    assert parsed["lxml"] == parsed["html2text"]
+    with pytest.raises(ValueError):
+        html_text.set_extractor("regex")
@@ -0,0 +1,43 @@
+import pytest
+from app.models.resume import NormalizedResume
+from app.normalization.job_parser import JobParser
+from app.otpm.engine import OTPMEngine
+from app.pipeline.incremental import IncrementalEvaluator
+from app.storage.result_store import ResultStore
+
+@pytest.fixture
+def jobs(make_job):
+    return [
+        make_job(1, description="Python and AWS, 2+ years. Visa sponsorship available."),
+        make_job(2, description="Java, Kafka and SQL. 5+ years. US citizen only."),
+        make_job(3, description="Python and AWS, 2+ years. Visa sponsorship available."),
+    ]
+
+def test_incremental_matches_full_recompute(tmp_path, jobs):
+    """Test that incremental results equal a plain parse + score"""
+    parser, engine = JobParser(), OTPMEngine()
+    resume = NormalizedResume(skills=["python", "aws"], years_of_experience=2, visa_status="Visa Required")
+    evaluator = IncrementalEvaluator(parser, engine, ResultStore(str(tmp_path / "results.db")))
+
+    normalized, scores = evaluator.evaluate(jobs, resume)
+
+    assert [n.to_model() for n in normalized] == [parser.parse(job) for job in jobs]
+    assert scores == [engine.calculate_probability(parser.parse(job), resume) for job in jobs]
+
+def test_incremental_only_recomputes_delta(tmp_path, jobs):
+    """Test that a second run reuses stored results and a resume tweak only re-scores"""
+    path = str(tmp_path / "results.db")
+    resume = NormalizedResume(skills=["python"], years_of_experience=1)
+
+    first = IncrementalEvaluator(JobParser(), OTPMEngine(), ResultStore(path))
+    first.evaluate(jobs, resume)
+    # Identical descriptions share one parse and one score
+    assert first.stats() == {
+        "normalized_reused": 1, "normalized_computed": 2, "scores_reused": 1, "scores_computed": 2
+    }
+
+    second = IncrementalEvaluator(JobParser(), OTPMEngine(), ResultStore(path))
+    second.evaluate(jobs, resume.model_copy(update={"years_of_experience": 5}))
+    assert second.stats() == {
+        "normalized_reused": 3, "normalized_computed": 0, "scores_reused": 1, "scores_computed": 2
+    }
@@ -0,0 +1,35 @@
+from app.storage.job_cache import JobCache
+
+JOB_FIELDS = dict(description="Python and SQL", raw_data={"posted_text": "1 hour ago"})
+
+def test_job_cache_round_trip(tmp_path, make_job):
+    """Test that cached jobs come back intact and are counted as hits"""
+    cache = JobCache(str(tmp_path / "cache.db"))
+    assert cache.get_job("https://example.com/1") is None
+
+    cache.put_job(make_job("https://example.com/1", **JOB_FIELDS), fetch_seconds=4.0)
+    job = cache.get_job("https://example.com/1")
+
+    assert job == make_job("https://example.com/1", **JOB_FIELDS)
+    stats = cache.stats()
+    assert stats["job_hits"] == 1
+    assert stats["job_misses"] == 1
+    assert stats["browser_seconds_saved"] == 4.0
+
+def test_job_cache_ttl_expiry(tmp_path, make_job):
+    """Test that entries older than the TTL are misses and get purged"""
+    cache = JobCache(str(tmp_path / "cache.db"), ttl_seconds=60)
+    cache.put_job(make_job("https://example.com/1", **JOB_FIELDS))
+    cache.put_cards([make_job("https://example.com/2", **JOB_FIELDS)])
+
+    cache.ttl_seconds = -1  # everything written so far is now stale
+    assert not cache.has_job("https://example.com/1")
+    assert cache.get_card("https://example.com/2") is None
+    assert cache.purge_expired() == 2
+
+def test_job_cache_persists_between_runs(tmp_path, make_job):
+    """Test that a second cache instance sees earlier runs"""
+    path = str(tmp_path / "cache.db")
+    JobCache(path).put_cards([make_job("https://example.com/1", **JOB_FIELDS)])
+
+    assert JobCache(path).get_card("https://example.com/1").title == "Software Engineer"
@@ -0,0 +1,55 @@
+import pytest
+
+pytest.importorskip("lxml")
+
+from app.scraping import linkedin_html
+
+def _fragment(start: int, count: int) -> str:
+    return "".join(
+        f'<li><a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/{i}?trk=x"></a>'
+        f'<h3 class="base-search-card__title">Job {i}</h3>'
+        f'<h4 class="base-search-card__subtitle">Company {i}</h4><time>1 day ago</time></li>'
+        for i in range(start, start + count)
+    )
+
+def test_search_url_builds_filters_and_offsets():
+    """Test that filters map to LinkedIn params and offsets use the guest endpoint"""
+    url = linkedin_html.search_url("Software Engineer", "United States",
+                                   {"time": "12h", "experience": ["entry", "associate"]})
+    assert url.startswith("https://www.linkedin.com/jobs/search?")
+    assert "keywords=Software+Engineer" in url
+    assert "f_TPR=r43200" in url and "f_E=2,3" in url and "sortBy=DD" in url
+
+    paged = linkedin_html.search_url("Software", "US", start=25)
+    assert linkedin_html.GUEST_SEARCH_PATH in paged and paged.endswith("start=25")
+
+def test_parse_search_cards_cleans_urls():
+    """Test that cards are parsed from a bare <li> fragment with tracking params dropped"""
+    cards = linkedin_html.parse_search_cards(_fragment(0, 2))
+    assert [c["url"] for c in cards] == [
+        "https://www.linkedin.com/jobs/view/0", "https://www.linkedin.com/jobs/view/1"
+    ]
+    assert cards[1]["title"] == "Job 1" and cards[1]["company"] == "Company 1"
+
+def test_collect_cards_fetches_pages_concurrently_until_limit():
+    """Test that offsets are requested in rounds and stop at the limit"""
+    calls = []
+
+    def fetch_pages(offsets):
+        calls.append(list(offsets))
+        return [_fragment(offset, 10) for offset in offsets]
+
+    first = linkedin_html.parse_search_cards(_fragment(0, 25))
+    cards = linkedin_html.collect_cards(first, fetch_pages, limit=80, concurrency=4)
+
+    assert len(cards) == 80
+    assert calls == [[25], [35, 45, 55, 65], [75]]
+    assert len({c["url"] for c in cards}) == 80
+
+def test_collect_cards_stops_on_empty_page():
+    """Test that an empty page ends pagination even below the limit"""
+    def fetch_pages(offsets):
+        return [_fragment(offset, 10) if offset < 20 else "" for offset in offsets]
+
+    cards = linkedin_html.collect_cards([], fetch_pages, limit=1000, concurrency=4)
+    assert len(cards) == 20
@@ -0,0 +1,55 @@
+import json
+import httpx
+import pytest
+from app import metrics
+from app.main import main
+from app.metrics import MetricsRegistry
+from app.scraping.simplify import SimplifyScraper
+
+def test_registry_counters_histograms_and_nested_spans(tmp_path):
+    """Test that spans nest, feed histograms and dump as JSON and Prometheus text"""
+    registry = MetricsRegistry()
+    registry.inc("jobs_scraped", source="linkedin")
+    registry.inc("jobs_scraped", 2, source="linkedin")
+    with registry.span("scrape_job", scraper="Test"):
+        with registry.span("page.goto"):
+            pass
+    registry.timed("parse")(lambda: None)()
+
+    summary = registry.summary()
+    assert summary["counters"] == {"jobs_scraped{source=linkedin}": 3}
+    assert summary["histograms"]["parse"]["count"] == 1
+    assert summary["histograms"]["scrape_job{scraper=Test}"]["count"] == 1
+    events = {e["name"]: e for e in summary["traceEvents"]}
+    assert set(events) == {"scrape_job", "page.goto"}
+    assert events["page.goto"]["args"] == {"parent": "scrape_job"}
+
+    text = registry.to_prometheus()
+    assert 'oa_jobs_scraped_total{source="linkedin"} 3' in text
+    assert 'oa_page_goto_seconds_bucket{le="+Inf"} 1' in text
+    assert 'oa_scrape_job_seconds_count{scraper="Test"} 1' in text
+
+    registry.dump(str(tmp_path / "metrics.json"))
+    assert json.loads((tmp_path / "metrics.json").read_text())["counters"]["jobs_scraped{source=linkedin}"] == 3
+
+def test_scraper_entry_points_are_traced():
+    """Test that scraper subclasses get spans and failure counts without opting in"""
+    def handler(request):
+        return httpx.Response(404 if request.url.path.endswith("missing") else 200, text="<html></html>")
+
+    metrics.reset()
+    scraper = SimplifyScraper(client=httpx.Client(transport=httpx.MockTransport(handler)))
+    scraper.scrape_job("https://simplify.jobs/p/missing")
+    scraper.search_jobs("Software", "Remote")
+
+    summary = metrics.registry().summary()
+    assert summary["histograms"]["scrape_job{scraper=SimplifyScraper}"]["count"] == 1
+    assert summary["histograms"]["search_jobs{scraper=SimplifyScraper}"]["count"] == 1
+    assert summary["counters"]["scrape_failures{scraper=SimplifyScraper}"] == 1
+
+def test_metrics_written_when_command_fails(tmp_path):
+    """Test that a command that raises still dumps its metrics"""
+    out = tmp_path / "metrics.json"
+    with pytest.raises(FileNotFoundError):
+        main(["--metrics-out", str(out), "normalize", "--jobs", str(tmp_path / "missing.jsonl"), "--no-cache"])
+    assert "counters" in json.loads(out.read_text())
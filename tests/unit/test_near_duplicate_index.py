@@ -0,0 +1,57 @@
+import pytest
+from app.storage.export_rows import job_status
+from app.storage.near_duplicate_index import NearDuplicateIndex
+
+BASE = (
+    "We are hiring a new grad software engineer to build backend services in Python and Go. "
+    "You will design APIs, write tests, review code and operate services on AWS with Docker "
+    "and Kubernetes. Requirements: BS in Computer Science, 0-2 years of experience, strong "
+    "fundamentals in data structures and algorithms. Visa sponsorship is available for this role. "
+    "Benefits include health insurance, 401k matching, flexible hours and a learning budget."
+)
+
+@pytest.fixture
+def posting(make_job):
+    def make(n: int, description: str):
+        return make_job(f"https://www.linkedin.com/jobs/view/{n}", description=description,
+                        company="Acme", location="Austin, TX")
+    return make
+
+def test_relisting_is_flagged_with_original_id(tmp_path, posting):
+    """Test that a lightly edited re-listing under a new URL is matched to the original"""
+    index = NearDuplicateIndex(str(tmp_path / "cache.db"))
+    original = posting(1, BASE)
+    relisted = posting(2, BASE.replace("learning budget", "generous learning budget"))
+    unrelated = posting(3, "Senior staff accountant for month-end close, audits and tax filings. CPA required.")
+
+    assert index.check(original) is None
+    assert index.check(relisted) == original.id
+    assert relisted.raw_data["duplicate_of"] == original.id
+    assert relisted.raw_data["duplicate_similarity"] >= 0.8
+    assert index.check(unrelated) is None
+    assert job_status(relisted) == "Repost" and job_status(original) == "Fresh"
+
+def test_index_persists_and_resolves_chains(tmp_path, posting):
+    """Test that matches survive a reopen and re-listings of re-listings point at the first posting"""
+    path = str(tmp_path / "cache.db")
+    index = NearDuplicateIndex(path)
+    index.check(posting(1, BASE))
+    index.check(posting(2, BASE + " Apply today."))
+    index.close()
+
+    reopened = NearDuplicateIndex(path)
+    assert reopened.known_duplicate(posting(2, "").id) == posting(1, "").id
+    assert reopened.check(posting(3, BASE + " Apply today!")) == posting(1, "").id
+    # Re-checking the same posting is not a duplicate of itself
+    assert reopened.check(posting(1, BASE)) is None
+    assert reopened.stats()["indexed"] == 3
+
+def test_candidate_lookup_is_chunked(tmp_path, monkeypatch):
+    """Test that candidates spread over several IN lists are all compared"""
+    monkeypatch.setattr(NearDuplicateIndex, "_CHUNK", 2)
+    index = NearDuplicateIndex(str(tmp_path / "cache.db"))
+    for n in range(4):
+        index.add(f"variant-{n}", index.signature(BASE + f" Apply by day {n}."))
+    index.add("exact", index.signature(BASE))
+
+    assert index.query(index.signature(BASE)) == ("exact", 1.0)
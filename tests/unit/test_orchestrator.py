@@ -0,0 +1,164 @@
+from contextlib import contextmanager
+import pytest
+from app.normalization.fingerprint import job_fingerprint
+from app.scraping.base import BaseScraper
+from app.scraping.orchestrator import CrossSourceIndex, ScrapeOrchestrator
+
+@pytest.fixture
+def card(make_job):
+    def make(source: str, n: int, company: str, title: str, location: str):
+        return make_job(f"https://{source}.example/jobs/{n}", company=company, title=title,
+                        location=location, source=source)
+    return make
+
+class FakeScraper(BaseScraper):
+    def __init__(self, source: str, cards):
+        super().__init__(None)
+        self.source = source
+        self.cards = cards
+        self.scraped = []
+
+    def search_jobs(self, query, location, filters=None, limit=10):
+        return self.cards[:limit], str(len(self.cards))
+
+    def scrape_job(self, url):
+        self.scraped.append(url)
+        card = next(c for c in self.cards if c.url == url)
+        return card.model_copy(update={"description": f"details of {url}"})
+
+def factory(scraper):
+    @contextmanager
+    def open_fake():
+        yield scraper
+    return open_fake
+
+def test_fingerprint_normalizes_board_differences():
+    """Test that suffixes, abbreviations and country noise do not change the fingerprint"""
+    assert job_fingerprint("Acme, Inc.", "Sr. Software Engineer (Req 123)", "Austin, TX, United States") == \
+        job_fingerprint("ACME", "Senior Software Engineer", "Austin, TX")
+    assert job_fingerprint("Acme", "Software Engineer", "Austin, TX") != \
+        job_fingerprint("Acme", "Software Engineer", "Boston, MA")
+
+def test_cross_source_index_matches_unknown_location():
+    """Test that a posting without a specific location matches any location under its key"""
+    index = CrossSourceIndex()
+    assert index.claim("linkedin", "Acme", "Software Engineer", "Austin, TX", "a") is None
+    assert index.claim("linkedin", "Acme", "Software Engineer", "Boston, MA", "b") is None
+    assert index.claim("simplify", "Acme Inc", "Software Engineer", "United States", "c") == "a"
+    assert index.claim("linkedin", "Acme", "Software Engineer", "Austin, TX", "a") is None
+
+def test_cross_source_index_matches_any_listed_location():
+    """Test that a multi-location posting matches a single-location one at any of its places"""
+    index = CrossSourceIndex()
+    assert index.claim("linkedin", "Acme", "Software Engineer", "Austin, TX", "a") is None
+    assert index.claim("simplify", "Acme", "Software Engineer", "Boston, MA; Austin, TX", "b") == "a"
+    assert index.claim("simplify", "Acme", "Software Engineer", "Denver, CO; Seattle, WA", "c") is None
+
+def test_cross_source_index_keeps_openings_from_one_source():
+    """Test that same-title postings on one board stay distinct even when one location is vague"""
+    index = CrossSourceIndex()
+    assert index.claim("simplify", "Acme", "Software Engineer", "Austin, TX", "a") is None
+    assert index.claim("simplify", "Acme", "Software Engineer", "Remote", "b") is None
+    assert index.claim("simplify", "Acme", "Software Engineer", "Boston, MA", "c") is None
+    assert index.claim("linkedin", "Acme", "Software Engineer", "Boston, MA", "d") == "c"
+
+def test_cross_source_index_skips_link_only_cards():
+    """Test that cards without a company or title are never claimed as duplicates"""
+    index = CrossSourceIndex()
+    for source, url in (("jobright", "a"), ("jobright", "b"), ("simplify", "c")):
+        assert index.claim(source, "Unknown Company", "", "Unknown Location", url) is None
+
+def test_orchestrator_scrapes_cross_posted_jobs_once(card):
+    """Test that a job listed on several boards is detailed and yielded once"""
+    linkedin = FakeScraper("linkedin", [
+        card("linkedin", 1, "Acme", "Software Engineer", "Austin, TX"),
+        card("linkedin", 2, "Globex", "Data Engineer", "Remote"),
+    ])
+    simplify = FakeScraper("simplify", [
+        card("simplify", 1, "Acme, Inc.", "Software Engineer", "Austin, TX, USA"),
+        card("simplify", 2, "Initech", "Backend Engineer", "Boston, MA"),
+    ])
+    orchestrator = ScrapeOrchestrator(
+        {"linkedin": factory(linkedin), "simplify": factory(simplify)}, requests_per_second=1000
+    )
+
+    jobs = list(orchestrator.run("Software", "United States", limit=10))
+
+    assert sorted((j.company.split(",")[0], j.title) for j in jobs) == [
+        ("Acme", "Software Engineer"), ("Globex", "Data Engineer"), ("Initech", "Backend Engineer")
+    ]
+    assert len(linkedin.scraped) + len(simplify.scraped) == 3
+    report = orchestrator.report()
+    assert report["linkedin"]["duplicates"] + report["simplify"]["duplicates"] == 1
+    assert report["linkedin"]["scraped"] + report["simplify"]["scraped"] == 3
+
+def test_orchestrator_dedupes_link_only_cards_after_detailing(card):
+    """Test that link-only cards are all detailed, then deduplicated on their scraped fields"""
+    class LinkOnlyScraper(FakeScraper):
+        def scrape_job(self, url):
+            self.scraped.append(url)
+            n = int(url.rsplit("/", 1)[1])
+            return card(self.source, n, "Acme", "Software Engineer", "Austin, TX" if n == 1 else "Denver, CO")
+
+    linkedin = FakeScraper("linkedin", [card("linkedin", 1, "Acme", "Software Engineer", "Austin, TX")])
+    jobright = LinkOnlyScraper("jobright", [
+        card("jobright", n, "Unknown Company", "", "Unknown Location") for n in (1, 2)
+    ])
+    orchestrator = ScrapeOrchestrator(
+        {"linkedin": factory(linkedin), "jobright": factory(jobright)}, requests_per_second=1000
+    )
+
+    jobs = list(orchestrator.run("Software", "United States"))
+
+    assert len(jobright.scraped) == 2
+    assert sorted(j.location for j in jobs) == ["Austin, TX", "Denver, CO"]
+    assert orchestrator.report()["linkedin"]["duplicates"] + orchestrator.report()["jobright"]["duplicates"] == 1
+
+def test_orchestrator_survives_failing_source(card):
+    """Test that one source raising does not stop the others"""
+    class BrokenScraper(FakeScraper):
+        def search_jobs(self, query, location, filters=None, limit=10):
+            raise RuntimeError("blocked")
+
+    good = FakeScraper("simplify", [card("simplify", 1, "Acme", "Software Engineer", "Austin, TX")])
+    orchestrator = ScrapeOrchestrator(
+        {"linkedin": factory(BrokenScraper("linkedin", [])), "simplify": factory(good)},
+        requests_per_second=1000
+    )
+
+    assert [j.url for j in orchestrator.run("Software", "US")] == [good.cards[0].url]
+    assert orchestrator.report()["linkedin"]["errors"] == 1
+
+def test_orchestrator_reuses_saved_search(card):
+    """Test that saved cards replace a source's search and fresh searches are reported"""
+    saved = [card("simplify", 7, "Initech", "Backend Engineer", "Boston, MA")]
+    class NoSearchScraper(FakeScraper):
+        def search_jobs(self, query, location, filters=None, limit=10):
+            raise AssertionError("searched again")
+
+    linkedin = FakeScraper("linkedin", [card("linkedin", 1, "Acme", "Software Engineer", "Austin, TX")])
+    simplify = NoSearchScraper("simplify", saved)
+    searched = {}
+    orchestrator = ScrapeOrchestrator(
+        {"linkedin": factory(linkedin), "simplify": factory(simplify)}, requests_per_second=1000,
+        saved_search={"simplify": saved}.get, on_search=lambda cards, source: searched.update({source: cards})
+    )
+
+    jobs = list(orchestrator.run("Software", "United States"))
+
+    assert sorted(j.url for j in jobs) == [linkedin.cards[0].url, saved[0].url]
+    assert list(searched) == ["linkedin"]
+
+def test_concurrent_mode_falls_back_without_scrape_job_async(card):
+    """Test that scrapers without an async scrape are detailed one at a time in concurrent mode"""
+    scraper = FakeScraper("simplify", [
+        card("simplify", 1, "Acme", "Software Engineer", "Austin, TX"),
+        card("simplify", 2, "Initech", "Backend Engineer", "Boston, MA"),
+    ])
+    orchestrator = ScrapeOrchestrator({"simplify": factory(scraper)}, requests_per_second=1000, concurrency=4)
+
+    jobs = list(orchestrator.run("Software", "United States"))
+
+    assert not scraper.supports_concurrency
+    assert scraper.scraped == [card.url for card in scraper.cards]
+    assert [j.description for j in jobs] == [f"details of {card.url}" for card in scraper.cards]
@@ -0,0 +1,22 @@
+import random
+from app.otpm.engine import OTPMEngine
+from benchmarks.otpm_batch import random_jobs, random_resumes
+
+def test_score_batch_matches_scalar_path():
+    """Test that batch scores equal calculate_probability exactly"""
+    rng = random.Random(7)
+    engine = OTPMEngine()
+    jobs = random_jobs(rng, 300)
+    resumes = random_resumes(rng, 12)
+
+    matrix = engine.score_batch(jobs, resumes)
+
+    assert matrix.shape == (300, 12)
+    for i, job in enumerate(jobs):
+        for r, resume in enumerate(resumes):
+            assert matrix[i, r] == engine.calculate_probability(job, resume)
+
+def test_score_batch_empty_inputs():
+    """Test that empty inputs produce an empty matrix"""
+    engine = OTPMEngine()
+    assert engine.score_batch([], random_resumes(random.Random(1), 2)).shape == (0, 2)
@@ -0,0 +1,81 @@
+from app.scraping.page_pool import PagePool, ScrapeMetrics, should_block
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+        self.closed = False
+
+    def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+    def close(self):
+        self.closed = True
+
+def test_should_block_resource_types_and_trackers():
+    """Test that heavy resources and tracker hosts are blocked but documents are not"""
+    assert should_block("image", "https://media.licdn.com/logo.png")
+    assert should_block("script", "https://www.googletagmanager.com/gtm.js")
+    assert not should_block("document", "https://www.linkedin.com/jobs/view/1")
+    assert not should_block("script", "https://static.licdn.com/app.js")
+
+def test_page_pool_reuses_and_recycles_pages():
+    """Test that released pages are reused until they hit page_max_uses"""
+    pool = PagePool(FakeContext, page_max_uses=2)
+
+    first = pool.acquire()
+    pool.release(first)
+    assert pool.acquire() is first
+    pool.release(first)
+
+    assert first.is_closed()
+    second = pool.acquire()
+    assert second is not first
+    assert pool.metrics.pages_created == 2
+    assert pool.metrics.pages_recycled == 1
+
+def test_page_pool_recycles_context():
+    """Test that the context is replaced after context_max_pages pages"""
+    contexts = []
+
+    def new_context():
+        contexts.append(FakeContext())
+        return contexts[-1]
+
+    pool = PagePool(new_context, page_max_uses=1, context_max_pages=2)
+    for _ in range(3):
+        pool.release(pool.acquire())
+
+    assert len(contexts) == 2
+    assert contexts[0].closed
+    assert pool.metrics.contexts_recycled == 1
+
+def test_scrape_metrics_summary():
+    """Test that load times and response sizes are summarized per page"""
+    class Response:
+        def __init__(self, length):
+            self.headers = {"content-length": str(length)}
+
+    metrics = ScrapeMetrics()
+    metrics.record_page_load(1.0)
+    metrics.record_page_load(3.0)
+    metrics.on_response(Response(2048))
+    metrics.on_response(Response(2048))
+    metrics.record_request(blocked=True)
+
+    summary = metrics.summary()
+    assert summary["pages_loaded"] == 2
+    assert summary["avg_load_seconds"] == 2.0
+    assert summary["avg_bytes_per_page"] == 2048
+    assert summary["requests_blocked"] == 1
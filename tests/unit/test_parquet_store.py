@@ -0,0 +1,40 @@
+from datetime import datetime, timezone
+import pytest
+from app.models.normalized_job import NormalizedJob
+from app.storage.parquet_store import ParquetAppender, ParquetJobStore
+
+pytest.importorskip("pyarrow")
+
+def test_parquet_store_partitions_and_pushdown(tmp_path, make_job):
+    """Test that rows land in source/date partitions and filters are applied"""
+    store = ParquetJobStore(str(tmp_path / "store"))
+    jobs = [make_job(i, description="Python") for i in range(6)] + [make_job(6, description="Python", source="simplify")]
+    normalized = [
+        NormalizedJob(job_id=j.id, required_skills=["python"], experience_years=float(i),
+                      visa_sponsorship="LIKELY" if i % 2 == 0 else "UNCLEAR")
+        for i, j in enumerate(jobs)
+    ]
+    scraped_at = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+    assert store.append(jobs, normalized, [0.5] * 7, ["APPLY"] * 7, scraped_at=scraped_at) == 7
+    assert (tmp_path / "store" / "source=simplify" / "scrape_date=2026-10-01").is_dir()
+
+    table = store.read([("visa_sponsorship", "==", "LIKELY"), ("experience_years", "<=", 2)])
+    assert sorted(table.column("job_id").to_pylist()) == [jobs[0].id, jobs[2].id]
+
+    table = store.read([("source", "==", "simplify")], columns=["job_id", "required_skills"])
+    assert table.to_pylist() == [{"job_id": jobs[6].id, "required_skills": ["python"]}]
+
+def test_parquet_appender_batches_rows(tmp_path, make_job):
+    """Test that the appender flushes in batches and on close"""
+    store = ParquetJobStore(str(tmp_path / "store"))
+    with ParquetAppender(store, flush_rows=2) as appender:
+        for i in range(5):
+            appender.write(make_job(i, description="Python"))
+
+    assert store.read().num_rows == 5
+    assert len(list((tmp_path / "store").rglob("*.parquet"))) == 3
+
+def test_parquet_store_read_empty(tmp_path):
+    """Test that reading a store with no data returns an empty table"""
+    assert ParquetJobStore(str(tmp_path / "missing")).read().num_rows == 0
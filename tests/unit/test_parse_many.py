@@ -0,0 +1,35 @@
+import pytest
+from app.normalization import job_parser
+from app.normalization.job_parser import JobParser
+
+DESCRIPTIONS = [
+    "Python and AWS, 2+ years. Visa sponsorship available.",
+    "Java, Kafka and SQL. Minimum of five years. US citizen only.",
+    "React and TypeScript, 1-3 years of experience.",
+    "No requirements listed.",
+]
+
+@pytest.fixture
+def make_jobs(make_job):
+    def make(n: int):
+        return [make_job(i, title="Engineer", description=DESCRIPTIONS[i % len(DESCRIPTIONS)]) for i in range(n)]
+    return make
+
+def test_parse_many_matches_parse_in_order(monkeypatch, make_jobs):
+    """Test that the process pool returns the same results as parse(), in input order"""
+    monkeypatch.setattr(job_parser, "PARALLEL_MIN_JOBS", 1)
+    parser = JobParser()
+    jobs = make_jobs(50)
+
+    parallel = parser.parse_many(jobs, workers=2, chunk_size=7)
+
+    assert [n.to_model() for n in parallel] == [parser.parse(job) for job in jobs]
+
+def test_parse_many_small_batches_stay_serial(monkeypatch, make_jobs):
+    """Test that batches under the threshold never start a process pool"""
+    def fail(*args, **kwargs):
+        raise AssertionError("process pool started")
+    monkeypatch.setattr(job_parser, "ProcessPoolExecutor", fail)
+
+    jobs = make_jobs(10)
+    assert len(JobParser().parse_many(jobs, workers=4)) == 10
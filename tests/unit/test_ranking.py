@@ -0,0 +1,68 @@
+import random
+from datetime import datetime, timedelta, timezone
+import pytest
+from app.models.job import Job
+from app.models.normalized_job import NormalizedJob
+from app.models.records import NormalizedJobRecord
+from app.models.resume import NormalizedResume
+from app.otpm.engine import OTPMEngine
+from app.recommendation.ranking import RankingIndex
+
+SKILLS = ["python", "java", "sql", "aws", "docker", "react", "go", "kafka", "rust", "spark"]
+NOW = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+def brute_force(engine, jobs, dates, resume, k, since=None):
+    scored = [
+        (-engine.calculate_probability(job, resume), -(dates[i].timestamp() if dates[i] else float("-inf")), i)
+        for i, job in enumerate(jobs)
+        if since is None or (dates[i] and dates[i] >= since)
+    ]
+    return [(jobs[i].job_id, -score) for score, _, i in sorted(scored)[:k]]
+
+def test_top_k_matches_brute_force():
+    """Test that top_k returns exactly the best scored jobs, ties newest first"""
+    rng = random.Random(11)
+    engine = OTPMEngine()
+    jobs = [
+        NormalizedJobRecord.from_skills(
+            f"job-{i}", rng.sample(SKILLS, rng.choice([0, 1, 2, 3, 5, 8])),
+            rng.choice([0.0, 1.0, 2.0, 3.0, 5.0, 8.0]), rng.choice(["LIKELY", "UNLIKELY", "UNCLEAR"])
+        )
+        for i in range(2000)
+    ]
+    dates = [NOW - timedelta(days=rng.randint(0, 60)) if rng.random() > 0.1 else None for _ in jobs]
+    index = RankingIndex(engine)
+    index.add_all(jobs, dates)
+
+    for _ in range(20):
+        resume = NormalizedResume(
+            skills=rng.sample(SKILLS + ["haskell"], rng.randint(0, 6)),
+            years_of_experience=rng.choice([0.0, 1.0, 2.5, 4.0]),
+            visa_status=rng.choice(["Visa Required", "US Citizen"])
+        )
+        k = rng.choice([1, 10, 50, 500])
+        since = rng.choice([None, NOW - timedelta(days=30)])
+
+        ranked = [(job.job_id, score) for job, score in index.top_k(resume, k, since)]
+
+        assert ranked == brute_force(engine, jobs, dates, resume, k, since)
+
+def test_top_k_from_store_keeps_latest_scrape(tmp_path):
+    """Test that a store-backed index uses each job's latest normalization"""
+    pytest.importorskip("pyarrow")
+    from app.storage.parquet_store import ParquetJobStore
+
+    store = ParquetJobStore(str(tmp_path / "store"))
+    job = Job(id="https://example.com/1", title="Engineer", company="Test Corp", location="Remote",
+              description="Python", url="https://example.com/1", source="linkedin")
+    older = NormalizedJob(job_id=job.id, required_skills=["java"], experience_years=8.0)
+    newer = NormalizedJob(job_id=job.id, required_skills=["python"], experience_years=0.0)
+    store.append([job], [older], scraped_at=NOW - timedelta(days=3))
+    store.append([job], [newer], scraped_at=NOW)
+
+    index = RankingIndex.from_store(store)
+    ranked = index.top_k(NormalizedResume(skills=["python"], years_of_experience=1.0), k=5)
+
+    assert len(index) == 1
+    assert [(j.required_skills, s) for j, s in ranked] == [(["python"], 1.0)]
+    assert RankingIndex.from_store(store, since=NOW + timedelta(days=1)).top_k(NormalizedResume()) == []
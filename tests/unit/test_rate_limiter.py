@@ -0,0 +1,71 @@
+import pytest
+from app.scraping.rate_limiter import AdaptiveRateController, HostRateLimiter, TokenBucket, retry_after
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_token_bucket_spaces_requests():
+    """Test that requests beyond the burst wait 1/rate apart"""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, burst=1, clock=clock)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.5
+    assert bucket.reserve() == 1.0
+
+def test_token_bucket_refills_over_time():
+    """Test that idle time refills tokens up to the burst size"""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, burst=2, clock=clock)
+    bucket.reserve()
+    bucket.reserve()
+
+    clock.now = 10.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 1.0
+
+def test_host_rate_limiter_buckets_per_host():
+    """Test that each host gets its own budget"""
+    limiter = HostRateLimiter(requests_per_second=1.0)
+
+    linkedin = limiter.bucket_for("https://www.linkedin.com/jobs/view/1")
+    assert limiter.bucket_for("https://www.linkedin.com/jobs/view/2") is linkedin
+    assert limiter.bucket_for("https://simplify.jobs/p/1") is not linkedin
+
+def test_adaptive_controller_aimd_and_exponential_cooldown():
+    """Test that successes add to the rate, throttles halve it and pause for a doubling cooldown"""
+    clock = FakeClock()
+    controller = AdaptiveRateController(rate=1.0, clock=clock, backoff=2.0)
+    assert controller.reserve() == 0.0
+
+    controller.record_success()
+    controller.record_success()
+    assert controller.rate == pytest.approx(1.2)
+
+    clock.now = 10.0
+    assert controller.record_throttle() == 2.0
+    assert controller.rate == pytest.approx(0.6)
+    assert controller.reserve() == pytest.approx(2.0 + 1 / 0.6)
+
+    assert controller.record_throttle() == 4.0
+    assert controller.rate == pytest.approx(0.3)
+
+    controller.record_success()
+    assert controller.consecutive_throttles == 0
+    for _ in range(100):
+        controller.record_success()
+    assert controller.rate == 4.0
+
+def test_retry_after_extends_the_cooldown():
+    """Test that a server's Retry-After wins over a shorter backoff, in seconds or as a date"""
+    controller = AdaptiveRateController(rate=1.0, clock=FakeClock(), backoff=2.0)
+
+    assert controller.record_throttle(retry_after({"retry-after": "30"})) == 30.0
+    assert controller.record_throttle(retry_after({})) == 4.0
+    assert retry_after({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0
+    assert retry_after({"retry-after": "soon"}) is None
@@ -0,0 +1,31 @@
+import json
+from app.models.normalized_job import NormalizedJob
+from app.models.records import JobRecord, NormalizedJobRecord
+
+def test_job_record_round_trips_through_jsonl(make_job):
+    """Test that a JobRecord read from a model's JSON converts back to the same Job"""
+    job = make_job(title="Engineer", description="Python", posted_date="2026-01-02T03:04:05",
+                   raw_data={"posted_text": "1 day ago"})
+    record = JobRecord.from_dict(json.loads(job.model_dump_json()))
+
+    assert record == JobRecord.from_model(job)
+    assert record.to_model() == job
+
+def test_normalized_record_matches_model_dump():
+    """Test that records serialize like NormalizedJob and keep keywords as the skills"""
+    n_job = NormalizedJob(job_id="1", required_skills=["aws", "python"], experience_years=2.0,
+                          visa_sponsorship="LIKELY", keywords=["aws", "python"])
+    record = NormalizedJobRecord.from_model(n_job)
+
+    assert record.to_dict() == n_job.model_dump()
+    assert record.keywords == ["aws", "python"]
+    assert record.to_model() == n_job
+
+def test_records_do_not_share_raw_data():
+    """Test that the raw_data default is a fresh dict per object"""
+    first = JobRecord("1", "t", "c", "l", "d", "u", "s")
+    second = JobRecord("2", "t", "c", "l", "d", "u", "s")
+    first.raw_data["duplicate_of"] = "0"
+
+    assert second.raw_data == {}
+    assert not hasattr(first, "__dict__")
@@ -0,0 +1,49 @@
+import sqlite3
+import pytest
+from app.extraction.pdf_utils import PdfUtils
+from app.normalization.resume_parser import ResumeParser
+from app.storage.resume_cache import ResumeCache
+
+SAMPLE = "resumes/Res_1.pdf"
+
+def test_pdf_backends_extract_same_skills():
+    """Test that every installed backend yields the same skills for the sample"""
+    skills = {
+        backend: ResumeParser(pdf_backend=backend).parse_file(SAMPLE).skills
+        for backend in PdfUtils.available_backends()
+    }
+    assert len(set(map(tuple, skills.values()))) == 1
+
+def test_resume_cache_reuses_text_and_parse(tmp_path):
+    """Test that a second parse of the same file is served from the cache"""
+    cache = ResumeCache(str(tmp_path / "cache.db"))
+    first = ResumeParser(cache=cache).parse_file(SAMPLE)
+    second = ResumeParser(cache=cache).parse_file(SAMPLE)
+
+    assert first == second
+    assert cache.hits == 2
+
+def test_resume_cache_keys_on_user_inputs(tmp_path):
+    """Test that overrides are part of the cache key"""
+    cache = ResumeCache(str(tmp_path / "cache.db"))
+    parser = ResumeParser(cache=cache)
+
+    base = parser.parse_file(SAMPLE)
+    override = parser.parse_file(SAMPLE, {"years_of_experience": 3, "visa_status": "Visa Required"})
+
+    assert override.years_of_experience == 3.0
+    assert override.visa_status == "Visa Required"
+    assert base.visa_status == "US Citizen"
+
+def test_unknown_pdf_backend_is_rejected():
+    """Test that an unknown backend name raises a ValueError naming the valid ones"""
+    with pytest.raises(ValueError, match="pypdf"):
+        PdfUtils.extract_text(SAMPLE, backend="pdfminer")
+
+def test_resume_cache_keys_text_on_resolved_backend(tmp_path):
+    """Test that "auto" caches extracted text under the backend that actually ran"""
+    path = str(tmp_path / "cache.db")
+    ResumeParser(cache=ResumeCache(path)).parse_file(SAMPLE)
+
+    backends = [row[0] for row in sqlite3.connect(path).execute("SELECT backend FROM resume_text")]
+    assert backends == [PdfUtils.resolve_backend("auto")]
@@ -0,0 +1,37 @@
+from app.models.job import Job
+from app.normalization.job_parser import JobParser
+from app.normalization.signal_extractor import SignalExtractor
+
+def extract(text: str):
+    return SignalExtractor.for_keywords(JobParser.VISA_KEYWORDS_POSITIVE, JobParser.VISA_KEYWORDS_NEGATIVE).extract(text)
+
+def test_experience_legacy_priority():
+    """Test that a stated minimum beats an earlier range or bare count"""
+    assert extract("2 years in the team. requirements: 5+ years").experience_years == 5.0
+    assert extract("teams of 3 years... 2 to 4 years required").experience_years == 2.0
+    assert extract("2024 years and 25 years").experience_years == 0.0
+
+def test_experience_new_forms():
+    """Test en dash ranges, spelled-out minimums and experience context"""
+    assert extract("we need 3–5 years of experience").experience_years == 3.0
+    assert extract("a minimum of two (2) years of professional experience").experience_years == 2.0
+    assert extract("at least three years with python").experience_years == 3.0
+    assert extract("4 or more yrs").experience_years == 4.0
+    assert extract("founded 15 years ago. 3 years of relevant experience").experience_years == 3.0
+    assert extract("0-2 years of experience; founded 15 years ago").experience_years == 0.0
+
+def test_visa_signals():
+    """Test that negative keywords win and keywords must start a word"""
+    assert extract("we offer visa sponsorship").visa_sponsorship == "LIKELY"
+    assert extract("h1b welcome, but you must be a us citizen").visa_sponsorship == "UNLIKELY"
+    assert extract("no sponsorship available").visa_sponsorship == "UNLIKELY"
+    assert extract("thus citizens of the web").visa_sponsorship == "UNCLEAR"
+
+def test_job_parser_uses_single_pass_signals():
+    """Test that parse() reports both signals from the description"""
+    job = Job(id="1", title="SRE", company="Acme", location="Remote", url="https://example.com/1",
+              source="test", description="Minimum of five years of SRE experience. Green card holders only.")
+    normalized = JobParser().parse(job)
+
+    assert normalized.experience_years == 5.0
+    assert normalized.visa_sponsorship == "UNLIKELY"
@@ -0,0 +1,33 @@
+from app.normalization.job_parser import JobParser
+from app.normalization.skill_matcher import SkillMatcher
+
+def test_skill_matcher_word_boundaries():
+    """Test that plain words only match as whole words"""
+    matcher = SkillMatcher({"java", "git", "sql", "go"})
+
+    assert matcher.find("javascript, github and nosql") == []
+    assert matcher.find("java, git and sql (go)") == ["git", "go", "java", "sql"]
+
+def test_skill_matcher_punctuation_terms():
+    """Test the punctuation cases handled by the legacy loop"""
+    matcher = SkillMatcher({"c++", "node.js", "ci/cd", ".net"})
+
+    text = "experience with c++17, node.js services, ci/cd pipelines and asp.net"
+    assert matcher.find(text) == [".net", "c++", "ci/cd", "node.js"]
+
+def test_skill_matcher_prefers_longest_term():
+    """Test that overlapping terms resolve to the longest match"""
+    matcher = SkillMatcher({"go", "golang"})
+
+    assert matcher.find("golang") == ["golang"]
+    assert matcher.find("go, golang") == ["go", "golang"]
+
+def test_skill_matcher_aliases():
+    """Test that aliases are reported under their canonical name"""
+    matcher = SkillMatcher({"kubernetes", "postgresql"}, {"k8s": "kubernetes", "postgres": "postgresql"})
+
+    assert matcher.find("k8s and postgres") == ["kubernetes", "postgresql"]
+
+def test_skill_matcher_shared_per_vocabulary():
+    """Test that parsers reuse the compiled matcher"""
+    assert JobParser().skill_matcher is JobParser().skill_matcher
@@ -0,0 +1,35 @@
+from app.normalization.skill_vocabulary import SkillVocabulary
+from app.storage.export_rows import AnalysisCounters
+
+def test_vocabulary_ids_and_masks():
+    """Test that ids are stable and masks decode to sorted names"""
+    vocabulary = SkillVocabulary(["python", "aws"])
+
+    assert vocabulary.id("python") == 0 and vocabulary.id("aws") == 1
+    mask = vocabulary.mask(["python", "sql", "aws", "python"])
+    assert vocabulary.id("sql") == 2
+    assert mask.bit_count() == 3
+    assert vocabulary.names(mask) == ["aws", "python", "sql"]
+    assert (mask & vocabulary.mask(["aws", "go"])).bit_count() == 1
+
+def test_vocabulary_arrays_span_several_words():
+    """Test that array counts match per-skill counts beyond 64 skills"""
+    vocabulary = SkillVocabulary(f"skill{i}" for i in range(150))
+    masks = [vocabulary.mask(["skill0", "skill70", "skill149"]), vocabulary.mask(["skill70"]), 0]
+
+    assert vocabulary.to_array(masks).shape == (3, 3)
+    counts = vocabulary.counts(masks)
+    assert counts[0] == 1 and counts[70] == 2 and counts[149] == 1
+    assert counts.sum() == 4
+
+def test_analysis_counters_top_skills():
+    """Test that skill frequencies are counted from bitsets across flushes"""
+    vocabulary = SkillVocabulary.shared()
+    counters = AnalysisCounters()
+    counters.BATCH = 2
+    for skills in (["python", "aws"], ["python"], ["sql", "python"], []):
+        counters.add("Fresh", 0.5, "APPLY", vocabulary.mask(skills))
+
+    top = dict(counters.top_skills(5))
+    assert top["python"] == 3 and top["aws"] == 1 and top["sql"] == 1
+    assert counters.rows()[0]["Value"] == 4
@@ -0,0 +1,80 @@
+import time
+from app import metrics
+from app.pipeline.staged import Stage, StagedPipeline
+
+def test_staged_pipeline_runs_items_through_stages():
+    """Test that items flow through every stage in order with one worker each"""
+    out = []
+    pipeline = StagedPipeline([
+        Stage("double", lambda x: x * 2),
+        Stage("drop_odd_tens", lambda x: None if x % 20 == 10 else x),
+        Stage("collect", out.append),
+    ])
+
+    report = pipeline.run(range(10))
+
+    assert out == [0, 2, 4, 6, 8, 12, 14, 16, 18]
+    assert report["source"]["processed"] == 10
+    assert report["double"]["processed"] == 10
+    assert report["collect"]["processed"] == 9
+
+def test_staged_pipeline_backpressure_bounds_queues():
+    """Test that a slow stage never lets its input queue exceed the bound"""
+    out = []
+
+    def slow(x):
+        time.sleep(0.005)
+        out.append(x)
+
+    pipeline = StagedPipeline([Stage("fast", lambda x: x, queue_size=2), Stage("slow", slow, queue_size=3)])
+    report = pipeline.run(range(30))
+
+    assert len(out) == 30
+    assert report["slow"]["max_queue_depth"] <= 3
+    assert pipeline.first_output_seconds is not None
+
+def test_staged_pipeline_counts_errors_and_continues():
+    """Test that a failing item is recorded with its error and the rest keep flowing"""
+    metrics.reset()
+    out = []
+    pipeline = StagedPipeline([Stage("invert", lambda x: 1 / x), Stage("collect", out.append)])
+
+    report = pipeline.run([1, 0, 2])
+
+    assert out == [1.0, 0.5]
+    assert report["invert"]["errors"] == 1
+    assert pipeline.failures == [("invert", 0, "ZeroDivisionError: division by zero")]
+    assert metrics.registry().summary()["counters"]["pipeline_failures{stage=invert}"] == 1
+
+def test_staged_pipeline_multiple_workers():
+    """Test that parallel workers process every item exactly once"""
+    out = []
+    pipeline = StagedPipeline([Stage("square", lambda x: x * x, workers=4), Stage("collect", out.append)])
+
+    pipeline.run(range(50))
+
+    assert sorted(out) == sorted(x * x for x in range(50))
+
+def test_staged_pipeline_micro_batches():
+    """Test that a batched stage gets bounded lists, cut early when the source is slow"""
+    batches, out = [], []
+
+    def double_all(batch):
+        batches.append(len(batch))
+        return [None if x == 3 else x * 2 for x in batch]
+
+    def slow_source():
+        yield from range(10)
+        time.sleep(0.2)
+        yield 10
+
+    pipeline = StagedPipeline([
+        Stage("double", double_all, batch_size=4, max_wait=0.05),
+        Stage("collect", out.append),
+    ])
+    report = pipeline.run(slow_source())
+
+    assert sorted(out) == [x * 2 for x in range(11) if x != 3]
+    assert max(batches) <= 4 and sum(batches) == 11
+    assert batches[-1] == 1  # the late item did not wait for a full batch
+    assert report["double"]["processed"] == 11
@@ -0,0 +1,52 @@
+import csv
+import pandas as pd
+from app.models.job import Job
+from app.models.normalized_job import NormalizedJob
+from app.storage.excel_exporter import ExcelExporter
+from app.storage.streaming_exporter import StreamingCsvExporter, StreamingExcelExporter
+
+def make_rows(n: int):
+    jobs, normalized = [], []
+    for i in range(n):
+        url = f"https://example.com/{i}"
+        posted = "Reposted 1 day ago" if i % 3 == 0 else "2 hours ago"
+        jobs.append(Job(id=url, title=f"Engineer {i}", company="Test Corp", location="Remote",
+                        description="", url=url, source="linkedin", raw_data={"posted_text": posted}))
+        skills = ["python", "sql"][: i % 3]
+        normalized.append(NormalizedJob(job_id=url, required_skills=skills, keywords=skills,
+                                        experience_years=float(i % 4)))
+    scores = [i / n for i in range(n)]
+    recs = ["STRONG APPLY" if s >= 0.8 else "APPLY" if s >= 0.6 else "SKIP" for s in scores]
+    return jobs, normalized, scores, recs
+
+def test_streaming_csv_rows_visible_before_close(tmp_path):
+    """Test that each row is on disk as soon as it is written"""
+    filename = str(tmp_path / "jobs.csv")
+    jobs, normalized, scores, recs = make_rows(3)
+
+    exporter = StreamingCsvExporter(filename)
+    exporter.write(jobs[0], normalized[0], scores[0], recs[0])
+    exporter.write(jobs[1], normalized[1], scores[1], recs[1])
+
+    with open(filename, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert len(rows) == 3
+    assert rows[1][3] == "Repost"
+    exporter.close()
+
+def test_streaming_excel_matches_batch_export(tmp_path):
+    """Test that the streaming workbook has the same sheets as ExcelExporter"""
+    jobs, normalized, scores, recs = make_rows(20)
+    batch_file = str(tmp_path / "batch.xlsx")
+    stream_file = str(tmp_path / "stream.xlsx")
+
+    ExcelExporter.export(normalized, jobs, scores, recs, batch_file)
+    with StreamingExcelExporter(stream_file) as exporter:
+        for row in zip(jobs, normalized, scores, recs):
+            exporter.write(*row)
+
+    batch = pd.read_excel(batch_file, sheet_name=None)
+    stream = pd.read_excel(stream_file, sheet_name=None)
+    assert list(batch) == list(stream) == ["Jobs", "Analysis"]
+    for sheet in batch:
+        assert batch[sheet].equals(stream[sheet])
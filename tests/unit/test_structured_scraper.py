@@ -0,0 +1,67 @@
+import json
+import httpx
+from app.scraping.jobright import JobrightScraper
+from app.scraping.simplify import SimplifyScraper
+from app.scraping.structured import parse_job_posting
+
+def _page(script: str) -> str:
+    return f"<html><head>{script}</head><body><div id='root'></div></body></html>"
+
+def test_parse_job_posting_from_json_ld():
+    """Test that a schema.org JobPosting is read from JSON-LD"""
+    posting = {
+        "@context": "https://schema.org",
+        "@type": "JobPosting",
+        "title": "Software Engineer I",
+        "hiringOrganization": {"@type": "Organization", "name": "Acme"},
+        "jobLocation": [{"@type": "Place", "address": {"addressLocality": "Austin", "addressRegion": "TX"}}],
+        "description": "<p>Python and <b>AWS</b>. 0-2 years of experience.</p>",
+        "datePosted": "2026-10-01",
+    }
+    html = _page(f'<script type="application/ld+json">{json.dumps(posting)}</script>')
+    fields = parse_job_posting(html)
+
+    assert fields["title"] == "Software Engineer I"
+    assert fields["company"] == "Acme"
+    assert fields["location"] == "Austin, TX"
+
+    job = SimplifyScraper()._make_job("https://simplify.jobs/p/abc", fields)
+    assert job.source == "simplify"
+    assert "AWS" in job.description and "<b>" not in job.description
+    assert job.posted_date.year == 2026
+
+def test_search_page_records_from_next_data():
+    """Test that search results are read from __NEXT_DATA__ props"""
+    data = {"props": {"pageProps": {"jobs": [
+        {"jobId": "j1", "jobTitle": "New Grad SWE", "companyName": "Globex", "jobLocation": "Remote"},
+        {"jobId": "j2", "jobTitle": "Data Engineer", "companyName": "Initech", "jobLocation": "Boston, MA"},
+    ]}}}
+    html = _page(f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(data)}</script>')
+    records = JobrightScraper().parse_search_page(html)
+
+    assert [r["url"] for r in records] == [
+        "https://jobright.ai/jobs/info/j1", "https://jobright.ai/jobs/info/j2"
+    ]
+    assert records[1]["company"] == "Initech" and records[1]["location"] == "Boston, MA"
+
+def test_search_page_falls_back_to_links():
+    """Test that job links are used when the page has no __NEXT_DATA__"""
+    html = '<a href="/p/1111-aaaa?ref=x">One</a> <a href="https://simplify.jobs/p/2222-bbbb">Two</a>'
+    records = SimplifyScraper().parse_search_page(html)
+    assert [r["url"] for r in records] == ["https://simplify.jobs/p/1111-aaaa", "https://simplify.jobs/p/2222-bbbb"]
+
+def test_fetch_only_speeds_up_on_healthy_responses():
+    """Test that server errors do not raise the rate and a 503 backs it off"""
+    statuses = {"/p/ok": 200, "/p/broken": 500, "/p/forbidden": 403, "/p/busy": 503}
+
+    def handler(request):
+        return httpx.Response(statuses[request.url.path], text="<html></html>", headers={"Retry-After": "0"})
+
+    scraper = SimplifyScraper(client=httpx.Client(transport=httpx.MockTransport(handler)))
+    bucket = scraper.rate_limiter.bucket_for("https://simplify.jobs/")
+    for path in ("/p/ok", "/p/broken", "/p/forbidden"):
+        scraper._fetch(f"https://simplify.jobs{path}")
+    assert (bucket.successes, bucket.throttles) == (1, 0)
+
+    scraper._fetch("https://simplify.jobs/p/busy")
+    assert bucket.throttles == 1